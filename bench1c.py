@@ -0,0 +1,1059 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# bench1c.py
+#
+# benchmarks for the 1C front end: lexer, parser, preprocessor
+#
+#   python -m epfcomp.bench1c [startup] [tokens] [relex] [tokcache] [scanner] [strings] [frontend] [preproc]
+#                              [conditions] [parsing] [rdparser] [chains] [positions] [stream]
+#   python -m epfcomp.bench1c lexer|grammar [--modules <каталог выгрузки>]
+# ------------------------------------------------------------
+import argparse
+import contextlib
+import glob
+import io
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# каталог, из которого импортируется пакет epfcomp
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_isolated(code, repeat):
+    '''
+    Выполняет код в отдельных процессах python (холодный старт) и собирает выведенные им замеры.
+    @param code (str): код, печатающий время выполнения в секундах
+    @param repeat (int): количество запусков
+    @return (list): замеры времени для каждого запуска
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = PACKAGE_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    result = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                             stdout=subprocess.PIPE, universal_newlines=True).stdout
+        result.append(float(out.split()[-1]))
+    return result
+
+def measure(func, repeat):
+    '''
+    @return (list): время выполнения func() в секундах для каждого из repeat запусков
+    '''
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        result.append(time.perf_counter() - start)
+    return result
+
+def measure_peak_memory(func):
+    '''
+    @return (tuple): результат func() и пиковый объем памяти, выделенной при выполнении, в байтах
+    '''
+    tracemalloc.start()
+    try:
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+## test modules
+
+MODULE_FUNCTION_TEMPLATE = '''
+// Процедура номер {n}
+&НаСервере
+Функция Функция{n}(Знач Параметр, Список = Неопределено, Флаг = Истина) Экспорт
+    Результат = Новый Структура("Ключ, Значение", Параметр, {n});
+    Для Каждого Элемент Из Список Цикл
+        Если Элемент.Значение <> Неопределено И НЕ Флаг Или Элемент.Пометка Тогда
+            Результат.Вставить("Элемент" + Строка(Элемент.Номер), Элемент.Значение * 2 - 1);
+        ИначеЕсли Элемент.Номер % 2 = 0 Тогда
+            Продолжить;
+        Иначе
+            Прервать;
+        КонецЕсли;
+    КонецЦикла;
+    Для Индекс = 1 По {n} Цикл
+        Результат.Ключ = Результат.Ключ + Индекс / 3;
+    КонецЦикла;
+    Попытка
+        Текст = "Строка с ""кавычками""
+        |и переносом строки";
+        Дата = '20160707';
+    Исключение
+        ВызватьИсключение НСтр("ru = 'Ошибка'");
+    КонецПопытки;
+    Возврат ?(Флаг, Результат, Функция{m}(Параметр, Список, НЕ Флаг));
+КонецФункции
+'''
+
+def make_module(functions):
+    '''
+    Генерирует синтаксически корректный текст модуля 1С из functions однотипных функций.
+    @return (str): текст модуля
+    '''
+    return ''.join(MODULE_FUNCTION_TEMPLATE.format(n=n, m=(n + 1) % functions) for n in range(functions))
+
+def print_timings(title, rows):
+    print(title)
+    for name, timings in rows:
+        print('  %-40s min %8.2f ms   median %8.2f ms' % (name, min(timings) * 1000,
+                                                        statistics.median(timings) * 1000))
+
+## startup
+
+STARTUP_LEXER_CODE = '''
+import time
+start = time.perf_counter()
+from epfcomp import lexer1c
+lexer1c.LEXTAB_MODE_ON = {lextab}
+lexer1c.get_lexer()
+print(time.perf_counter() - start)
+'''
+
+STARTUP_PARSER_CODE = '''
+import time
+start = time.perf_counter()
+from epfcomp import parser1c
+parser1c.PARSETAB_MODE_ON = {parsetab}
+parser1c.get_parser()
+print(time.perf_counter() - start)
+'''
+
+def bench_startup(repeat=10):
+    '''
+    Сравнивает время холодного импорта лексера и синтаксического процессора и их построения при первом обращении
+    с загрузкой таблиц из lextab1c и parsetab1c и без неё.
+    '''
+    print_timings('Холодный старт лексера (импорт + построение):', [
+        ('lextab1c', run_isolated(STARTUP_LEXER_CODE.format(lextab=True), repeat)),
+        ('построение из правил', run_isolated(STARTUP_LEXER_CODE.format(lextab=False), repeat)),
+    ])
+    print_timings('Холодный старт синтаксического процессора (импорт + построение, с лексером из lextab1c):', [
+        ('parsetab1c', run_isolated(STARTUP_PARSER_CODE.format(parsetab=True), repeat)),
+        ('построение таблиц LALR из грамматики', run_isolated(STARTUP_PARSER_CODE.format(parsetab=False), repeat)),
+    ])
+
+## tokens
+
+def bench_tokens(functions=2000):
+    '''
+    Сравнивает память и время хранения токенов модуля списком объектов ply.lex.LexToken
+    и колоночным буфером lexer1c.TokenBuffer.
+    '''
+    from epfcomp import lexer1c
+    data = make_module(functions)
+    print('Хранение токенов модуля (%d строк):' % data.count('\n'))
+
+    def tokens_list():
+        lexer = lexer1c.new_lexer()
+        lexer.input(data)
+        return list(lexer)
+
+    token_list, list_peak = measure_peak_memory(tokens_list)
+    buffer, buffer_peak = measure_peak_memory(lambda: lexer1c.tokenize(data))
+    assert [(t.type, t.value, t.lineno, t.lexpos) for t in token_list] == \
+           [(t.type, t.value, t.lineno, t.lexpos) for t in buffer.reader()]
+    print('  токенов: %d, колонки буфера: %.1f KB, значений вне текста: %d' % (
+        len(buffer), buffer.nbytes() / 1024, len(buffer.values)))
+    print('  %-40s пик памяти %8.1f KB' % ('список LexToken', list_peak / 1024))
+    print('  %-40s пик памяти %8.1f KB' % ('TokenBuffer', buffer_peak / 1024))
+    print_timings('Время разбора в токены:', [
+        ('список LexToken', measure(tokens_list, 3)),
+        ('TokenBuffer', measure(lambda: lexer1c.tokenize(data), 3)),
+    ])
+
+## relex
+
+def same_tokens(first, second):
+    return (first.types == second.types and first.starts == second.starts and first.ends == second.ends
+            and first.lines == second.lines and first.values == second.values)
+
+def edit_lines(data, first_line, last_line, new_lines):
+    '''
+    Заменяет строки first_line..last_line (нумерация с 1) текста на new_lines.
+    @return (tuple): новый текст и диапазон измененных строк нового текста для lexer1c.relex()
+    '''
+    lines = data.split('\n')
+    lines[first_line - 1:last_line] = new_lines
+    return '\n'.join(lines), first_line, first_line + len(new_lines) - 1
+
+RELEX_EDITS = [
+    # (смещение строки в шаблоне функции, количество заменяемых строк, новые строки)
+    (6, 1, ['    Для Индекс = 1 По 2 Цикл КонецЦикла; // новый комментарий']),
+    (6, 1, ['    Для', '    Каждого Элемент Из Список Цикл']),
+    (19, 1, ['        Текст = "Строка без кавычек']),
+    (20, 1, ['        |и другим переносом', '        // комментарий внутри строки', '        |строки";']),
+    (20, 0, ['        |вставленная строка']),
+    (2, 25, []),
+    (4, 0, ['Процедура Вставленная()', 'КонецПроцедуры']),
+    (21, 1, ['        Дата = \'20161231\'; Сумма = 1.5 <= 2 <> Ложь;']),
+]
+
+def bench_relex(functions=2000):
+    '''
+    Проверяет совпадение lexer1c.relex() с полным разбором для типовых правок модуля
+    и сравнивает время полного и инкрементального лексического разбора при правке одной функции.
+    '''
+    from epfcomp import lexer1c
+    data = make_module(functions)
+    template_lines = MODULE_FUNCTION_TEMPLATE.count('\n')
+    prev = lexer1c.tokenize(data)
+    total_lines = data.count('\n') + 1
+
+    for function_index in (0, functions // 2, functions - 1):
+        for line, count, new_lines in RELEX_EDITS:
+            first_line = function_index * template_lines + line
+            new_data, edit_first, edit_last = edit_lines(data, first_line, first_line + count - 1, new_lines)
+            assert same_tokens(lexer1c.relex(prev, new_data, edit_first, edit_last), lexer1c.tokenize(new_data)), \
+                'relex: функция %d, строка %d' % (function_index, line)
+    for first_line, last_line in ((1, 1), (total_lines, total_lines)):
+        new_data, edit_first, edit_last = edit_lines(data, first_line, last_line, ['Перем А;'])
+        assert same_tokens(lexer1c.relex(prev, new_data, edit_first, edit_last), lexer1c.tokenize(new_data))
+
+    line = functions // 2 * template_lines + RELEX_EDITS[0][0]
+    new_data, edit_first, edit_last = edit_lines(data, line, line, RELEX_EDITS[0][2])
+    print_timings('Лексический разбор после правки одной строки (%d строк):' % total_lines, [
+        ('tokenize()', measure(lambda: lexer1c.tokenize(new_data), 3)),
+        ('relex()', measure(lambda: lexer1c.relex(prev, new_data, edit_first, edit_last), 3)),
+    ])
+
+## tokcache
+
+def bench_tokcache(functions=2000):
+    '''
+    Сравнивает время лексического разбора модуля и загрузки его токенов из tokcache1c.TokenCache.
+    Проверяет удаление записей прежних версий модуля и разбор без кеша, когда каталог кеша не создается.
+    '''
+    import tempfile
+    from epfcomp import lexer1c
+    from epfcomp import tokcache1c
+    data = make_module(functions)
+    module_name = 'ОбщийМодуль.Замер.Модуль.txt'
+    with tempfile.TemporaryDirectory() as folder:
+        cache = tokcache1c.TokenCache(folder)
+        assert cache.load(data, module_name) is None
+        assert same_tokens(cache.tokenize(data, module_name), lexer1c.tokenize(data))
+        assert same_tokens(cache.load(data, module_name), lexer1c.tokenize(data))
+        assert cache.load(data + ' ', module_name) is None
+        cache.tokenize(data + ' ', module_name)
+        assert cache.load(data, module_name) is None
+        assert len(os.listdir(cache.get_module_folder(module_name))) == 1
+        cache.tokenize(data, module_name)
+
+        # каталог кеша не создается: на месте родительского каталога - файл
+        open(os.path.join(folder, 'file'), 'w').close()
+        broken_cache = tokcache1c.TokenCache(os.path.join(folder, 'file', 'tokens'))
+        assert same_tokens(broken_cache.tokenize(data, module_name), lexer1c.tokenize(data))
+        assert not broken_cache.writable
+
+        print_timings('Получение токенов модуля (%d строк):' % data.count('\n'), [
+            ('tokenize()', measure(lambda: lexer1c.tokenize(data), 3)),
+            ('TokenCache.load()', measure(lambda: cache.load(data, module_name), 3)),
+        ])
+
+## scanner
+
+# Фрагменты с ошибками и граничными случаями лексического разбора
+SCANNER_EDGE_CASES = [
+    'А = "строка"\n|продолжение без открытой строки;',
+    'А = "строка\n   |с продолжением\n  // комментарий в строке\n\n  |и пустой строкой";',
+    'Б = """";В = """кавычки""";Г = "";',
+    'Для\n\n  Каждого Стр Из Т Цикл КонецЦикла; ДляКаждого; для каждого',
+    'Перейти ~Метка; ~Метка: А = \'20160707\' <= 1.5 <> 2 >= 3 ? [0] %',
+    'Функция Ф() ﻿ @ $ КонецФункции',
+    '#Если Сервер Тогда\n#ИначеЕсли Клиент Тогда\n#Иначе\n#КонецЕсли',
+    '#Область Неизвестная',
+    '#Удаление\nА = 1;\n#КонецУдаления',
+    'For Each Item In List Do EndDo; FOREACH; For EachRow = 1 To 2 Do EndDo; Для Каждого Стр In Т Do КонецЦикла;',
+    '#If Server Then\n#ElsIf Client Then\n#Else\n#EndIf\n#Region Public\n#EndRegion',
+    'А = "незакрытая',
+    'А = "незакрытая\n',
+    'А = "незакрытая ""',
+    '',
+    '// только комментарий',
+]
+
+def lexer_outcome(tokenize, data):
+    '''
+    @return (tuple): токены, текст, выведенный лексером, и исключение (тип и текст)
+    '''
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            buffer = tokenize(data)
+        except BaseException as e:
+            return None, out.getvalue(), (type(e).__name__, str(e))
+    return (bytes(buffer.types), bytes(buffer.starts), bytes(buffer.ends), bytes(buffer.lines), buffer.values), \
+           out.getvalue(), None
+
+def get_sample_texts():
+    '''
+    @return (list): тексты samples/*.1c как есть и после препроцессора в режимах управляемого и обычного приложения
+    '''
+    from epfcomp import preproc1c
+    from epfcomp import utils
+    result = []
+    for file_name in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'samples', '*.1c'))):
+        data = open(file_name, encoding='utf-8').read()
+        result.append(data)
+        text = preproc1c.Preprocessor1C(data).execute('ТонкийКлиент', [], ['НаКлиенте', 'Сервер'])
+        result.append(utils.add_semicolon_after_preproc(text))
+        result.append(preproc1c.Preprocessor1C(data).execute('ТолстыйКлиентОбычноеПриложение', []))
+    return result
+
+def bench_scanner(functions=2000):
+    '''
+    Проверяет совпадение потоков токенов scanner1c и лексера ply (токены, номера строк, сообщения об ошибках,
+    исключения) на samples/, граничных случаях и правках тестового модуля (tests1c.test_scanner_matches_ply());
+    сравнивает скорость разбора.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import scanner1c
+    from epfcomp import tests1c
+
+    def ply_tokenize(data):
+        return lexer1c.tokenize(data, lexer1c.new_lexer())
+
+    tests1c.test_scanner_matches_ply()
+    print('Совпадение потоков токенов scanner1c и ply: %d текстов' % len(tests1c.get_scanner_texts()))
+
+    data = make_module(functions)
+    tokens_count = len(scanner1c.tokenize(data))
+    megabytes = len(data.encode('utf-8')) / 1024 / 1024
+    print('Лексический разбор модуля (%d строк, %d токенов, %.1f MB):' % (data.count('\n'), tokens_count, megabytes))
+    for name, tokenize in (('ply', ply_tokenize), ('scanner1c', scanner1c.tokenize)):
+        elapsed = min(measure(lambda: tokenize(data), 3))
+        print('  %-40s %8.2f ms %12.0f токенов/с %8.2f MB/с' % (name, elapsed * 1000, tokens_count / elapsed,
+                                                                megabytes / elapsed))
+
+## strings
+
+def make_string_literal_module(size):
+    '''
+    Генерирует модуль с двумя строковыми литералами размером около size символов:
+    многострочным (текст запроса с продолжением "|" и комментариями) и однострочным с удвоенными кавычками.
+    @return (str): текст модуля
+    '''
+    query_lines = []
+    while sum(len(line) for line in query_lines) < size:
+        n = len(query_lines)
+        query_lines.append('    |ВЫБРАТЬ Таблица.Поле%d КАК ""Поле%d"" ИЗ Справочник.Таблица%d КАК Таблица' % (n, n, n))
+        if n % 50 == 0:
+            query_lines.append('    // комментарий внутри текста запроса')
+    html = '<div class=""item"">текст</div>' * (size // 30)
+    return 'Запрос.Текст = "\n' + '\n'.join(query_lines) + '";\nШаблон = "' + html + '";\n'
+
+def format_1c_str_by_char(origin_text, indent):
+    # посимвольное формирование литерала - для сравнения со strct1c.Strings.format_1c_str()
+    text = '"'
+    for ch in origin_text:
+        if ch == '"':
+            text += '""'
+        elif ch == '\n':
+            text += ch + indent + "|"
+        else:
+            text += ch
+    text += '"'
+    return text
+
+def bench_strings(size=100 * 1024):
+    '''
+    Замеры разбора и формирования текста строковых литералов размером около size символов.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import scanner1c
+    from epfcomp import strct1c
+    data = make_string_literal_module(size)
+    ply_buffer = lexer1c.tokenize(data, lexer1c.new_lexer())
+    assert same_tokens(ply_buffer, scanner1c.tokenize(data))
+    literals = [ply_buffer.value(index) for index in range(len(ply_buffer)) if ply_buffer.type(index) == 'STRING']
+    strings = strct1c.Strings(literals[0])
+    indent = strct1c.get_indent_spaces()
+    for literal in literals:
+        assert strings.format_1c_str(literal) == format_1c_str_by_char(literal, indent)
+
+    print_timings('Строковые литералы (%s символов):' % ', '.join(str(len(literal)) for literal in literals), [
+        ('лексер ply', measure(lambda: lexer1c.tokenize(data, lexer1c.new_lexer()), 3)),
+        ('scanner1c', measure(lambda: scanner1c.tokenize(data), 3)),
+        ('Strings.format_1c_str()', measure(lambda: [strings.format_1c_str(literal) for literal in literals], 3)),
+        ('посимвольное формирование', measure(lambda: [format_1c_str_by_char(literal, indent) for literal in literals], 3)),
+    ])
+
+## lexer
+
+def get_module_files(folders):
+    '''
+    @param folders (list): каталоги с выгруженными текстами модулей (*.txt, *.1c, с подкаталогами)
+    @return (list): файлы samples/*.1c и файлы модулей из каталогов
+    '''
+    result = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'samples', '*.1c')))
+    for folder in folders:
+        for root, _, file_names in sorted(os.walk(folder)):
+            result += [os.path.join(root, name) for name in sorted(file_names) if name.endswith(('.txt', '.1c'))]
+    return result
+
+def new_timed_lexer(rule_stats):
+    '''
+    Возвращает экземпляр лексера ply, функции-правила которого накапливают количество вызовов и время выполнения.
+    Время правила включает время вложенных правил (t_compstring читает литерал правилами состояния compstring).
+    @param rule_stats (dict): имя функции-правила -> [количество вызовов, время в секундах]
+    @return (ply.lex.Lexer): лексер
+    '''
+    import functools
+    from epfcomp import lexer1c
+
+    def timed(func):
+        stats = rule_stats.setdefault(func.__name__, [0, 0.0])
+
+        @functools.wraps(func)
+        def wrapper(t):
+            start = time.perf_counter()
+            try:
+                return func(t)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+        return wrapper
+
+    lexer = lexer1c.new_lexer()
+    # мастер-выражения экземпляры лексера разделяют - подменяются копии списков функций
+    lexer.lexstatere = {state: [(regex, [(timed(rule[0]), rule[1]) if rule and rule[0] else rule for rule in rules])
+                                for regex, rules in master]
+                        for state, master in lexer.lexstatere.items()}
+    lexer.lexstateerrorf = {state: timed(func) for state, func in lexer.lexstateerrorf.items()}
+    lexer.begin('INITIAL')
+    return lexer
+
+def bench_lexer(folders=()):
+    '''
+    Замеры лексического разбора файлов samples/*.1c и выгруженных модулей: скорость (токенов/с, MB/с)
+    и пиковая память для каждой реализации лексера, распределение токенов по типам,
+    количество вызовов и время функций-правил лексера ply.
+    @param folders (list): каталоги с выгруженными текстами модулей
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import scanner1c
+    backends = [
+        ('scanner1c', scanner1c.tokenize),
+        ('ply', lambda data: lexer1c.tokenize(data, lexer1c.new_lexer())),
+    ]
+    type_counts = {}
+    rule_stats = {}
+    ply_time = 0.0
+    total_tokens = 0
+    total_bytes = 0
+
+    print('Лексический разбор файлов модулей:')
+    for file_name in get_module_files(folders):
+        data = open(file_name, encoding='utf-8').read()
+        size = len(data.encode('utf-8'))
+        messages = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(messages):
+                buffer = lexer1c.tokenize(data)
+                lexer1c.tokenize(data, new_timed_lexer(rule_stats))
+        except BaseException as e:
+            print('  %-56s ошибка лексического разбора: %s %s' % (os.path.basename(file_name), type(e).__name__, e))
+            continue
+        errors = messages.getvalue().count('\n')
+        print('  %-56s %10.1f KB %10d токенов%s' % (os.path.basename(file_name), size / 1024, len(buffer),
+                                                     ', ошибок: %d' % errors if errors else ''))
+        for name, tokenize in backends:
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed = min(measure(lambda: tokenize(data), 3))
+                peak = measure_peak_memory(lambda: tokenize(data))[1]
+            if name == 'ply':
+                ply_time += elapsed
+            print('    %-12s %12.0f токенов/с %8.2f MB/с   пик памяти %10.1f KB' % (
+                name, len(buffer) / elapsed, size / 1024 / 1024 / elapsed, peak / 1024))
+        for code in buffer.types:
+            type_counts[code] = type_counts.get(code, 0) + 1
+        total_tokens += len(buffer)
+        total_bytes += size
+
+    if not total_tokens:
+        return
+    print('Токены по типам (всего %d токенов, %.1f KB):' % (total_tokens, total_bytes / 1024))
+    for code, count in sorted(type_counts.items(), key=lambda item: -item[1]):
+        print('  %-20s %10d %6.1f%%' % (lexer1c.TOKEN_TYPES[code], count, count * 100 / total_tokens))
+    # замер с подсчетом времени правил выполнялся один раз на файл, время разбора ply - минимальное из трех
+    print('Функции-правила лексера ply (время с учетом вложенных правил, доля от времени разбора ply):')
+    for name, (calls, elapsed) in sorted(rule_stats.items(), key=lambda item: -item[1][1]):
+        if calls:
+            print('  %-36s %10d вызовов %10.2f ms %6.1f%%' % (name, calls, elapsed * 1000, elapsed * 100 / ply_time))
+
+## frontend
+
+def make_preproc_module(functions):
+    '''
+    Генерирует модуль из functions функций, размеченных областями и инструкциями препроцессора.
+    @return (str): текст модуля
+    '''
+    parts = []
+    for n in range(functions):
+        function = MODULE_FUNCTION_TEMPLATE.format(n=n, m=(n + 1) % functions)
+        if n % 3 == 1:
+            function = '#Если Сервер Тогда' + function + '#Иначе\nПроцедура Заглушка%d()\nКонецПроцедуры\n#КонецЕсли\n' % n
+        elif n % 3 == 2:
+            function = '#Если НЕ ВебКлиент И (ТонкийКлиент ИЛИ ТолстыйКлиентОбычноеПриложение) Тогда' + function + '#КонецЕсли\n'
+        parts.append('#Область %s\n%s#КонецОбласти\n' % ('DEBUG' if n % 10 == 0 else 'Функция%d' % n, function))
+    return ''.join(parts)
+
+# Контексты исполнения, в которых обрабатываются модули: режим, удаляемые области, сохраняемые символы препроцессора
+FRONTEND_MODES = [
+    ('ТонкийКлиент', ['DEBUG'], ['НаКлиенте', 'Сервер']),
+    ('ТолстыйКлиентОбычноеПриложение', ['DEBUG'], []),
+]
+
+def preproc_tokenize(data, mode, areas_to_delete, symbols_to_retain):
+    # построчная обработка текста (preproc1c) и лексический разбор результата
+    from epfcomp import lexer1c
+    from epfcomp import preproc1c
+    from epfcomp import utils
+    text = preproc1c.Preprocessor1C(data).execute(mode, areas_to_delete, symbols_to_retain)
+    if symbols_to_retain:
+        text = utils.add_semicolon_after_preproc(text)
+    return lexer1c.tokenize(text)
+
+def bench_frontend(functions=2000):
+    '''
+    Проверяет совпадение потока токенов frontend1c с построчной обработкой текста preproc1c и последующим
+    лексическим разбором; сравнивает время получения токенов модуля для всех контекстов исполнения.
+    '''
+    from epfcomp import frontend1c
+    from epfcomp import lexer1c
+
+    def token_values(buffer):
+        return [(buffer.type(index), buffer.value(index)) for index in range(len(buffer))]
+
+    data = make_preproc_module(functions)
+    for mode, areas_to_delete, symbols_to_retain in FRONTEND_MODES:
+        assert token_values(frontend1c.tokenize(data, mode, areas_to_delete, symbols_to_retain)) == \
+               token_values(preproc_tokenize(data, mode, areas_to_delete, symbols_to_retain)), 'frontend1c: ' + mode
+
+    def preproc_all_modes():
+        return [preproc_tokenize(data, *params) for params in FRONTEND_MODES]
+
+    def frontend_all_modes():
+        buffer = lexer1c.tokenize(data)
+        return [frontend1c.preprocess(buffer, *params) for params in FRONTEND_MODES]
+
+    print_timings('Области, препроцессор и лексический разбор модуля (%d строк, %d контекста):' % (
+        data.count('\n'), len(FRONTEND_MODES)), [
+        ('preproc1c + лексер для каждого', measure(preproc_all_modes, 3)),
+        ('frontend1c', measure(frontend_all_modes, 3)),
+    ])
+
+## preproc
+
+def bench_preproc(sizes=(10000, 50000, 200000)):
+    '''
+    Замеры построчной обработки областей и препроцессора (preproc1c.Preprocessor1C) модулей из sizes строк:
+    время на строку не должно расти с размером модуля. Совпадение результата с потоком токенов frontend1c
+    проверяется на модуле наименьшего размера (см. bench_frontend()).
+    '''
+    from epfcomp import frontend1c
+    from epfcomp import preproc1c
+
+    def token_values(buffer):
+        return [(buffer.type(index), buffer.value(index)) for index in range(len(buffer))]
+
+    # строк в функции модуля make_preproc_module()
+    function_lines = make_preproc_module(3).count('\n') / 3
+    for size in sizes:
+        data = make_preproc_module(max(1, round(size / function_lines)))
+        lines = data.count('\n')
+        if size == min(sizes):
+            for mode, areas_to_delete, symbols_to_retain in FRONTEND_MODES:
+                assert token_values(frontend1c.tokenize(data, mode, areas_to_delete, symbols_to_retain)) == \
+                       token_values(preproc_tokenize(data, mode, areas_to_delete, symbols_to_retain)), 'preproc1c: ' + mode
+        print('Области и препроцессор модуля (%d строк):' % lines)
+        for mode, areas_to_delete, symbols_to_retain in FRONTEND_MODES:
+            def execute():
+                return preproc1c.Preprocessor1C(data).execute(mode, areas_to_delete, symbols_to_retain)
+
+            elapsed = min(measure(execute, 3))
+            areas = min(measure(lambda: preproc1c.Preprocessor1C(data).remove_areas(areas_to_delete), 3))
+            print('  %-34s execute() %8.2f ms %6.2f мкс/строка   remove_areas() %8.2f ms' % (
+                mode, elapsed * 1000, elapsed * 1e6 / lines, areas * 1000))
+
+## conditions
+
+def eval_condition_by_eval(tokens, mode):
+    # вычисление условия через eval выражения python - для сравнения с preproc1c.eval_condition()
+    from epfcomp import preproc1c
+    symcalc_ru, symcalc_en = preproc1c.get_symbol_calculators()
+    expr = ""
+    for token in tokens:
+        if token in {"не", "not", "и", "and", "или", "or", "(", ")"}:
+            expr += {"не": "not", "и": "and", "или": "or"}.get(token, token)
+        else:
+            symcalc = symcalc_ru.get(token) or symcalc_en[token]
+            expr += "True" if symcalc(mode) else "False"
+        expr += " "
+    return eval(expr)
+
+# Условия с ошибками: не разбираются или содержат неизвестный символ
+INVALID_CONDITIONS = ['', 'сервер клиент', 'не', 'сервер и', '( сервер', 'сервер )', 'и сервер', 'сервер не клиент',
+                      'неизвестный', 'сервер или неизвестный']
+
+def make_condition(rnd, symbols, depth):
+    # случайное условие препроцессора: список токенов
+    kind = rnd.randrange(5) if depth else 0
+    if kind == 0:
+        return [rnd.choice(symbols)]
+    if kind == 1:
+        return [rnd.choice(['не', 'not'])] + make_condition(rnd, symbols, depth - 1)
+    if kind == 2:
+        return ['('] + make_condition(rnd, symbols, depth - 1) + [')']
+    return make_condition(rnd, symbols, depth - 1) + [rnd.choice(['и', 'and', 'или', 'or'])] + \
+           make_condition(rnd, symbols, depth - 1)
+
+def condition_outcome(eval_condition, tokens, mode):
+    # значение условия или тип исключения
+    try:
+        return eval_condition(tokens, mode)
+    except (SyntaxError, KeyError) as e:
+        return type(e).__name__
+
+def bench_conditions(conditions=10000, distinct=50):
+    '''
+    Проверяет совпадение значений условий препроцессора (preproc1c.eval_condition()) с вычислением через eval
+    на случайных условиях во всех контекстах исполнения; сравнивает время вычисления conditions условий,
+    среди которых distinct различных.
+    '''
+    from epfcomp import preproc1c
+    rnd = random.Random(1)
+    symcalc_ru, symcalc_en = preproc1c.get_symbol_calculators()
+    symbols = sorted(symcalc_ru) + sorted(symcalc_en)
+    modes = sorted(symcalc_ru) + sorted(symcalc_en)
+    samples = [make_condition(rnd, symbols, 4) for _ in range(1000)] + [text.split() for text in INVALID_CONDITIONS]
+    for tokens in samples:
+        for mode in modes:
+            assert condition_outcome(preproc1c.eval_condition, tokens, mode) == \
+                   condition_outcome(eval_condition_by_eval, tokens, mode), ' '.join(tokens) + ': ' + mode
+
+    pool = [make_condition(rnd, symbols, 3) for _ in range(distinct)]
+    samples = [rnd.choice(pool) for _ in range(conditions)]
+    mode = 'ТонкийКлиент'
+    print_timings('Условия препроцессора (%d условий, %d различных):' % (conditions, distinct), [
+        ('eval выражения python', measure(lambda: [eval_condition_by_eval(tokens, mode) for tokens in samples], 3)),
+        ('разбор и вычисление без кеша', measure(
+            lambda: [preproc1c.calc_condition(preproc1c.parse_condition(tokens), mode) for tokens in
+                     [tuple(preproc1c.CONDITION_OPERATORS.get(token, token) for token in tokens) for tokens in samples]], 3)),
+        ('eval_condition()', measure(lambda: [preproc1c.eval_condition(tokens, mode) for tokens in samples], 3)),
+    ])
+
+## parsing
+
+def make_statements_module(statements):
+    '''
+    Генерирует модуль из объявления переменных и одной процедуры с statements операторами присваивания.
+    @return (str): текст модуля
+    '''
+    names = ', '.join('Перем%d' % n for n in range(statements // 10 + 1))
+    body = ''.join('    Перем%d = %d;\n' % (n % 10, n) for n in range(statements))
+    return 'Перем %s;\n\nПроцедура Обработка()\n%sКонецПроцедуры\n' % (names, body)
+
+def new_copying_parser():
+    '''
+    Синтаксический процессор, в котором леворекурсивные правила списков копируют накопленный список
+    на каждой свертке, как до накопления списков на месте (см. parser1c) - для сравнения времени разбора.
+    @return (parser1c.Parser1C): синтаксический процессор
+    '''
+    import copy
+    from epfcomp import parser1c
+
+    def copying(func):
+        def rule(p):
+            if isinstance(p[1], list):
+                p[1] = list(p[1])
+            func(p)
+        return rule
+
+    lr_parser = copy.copy(parser1c.get_lr_parser())
+    productions = []
+    for production in lr_parser.productions:
+        symbols = production.str.split()
+        if production.callable and len(symbols) > 3 and symbols[0] == symbols[2]:
+            production = copy.copy(production)
+            production.callable = copying(production.callable)
+        productions.append(production)
+    lr_parser.productions = productions
+    return parser1c.Parser1C(parser1c.new_lexer(), lr_parser)
+
+def bench_parsing(sizes=(1000, 10000, 50000)):
+    '''
+    Замеряет время синтаксического разбора модулей с разным количеством операторов:
+    при накоплении списков на месте время разбора одного оператора не растет с размером модуля.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+
+    parser = parser1c.get_parser()
+    copying_parser = new_copying_parser()
+    print('Синтаксический разбор модуля с N операторами (время на оператор):')
+    for size in sizes:
+        buffer = lexer1c.tokenize(make_statements_module(size))
+        for name, instance in [('накопление на месте', parser), ('копирование списков', copying_parser)]:
+            # LALR-разбор ply независимо от parser1c.PARSER_BACKEND
+            timings = measure(lambda: instance.lr_parser.parse(lexer=buffer.reader()), 3)
+            print('  N = %-8d %-24s min %9.2f ms   %7.2f мкс/оператор' % (
+                size, name, min(timings) * 1000, min(timings) * 1e6 / size))
+
+## rdparser
+
+def parser_outcome(backend, buffer):
+    '''
+    @param backend (str): реализация синтаксического разбора, см. parser1c.PARSER_BACKEND
+    @return (tuple): текст модуля по его структуре (strct1c.get_text()), текст, выведенный при разборе,
+                     и исключение (тип и текст)
+    '''
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+    saved_backend = parser1c.PARSER_BACKEND
+    parser1c.PARSER_BACKEND = backend
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            module = parser1c.new_parser().parse_tokens(buffer)
+            text = strct1c.get_text(module)
+    except BaseException as e:
+        return None, out.getvalue(), (type(e).__name__, str(e))
+    finally:
+        parser1c.PARSER_BACKEND = saved_backend
+    return text, out.getvalue(), None
+
+def count_statements(subject):
+    # количество операторов в структуре модуля, включая вложенные
+    from epfcomp import strct1c
+    if isinstance(subject, list):
+        return sum(count_statements(item) for item in subject)
+    if not hasattr(subject, '__dict__'):
+        return 0
+    return isinstance(subject, strct1c.Statement) + sum(count_statements(value) for value in vars(subject).values())
+
+def bench_rdparser(functions=1000):
+    '''
+    Проверяет совпадение текста модулей, полученного по структуре разбора рекурсивным спуском (rdparser1c)
+    и LALR-разбором ply, на samples/, граничных случаях и тестовых модулях после препроцессора
+    (tests1c.test_rdparser_matches_ply()); сравнивает скорость синтаксического разбора в операторах в секунду.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import rdparser1c
+    from epfcomp import tests1c
+
+    tests1c.test_rdparser_matches_ply()
+    print('Совпадение текста модулей rdparser1c и ply: %d модулей' % len(tests1c.get_parser_buffers()))
+
+    lr_parser = parser1c.new_parser().lr_parser
+    for data in (make_module(functions), make_statements_module(functions * 20)):
+        buffer = lexer1c.tokenize(data)
+        statements = count_statements(rdparser1c.parse_tokens(buffer))
+        print('Синтаксический разбор модуля (%d строк, %d операторов):' % (data.count('\n'), statements))
+        for name, parse in (('ply (LALR)', lambda: lr_parser.parse(lexer=buffer.reader())),
+                            ('rdparser1c', lambda: rdparser1c.parse_tokens(buffer))):
+            elapsed = min(measure(parse, 3))
+            print('  %-40s %8.2f ms %12.0f операторов/с' % (name, elapsed * 1000, statements / elapsed))
+
+## chains
+
+def make_chains_module(terms):
+    '''
+    Генерирует процедуру с длинной конкатенацией строк и длинным условием из операций И.
+    @param terms (int): количество операндов в каждой цепочке
+    @return (str): текст модуля
+    '''
+    concat = ' + '.join('"Часть%d" + Строка(Номер%d)' % (n, n) for n in range(terms // 2))
+    condition = ' И '.join('Флаг%d' % n for n in range(terms))
+    return ('Процедура Цепочки()\n    Текст = %s;\n    Если %s Тогда\n        Возврат;\n    КонецЕсли;\n'
+            'КонецПроцедуры\n' % (concat, condition))
+
+def bench_chains(sizes=(100, 1000, 10000)):
+    '''
+    Замеряет разбор и обход модулей с цепочками из N операндов: цепочка одной операции хранится одним узлом
+    strct1c.BinaryExpr, поэтому get_text(), get_tokens_list() и copy.deepcopy() не углубляются в рекурсию
+    на каждый операнд; проверяет совпадение текста модуля с ply.
+    '''
+    import copy
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+
+    print('Цепочки операций из N операндов:')
+    for size in sizes:
+        buffer = lexer1c.tokenize(make_chains_module(size))
+        assert parser_outcome('rd', buffer) == parser_outcome('lalr', buffer)
+        module = parser1c.new_parser().parse_tokens(buffer)
+        text = strct1c.get_text(module)
+        assert strct1c.get_text(parser1c.new_parser().parse_tokens(lexer1c.tokenize(text))) == text
+        for name, func in (('parse_tokens()', lambda: parser1c.new_parser().parse_tokens(buffer)),
+                           ('get_text()', lambda: strct1c.get_text(module)),
+                           ('get_tokens_list()', lambda: strct1c.get_tokens_list(
+                               module.proc_funcs_list[0].body.statements, obj_type='function', filter=set())),
+                           ('copy.deepcopy()', lambda: copy.deepcopy(module))):
+            print('  N = %-8d %-24s min %9.2f ms' % (size, name, min(measure(func, 3)) * 1000))
+
+## positions
+
+# Память структуры модуля, разобранной в отдельном процессе: словарь владельцев strct1c не освобождается
+# и растет с каждым разбором, поэтому разборы одного процесса не сравнимы
+POSITIONS_MEMORY_CODE = '''
+import tracemalloc
+from epfcomp import bench1c, lexer1c, parser1c, rdparser1c
+data = bench1c.make_module({functions})
+buffer = lexer1c.tokenize(data)
+rdparser1c.parse_tokens(buffer)
+tracemalloc.start()
+positions = parser1c.SourcePositions(data) if {positions} else None
+module = rdparser1c.parse_tokens(buffer, positions=positions)
+print(tracemalloc.get_traced_memory()[0])
+'''
+
+def positions_outcome(positions, module):
+    # записи таблицы позиций узлов структуры модуля без учета порядка записи: (начало, конец, класс узла);
+    # обход узлов strct1c без рекурсии (источники тел с отложенным разбором не обходятся)
+    from epfcomp import strct1c
+    outcome = []
+    visited = set()
+    stack = [module]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif type(node).__module__ == strct1c.__name__ and id(node) not in visited:
+            visited.add(id(node))
+            index = getattr(node, 'position_id', None)
+            if index is not None:
+                outcome.append((positions.starts[index], positions.ends[index], type(node).__name__))
+            stack.extend(vars(node).values())
+    return sorted(outcome)
+
+def bench_positions(functions=1000):
+    '''
+    Проверяет совпадение позиций узлов (parser1c.SourcePositions), записанных рекурсивным спуском, LALR-разбором
+    ply и разбором с отложенным разбором тел, и номера строк позиций в исходном тексте модулей после препроцессора;
+    сравнивает время разбора и объем памяти структуры модуля без записи позиций и с ней.
+    '''
+    from epfcomp import frontend1c
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import rdparser1c
+
+    buffers = [lexer1c.tokenize(text) for text in get_sample_texts() + [make_module(5), make_statements_module(100)]]
+    data = make_preproc_module(30)
+    for mode, areas_to_delete, symbols_to_retain in FRONTEND_MODES:
+        buffers.append(frontend1c.tokenize(data, mode, areas_to_delete, symbols_to_retain))
+    saved_backend = parser1c.PARSER_BACKEND
+    try:
+        for buffer in buffers:
+            outcomes = []
+            for backend in ('rd', 'lalr'):
+                parser1c.PARSER_BACKEND = backend
+                positions = parser1c.SourcePositions(buffer.data)
+                module = error = None
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        module = parser1c.new_parser().parse_tokens(buffer, positions=positions)
+                except BaseException as e:
+                    # как и в parser_outcome(), ошибка разбора - часть результата
+                    error = type(e).__name__
+                outcomes.append((positions_outcome(positions, module), error))
+            assert outcomes[0] == outcomes[1], 'позиции rdparser1c отличаются от ply:\n' + buffer.data
+            # номер строки начала узла - номер строки его первого токена у лексера
+            token_lines = dict(zip(buffer.starts, buffer.lines))
+            assert all(positions.get_line(start) == token_lines[start] for start, _, _ in outcomes[0][0])
+    finally:
+        parser1c.PARSER_BACKEND = saved_backend
+    print('Совпадение позиций rdparser1c и ply: %d модулей' % len(buffers))
+
+    data = make_module(functions)
+    buffer = lexer1c.tokenize(data)
+    positions = parser1c.SourcePositions(data)
+    eager_module = rdparser1c.parse_tokens(buffer, positions=positions)
+    lazy_positions = parser1c.SourcePositions(data)
+    module = parser1c.new_parser().parse_skeleton(buffer, positions=lazy_positions)
+    for function in module.proc_funcs_list:
+        function.body
+    assert positions_outcome(lazy_positions, module) == positions_outcome(positions, eager_module)
+    function = module.proc_funcs_list[-1]
+    first_line, last_line = lazy_positions.get_lines(function)
+    assert data.split('\n')[first_line - 1] == '&НаСервере' and data.split('\n')[last_line - 1] == 'КонецФункции'
+    print('Совпадение позиций при отложенном разборе тел: %d записей' % len(positions.starts))
+
+    def parse_with_positions():
+        positions = parser1c.SourcePositions(data)
+        return rdparser1c.parse_tokens(buffer, positions=positions), positions
+
+    print_timings('Синтаксический разбор модуля (%d строк):' % data.count('\n'), [
+        ('rdparser1c', measure(lambda: rdparser1c.parse_tokens(buffer), 3)),
+        ('rdparser1c с записью позиций', measure(parse_with_positions, 3)),
+    ])
+    plain, retained = (run_isolated(POSITIONS_MEMORY_CODE.format(functions=functions, positions=with_positions), 1)[0]
+                       for with_positions in (False, True))
+    print('  %-40s %10.1f KB' % ('память структуры модуля', plain / 1024))
+    print('  %-40s %10.1f KB (+%.1f%%, таблица позиций %.1f KB)' % (
+        'память структуры модуля и позиций', retained / 1024, (retained - plain) * 100 / plain,
+        positions.nbytes() / 1024))
+
+## stream
+
+def same_structure(first, second):
+    # совпадение структур модулей: классы узлов и значения атрибутов, обход без рекурсии
+    stack = [(first, second)]
+    while stack:
+        first, second = stack.pop()
+        if type(first) is not type(second):
+            return False
+        if isinstance(first, list):
+            if len(first) != len(second):
+                return False
+            stack.extend(zip(first, second))
+        elif hasattr(first, '__dict__'):
+            if vars(first).keys() != vars(second).keys():
+                return False
+            stack.extend((value, vars(second)[name]) for name, value in vars(first).items())
+        elif first != second:
+            return False
+    return True
+
+# Пиковая память индексации вызовов процедур и функций модуля, разобранного целиком и потоком процедур и функций
+# (в отдельном процессе, см. POSITIONS_MEMORY_CODE)
+STREAM_MEMORY_CODE = '''
+import tracemalloc
+from epfcomp import bench1c, lexer1c, parser1c, strct1c
+buffer = lexer1c.tokenize(bench1c.make_module({functions}))
+parser = parser1c.new_parser()
+tracemalloc.start()
+if {stream}:
+    functions = parser.parse_stream(buffer, collect=False)
+else:
+    functions = parser.parse_tokens(buffer).proc_funcs_list
+calls = {{}}
+for function in functions:
+    calls[function.name] = [name for _, name in strct1c.get_tokens_list(function.body.statements, 'function', set())]
+    if {stream}:
+        strct1c.del_owner_links(function)
+print(tracemalloc.get_traced_memory()[1])
+'''
+
+def stream_outcome(parser, buffer):
+    # процедуры и функции, выданные parse_stream(), структура модуля и исключение (тип)
+    functions = []
+    stream = parser.parse_stream(buffer)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            while True:
+                functions.append(next(stream))
+    except StopIteration as e:
+        return functions, e.value, None
+    except BaseException as e:
+        return functions, None, type(e).__name__
+
+def bench_stream(functions=2000):
+    '''
+    Проверяет, что процедуры и функции, выданные parser1c.Parser1C.parse_stream() по мере разбора, и структура
+    модуля совпадают с разбором целиком (в том числе модулей с синтаксическими ошибками); сравнивает время
+    получения первой процедуры/функции и пиковую память индексации вызовов модуля, разобранного целиком и потоком.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+
+    texts = get_sample_texts() + [make_module(5), make_statements_module(100), make_module(5) + 'Процедура П()\n',
+                                  make_module(3).replace('Индекс / 3', 'Индекс / ', 1)]
+    parser = parser1c.new_parser()
+    for text in texts:
+        buffer = lexer1c.tokenize(text)
+        streamed, module, error = stream_outcome(parser, buffer)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected, expected_error = parser.parse_tokens(buffer), None
+        except BaseException as e:
+            expected, expected_error = None, type(e).__name__
+        assert error == expected_error and same_structure(module, expected), 'parse_stream(): \n' + text
+        if module is not None and module.proc_funcs_list:
+            assert module.proc_funcs_list == streamed
+            assert all(strct1c.get_owner(function) is module for function in streamed)
+    print('Совпадение parse_stream() с разбором целиком: %d модулей' % len(texts))
+
+    data = make_module(functions)
+    buffer = lexer1c.tokenize(data)
+    print_timings('Синтаксический разбор модуля (%d строк):' % data.count('\n'), [
+        ('parse_tokens()', measure(lambda: parser.parse_tokens(buffer), 3)),
+        ('parse_stream(), первая функция', measure(lambda: next(parser.parse_stream(buffer)), 3)),
+        ('parse_stream(), все функции', measure(lambda: list(parser.parse_stream(buffer, collect=False)), 3)),
+    ])
+    for name, stream in (('parse_tokens(), индексация вызовов', False),
+                         ('parse_stream(), индексация вызовов', True)):
+        peak = run_isolated(STREAM_MEMORY_CODE.format(functions=functions, stream=stream), 1)[0]
+        print('  %-40s пик памяти %10.1f KB' % (name, peak / 1024))
+
+## grammar
+
+def bench_grammar(folders=()):
+    '''
+    Профилирование синтаксического разбора файлов samples/*.1c и выгруженных модулей (см. parser1c.ParseProfile):
+    для каждого модуля и сводно - свертки и время действий функций-правил грамматики, узлы strct1c по классам.
+    Модули разбираются после препроцессора в контексте исполнения управляемой формы.
+    @param folders (list): каталоги с выгруженными текстами модулей
+    '''
+    from epfcomp import frontend1c
+    from epfcomp import parser1c
+
+    parser = parser1c.new_profiling_parser()
+    total = parser1c.ParseProfile()
+    for file_name in get_module_files(folders):
+        data = open(file_name, encoding='utf-8').read()
+        parser.profile = parser1c.ParseProfile()
+        messages = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(messages):
+                parser.parse_tokens(frontend1c.tokenize(data, 'ТонкийКлиент', [], ['НаКлиенте', 'Сервер']))
+        except BaseException as e:
+            print('%s: ошибка разбора: %s %s' % (os.path.basename(file_name), type(e).__name__, e))
+            continue
+        errors = messages.getvalue().count('\n')
+        print(parser.profile.get_report(os.path.basename(file_name) + (', ошибок: %d' % errors if errors else '')))
+        total.add(parser.profile)
+    print(total.get_report('Все модули'))
+
+BENCHMARKS = {
+    'startup': bench_startup,
+    'tokens': bench_tokens,
+    'relex': bench_relex,
+    'tokcache': bench_tokcache,
+    'scanner': bench_scanner,
+    'strings': bench_strings,
+    'lexer': bench_lexer,
+    'frontend': bench_frontend,
+    'preproc': bench_preproc,
+    'conditions': bench_conditions,
+    'parsing': bench_parsing,
+    'rdparser': bench_rdparser,
+    'chains': bench_chains,
+    'positions': bench_positions,
+    'stream': bench_stream,
+    'grammar': bench_grammar,
+}
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Замеры производительности разбора модулей 1С')
+    arg_parser.add_argument('benchmark', nargs='*', choices=sorted(BENCHMARKS), help='замеры для запуска')
+    arg_parser.add_argument('--modules', action='append', default=[], metavar='DIR',
+                            help='каталог с выгруженными текстами модулей для замеров lexer и grammar (можно указать несколько)')
+    args = arg_parser.parse_args()
+    for name in args.benchmark or sorted(BENCHMARKS):
+        if name in ('lexer', 'grammar'):
+            BENCHMARKS[name](args.modules)
+        else:
+            BENCHMARKS[name]()
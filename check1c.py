@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# check1c.py
+#
+# syntax check of all modules of a dump in a process pool:
+# preprocessing and parsing only, without transfer, obfuscation and writing
+#
+#   python -m epfcomp.check1c <каталог выгрузки> --object <имя обработки>
+#          [--managed-form <форма> ...] [--ordinary-form <форма> ...] [--exclude-area <область> ...]
+# ------------------------------------------------------------
+from epfcomp.base_const import *
+
+from epfcomp import frontend1c
+from epfcomp import lexer1c
+from epfcomp import parser1c
+from epfcomp import rdparser1c
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import io
+import os
+import sys
+
+# Количество процессов проверки, None - по количеству процессоров
+CHECK_WORKERS = None
+
+# Контексты исполнения модулей: (контекст исполнения, символы препроцессора, условия из которых сохраняются),
+# так же, как при получении контекста сборки (см. context.get_primary_context())
+MANAGED_MODES = [('ТонкийКлиент', ['НаКлиенте', 'Сервер'])]
+ORDINARY_MODES = [('ТолстыйКлиентОбычноеПриложение', [])]
+APP_MODULE_MODES = {
+    'Конфигурация.МодульУправляемогоПриложения.txt': [('ТонкийКлиент', [])],
+    'Конфигурация.МодульОбычногоПриложения.txt': ORDINARY_MODES,
+}
+
+# Ошибка модуля: имя файла, контекст исполнения, номер строки (None - строка не известна), текст ошибки
+SyntaxIssue = collections.namedtuple('SyntaxIssue', ['file_name', 'mode', 'line', 'message'])
+
+def get_dump_modules(dump_folder, build_params):
+    '''
+    Отбирает модули выгрузки, которые разбираются при сборке, и контексты исполнения для каждого.
+    @param dump_folder (str): каталог с выгруженными текстами модулей
+    @param build_params (BuildParams): параметры сборки
+    @return (list): пары (имя файла модуля, контексты исполнения)
+    '''
+    result = []
+    for file_name, modes in APP_MODULE_MODES.items():
+        if os.path.isfile(os.path.join(dump_folder, file_name)):
+            result.append((file_name, modes))
+    result.append(('Обработка.' + build_params.object_name + '.МодульОбъекта.txt', ORDINARY_MODES))
+    # имена файлов отбираются по тем же правилам, что и в utils.load_forms() и utils.load_common_modules(),
+    # но без чтения текстов: модули читаются в процессах проверки
+    forms = {}
+    common_modules = {}
+    form_prefix = 'Обработка.' + build_params.object_name + '.Форма'
+    common_module_prefix = 'ОбщийМодуль.' + build_params.object_name
+    for file_name in os.listdir(dump_folder):
+        if not os.path.isfile(os.path.join(dump_folder, file_name)):
+            continue
+        if file_name.startswith(form_prefix):
+            form_name = file_name.split('.')[3]
+            if form_name in build_params.managed_forms:
+                forms[form_name] = (file_name, MANAGED_MODES)
+            elif form_name in build_params.ordinary_forms:
+                forms[form_name] = (file_name, ORDINARY_MODES)
+        elif file_name.startswith(common_module_prefix):
+            common_modules[file_name.split('.')[1]] = (file_name, MANAGED_MODES + ORDINARY_MODES)
+    result += forms.values()
+    result += common_modules.values()
+    return sorted(result)
+
+def get_syntax_errors(buffer):
+    '''
+    Выполняет синтаксический разбор токенов модуля и собирает синтаксические ошибки.
+    Модуль без ошибок разбирается рекурсивным спуском (rdparser1c), модуль с ошибкой - ply,
+    который восстанавливается после ошибок и находит все ошибки модуля.
+    @param buffer (lexer1c.TokenBuffer): токены модуля после препроцессора
+    @return (list): пары (номер строки, текст ошибки)
+    '''
+    try:
+        rdparser1c.parse_tokens(buffer)
+        return []
+    except (rdparser1c.ParserError, RecursionError):
+        pass
+    errors = []
+
+    def on_error(token):
+        if token is None:
+            errors.append((None, "неожиданный конец модуля"))
+        else:
+            errors.append((token.lineno, "неожиданный токен %s: %s" % (token.type, token.value)))
+
+    parser = parser1c.new_parser()
+    # ошибки собираются вместо вывода parser1c.p_error() (у каждого экземпляра своя копия LR-парсера)
+    parser.lr_parser.errorfunc = on_error
+    with contextlib.redirect_stdout(io.StringIO()):
+        # сообщения правил восстановления после ошибок (p_statements_error) не выводятся
+        parser.lr_parser.parse(lexer=buffer.reader())
+    return errors
+
+def check_module(dump_folder, file_name, modes, exclude_areas):
+    '''
+    Проверяет синтаксис модуля во всех его контекстах исполнения. Выполняется в процессах проверки.
+    @param dump_folder (str): каталог с выгруженными текстами модулей
+    @param file_name (str): имя файла модуля
+    @param modes (list): контексты исполнения, см. get_dump_modules()
+    @param exclude_areas (list): список областей, исключаемых из модуля
+    @return (list): ошибки модуля (SyntaxIssue)
+    '''
+    result = []
+    try:
+        text = open(os.path.join(dump_folder, file_name), encoding='utf-8').read()
+        with contextlib.redirect_stdout(io.StringIO()):
+            # сообщения лексера об ошибках не выводятся - текст с ошибкой не разбирается синтаксически
+            source = lexer1c.tokenize(text)
+    except Exception as e:
+        return [SyntaxIssue(file_name, None, None, "ошибка лексического разбора: %s %s" % (type(e).__name__, e))]
+    for mode, symbols_to_retain in modes:
+        try:
+            buffer = frontend1c.preprocess(source, mode, exclude_areas, symbols_to_retain)
+        except Exception as e:
+            result.append(SyntaxIssue(file_name, mode, None, str(e)))
+            continue
+        for line, message in get_syntax_errors(buffer):
+            result.append(SyntaxIssue(file_name, mode, line, message))
+    return result
+
+def check_dump(dump_folder, build_params, exclude_areas, workers=None):
+    '''
+    Точка входа проверки синтаксиса. Выполняет препроцессор и синтаксический разбор всех модулей выгрузки,
+    которые разбираются при сборке (см. maker.process_dump()), в пуле процессов.
+    @param dump_folder (str): каталог с выгруженными модулями конфигурации
+    @param build_params (BuildParams): параметры сборки
+    @param exclude_areas (list): список областей, которые следует вырезать перед обработкой
+    @param workers (int): количество процессов проверки, по умолчанию - CHECK_WORKERS
+    @return (list): ошибки всех модулей (SyntaxIssue) в порядке имен файлов
+    '''
+    log('Проверка синтаксиса модулей')
+    modules = get_dump_modules(dump_folder, build_params)
+    result = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or CHECK_WORKERS) as executor:
+        futures = [executor.submit(check_module, dump_folder, file_name, modes, exclude_areas)
+                   for file_name, modes in modules]
+        for future in futures:
+            result += future.result()
+    log('Проверено модулей: %d, ошибок: %d', len(modules), len(result))
+    return result
+
+def format_issue(issue):
+    # <файл>:<строка>: [<контекст исполнения>] <текст ошибки>
+    location = issue.file_name if issue.line is None else '%s:%d' % (issue.file_name, issue.line)
+    return '%s: %s%s' % (location, '[%s] ' % issue.mode if issue.mode else '', issue.message)
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Проверка синтаксиса модулей выгрузки')
+    arg_parser.add_argument('dump_folder', help='каталог с выгруженными модулями конфигурации')
+    arg_parser.add_argument('--object', required=True, help='имя обработки')
+    arg_parser.add_argument('--managed-form', action='append', default=[], help='управляемая форма обработки')
+    arg_parser.add_argument('--ordinary-form', action='append', default=[], help='обычная форма обработки')
+    arg_parser.add_argument('--exclude-area', action='append', default=[], help='область, вырезаемая из модулей')
+    arg_parser.add_argument('--workers', type=int, help='количество процессов проверки')
+    args = arg_parser.parse_args()
+    build_params = BuildParams(args.object, None, set(args.managed_form), set(args.ordinary_form))
+    # процессам проверки передаются функции модуля epfcomp.check1c, а не __main__
+    from epfcomp import check1c
+    issues = check1c.check_dump(args.dump_folder, build_params, args.exclude_area, args.workers)
+    for issue in issues:
+        print(check1c.format_issue(issue))
+    sys.exit(1 if issues else 0)
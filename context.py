@@ -3,12 +3,24 @@
 from epfcomp.base_const import *
 
 from epfcomp import custom_handlers
+from epfcomp import frontend1c
+from epfcomp import lexer1c
+from epfcomp import names1c
 from epfcomp import parser1c
-from epfcomp import preproc1c
 from epfcomp import strct1c
+from epfcomp import tokcache1c
 from epfcomp import utils
+import collections.abc
 import os
 
+# Использовать дисковый кеш токенов модулей (см. tokcache1c): при повторной сборке лексером разбираются
+# только измененные модули. Кеш хранится рядом с каталогом выгрузки, поэтому по умолчанию отключен.
+TOKEN_CACHE_MODE_ON = False
+
+# Разбирать тела процедур и функций общих модулей при первом обращении (см. parser1c.Parser1C.parse_skeleton()):
+# тела функций, не попавших ни в одну цепочку вызовов, не разбираются
+SKELETON_MODE_ON = True
+
 class ContextType:
     gl_app_module = None
     gl_ep_module = None
@@ -17,6 +29,89 @@ class ContextType:
     gl_all_funcs_desc = None
     gl_func_subcalls = None
 
+class FuncSubcallsType(collections.abc.Mapping):
+    '''
+    Списки вызовов процедур и функций приложения (полное имя функции -> вызовы, см. get_sub_call_list()).
+    Список вычисляется при первом обращении к функции, поэтому тело функции, к вызовам которой
+    не обращаются, не разбирается. Обработчики (см. add_handler()) применяются к каждому списку.
+    '''
+    def __init__(self):
+        self.__functions = dict()
+        self.__values = dict()
+        self.__handlers = []
+    def add(self, full_func_name, funcs_desc, funcs_desc_lower, proc_func, module_type, module_name):
+        '''
+        @param full_func_name (str): полное имя процедуры/функции
+        @param proc_func (strct1c.Function): процедура/функция, остальные параметры - см. get_sub_call_list()
+        '''
+        # параметры вычисления хранятся как есть (а не замыканием), чтобы контекст сохранялся в pickle
+        self.__functions[full_func_name] = (funcs_desc, funcs_desc_lower, proc_func, module_type, module_name)
+    def add_handler(self, handler):
+        '''
+        Добавляет обработчик списков вызовов: применяется к уже вычисленным спискам и к вычисляемым далее.
+        @param handler (function): обработчик (функция модуля), параметр - список вызовов функции
+        '''
+        self.__handlers.append(handler)
+        for sub_calls_dict in self.__values.values():
+            handler(sub_calls_dict)
+    def __getitem__(self, full_func_name):
+        sub_calls_dict = self.__values.get(full_func_name)
+        if sub_calls_dict is None:
+            funcs_desc, funcs_desc_lower, proc_func, module_type, module_name = self.__functions[full_func_name]
+            sub_calls_dict = get_sub_call_list(funcs_desc, funcs_desc_lower, proc_func.body.statements,
+                                               module_type, module_name)
+            for handler in self.__handlers:
+                handler(sub_calls_dict)
+            self.__values[full_func_name] = sub_calls_dict
+        return sub_calls_dict
+    def __iter__(self):
+        return iter(self.__functions)
+    def __len__(self):
+        return len(self.__functions)
+    def __contains__(self, full_func_name):
+        return full_func_name in self.__functions
+
+def get_token_cache(dump_folder):
+    '''
+    @param dump_folder (str): каталог с выгруженными текстами модулей
+    @return (tokcache1c.TokenCache): кеш токенов рядом с каталогом выгрузки, None - если кеш отключен
+    '''
+    if not TOKEN_CACHE_MODE_ON:
+        return None
+    return tokcache1c.TokenCache(tokcache1c.get_cache_folder(dump_folder))
+
+def tokenize_module(text, token_cache, file_name):
+    '''
+    Выполняет лексический разбор исходного текста модуля, токены берутся из кеша, если он задан.
+    @param text (str): исходный текст модуля (с областями и инструкциями препроцессора)
+    @param token_cache (tokcache1c.TokenCache): кеш токенов, None - без кеша
+    @param file_name (str): имя файла модуля в выгрузке
+    @return (lexer1c.TokenBuffer): токены модуля
+    '''
+    if token_cache is None:
+        return lexer1c.tokenize(text)
+    return token_cache.tokenize(text, file_name)
+
+def parse_module(buffer, mode, exclude_areas, symbols_to_retain=[], parser=None, skeleton=False, module_name=None):
+    '''
+    Выполняет синтаксический разбор модуля в контексте исполнения mode.
+    Области и инструкции препроцессора обрабатываются в потоке токенов (см. frontend1c.preprocess()),
+    поэтому токены одного разбора исходного текста используются для всех контекстов исполнения.
+    @param buffer (lexer1c.TokenBuffer): токены исходного текста модуля (см. tokenize_module())
+    @param mode (str): контекст исполнения кода 1С: ТонкийКлиент, ТолстыйКлиентОбычноеПриложение
+    @param exclude_areas (list): список областей, исключаемых из модуля
+    @param symbols_to_retain (list): символы препроцессора, условия из которых сохраняются для синтаксического процессора
+    @param parser (parser1c.Parser1C): синтаксический процессор, по умолчанию - общий
+    @param skeleton (bool): тела процедур и функций разбираются при первом обращении (см. parser1c.Parser1C.parse_skeleton())
+    @param module_name (str): имя модуля для сообщений об ошибках разбора тел процедур и функций в режиме skeleton
+    @return (strct1c.Module): структура модуля
+    '''
+    parser = parser or parser1c.get_parser()
+    buffer = frontend1c.preprocess(buffer, mode, exclude_areas, symbols_to_retain)
+    if skeleton:
+        return parser.parse_skeleton(buffer, module_name=module_name)
+    return parser.parse_tokens(buffer)
+
 def get_application_module_props(dump_folder, exclude_areas):
     """
     Получает тексты и структуру модулей обычного и управляемого приложения.
@@ -28,22 +123,21 @@ def get_application_module_props(dump_folder, exclude_areas):
     gl_app_module = dict()
     gl_app_module[APP_TYPE_MANAGED] = dict()
     gl_app_module[APP_TYPE_ORDINARY] = dict()
+    token_cache = get_token_cache(dump_folder)
 
     # Получение структуры модуля управляемого приложения.
     gl_app_module[APP_TYPE_MANAGED]['text_origin'] = open(
         os.path.join(dump_folder, 'Конфигурация.МодульУправляемогоПриложения.txt'), encoding='utf-8').read()
-    preproc = preproc1c.Preprocessor1C(gl_app_module[APP_TYPE_MANAGED]['text_origin'])
-    text_managed = preproc.execute('ТонкийКлиент', exclude_areas)
-    gl_app_module[APP_TYPE_MANAGED]['text'] = text_managed
-    gl_app_module[APP_TYPE_MANAGED]['struct'] = parser1c.parser.parse(text_managed)
+    buffer = tokenize_module(gl_app_module[APP_TYPE_MANAGED]['text_origin'], token_cache,
+                             'Конфигурация.МодульУправляемогоПриложения.txt')
+    gl_app_module[APP_TYPE_MANAGED]['struct'] = parse_module(buffer, 'ТонкийКлиент', exclude_areas)
 
     # Получение структуры модуля обычного приложения.
     gl_app_module[APP_TYPE_ORDINARY]['text_origin'] = open(
         os.path.join(dump_folder, 'Конфигурация.МодульОбычногоПриложения.txt'), encoding='utf-8').read()
-    preproc = preproc1c.Preprocessor1C(gl_app_module[APP_TYPE_ORDINARY]['text_origin'])
-    text_ordinary = preproc.execute('ТолстыйКлиентОбычноеПриложение', exclude_areas)
-    gl_app_module[APP_TYPE_ORDINARY]['text'] = text_ordinary
-    gl_app_module[APP_TYPE_ORDINARY]['struct'] = parser1c.parser.parse(text_ordinary)
+    buffer = tokenize_module(gl_app_module[APP_TYPE_ORDINARY]['text_origin'], token_cache,
+                             'Конфигурация.МодульОбычногоПриложения.txt')
+    gl_app_module[APP_TYPE_ORDINARY]['struct'] = parse_module(buffer, 'ТолстыйКлиентОбычноеПриложение', exclude_areas)
 
     return gl_app_module
 
@@ -53,10 +147,8 @@ def get_processor_module_props(dump_folder, object_name, exclude_areas):
     module_props = dict()
     processor_file_name = 'Обработка.' + object_name + '.МодульОбъекта.txt'
     module_props['text_origin'] = open(os.path.join(dump_folder, processor_file_name), encoding='utf-8').read()
-    preproc = preproc1c.Preprocessor1C(module_props['text_origin'])
-    text = preproc.execute('ТолстыйКлиентОбычноеПриложение', exclude_areas)
-    module_props['text'] = text
-    module_props['struct'] = parser1c.parser.parse(text)
+    buffer = tokenize_module(module_props['text_origin'], get_token_cache(dump_folder), processor_file_name)
+    module_props['struct'] = parse_module(buffer, 'ТолстыйКлиентОбычноеПриложение', exclude_areas)
     return module_props
 
 def get_form_properties(dump_folder, build_params, exclude_areas):
@@ -68,15 +160,12 @@ def get_form_properties(dump_folder, build_params, exclude_areas):
     """
     log('Получение структуры и свойств модулей форм обработки')
     gl_form_props = utils.load_forms(dump_folder, build_params)
+    token_cache = get_token_cache(dump_folder)
     for form_name, form_props in gl_form_props.items():
         context = "ТонкийКлиент" if form_props['is_managed'] else "ТолстыйКлиентОбычноеПриложение"
-        # Выполнить препроцессинг, избавиться от областей
-        preproc = preproc1c.Preprocessor1C(form_props['text_origin'])
-        new_text = preproc.execute(context, exclude_areas, ['НаКлиенте', 'Сервер'])
-        new_text = utils.add_semicolon_after_preproc(new_text)
-        form_props['text'] = new_text
-        # Получить синтаксическую структуру модуля
-        form_props['struct'] = parser1c.parser.parse(new_text)
+        # Получить синтаксическую структуру модуля: препроцессор выполняется, области удаляются в потоке токенов
+        buffer = tokenize_module(form_props['text_origin'], token_cache, form_props['file_name'])
+        form_props['struct'] = parse_module(buffer, context, exclude_areas, ['НаКлиенте', 'Сервер'])
     return gl_form_props
 
 
@@ -89,18 +178,16 @@ def get_common_modules_properties(dump_folder, build_params, exclude_areas):
     """
     log('Получение структуры и свойств общих модулей')
     gl_common_modules_props = utils.load_common_modules(dump_folder, build_params)
+    token_cache = get_token_cache(dump_folder)
     for module_name, module_props in gl_common_modules_props.items():
         try:
-            # Разрешить препроцессор, избавиться от областей
-            preproc = preproc1c.Preprocessor1C(gl_common_modules_props[module_name]['text_origin'])
-            module_props['text_managed'] = preproc.execute("ТонкийКлиент", exclude_areas, ['НаКлиенте', 'Сервер'])
-            module_props['text_managed'] = utils.add_semicolon_after_preproc(module_props['text_managed'])
-            module_props['struct_managed'] = parser1c.parser.parse(module_props['text_managed'])
-
-            # Разрешить препроцессор, избавиться от областей
-            preproc = preproc1c.Preprocessor1C(gl_common_modules_props[module_name]['text_origin'])
-            module_props['text_ordinary'] = preproc.execute('ТолстыйКлиентОбычноеПриложение', exclude_areas)
-            module_props['struct_ordinary'] = parser1c.parser.parse(module_props['text_ordinary'])
+            # Один лексический разбор исходного текста, препроцессор и области - для каждого контекста в потоке токенов
+            buffer = tokenize_module(module_props['text_origin'], token_cache, module_props['file_name'])
+            module_props['struct_managed'] = parse_module(buffer, "ТонкийКлиент", exclude_areas,
+                                                          ['НаКлиенте', 'Сервер'], skeleton=SKELETON_MODE_ON,
+                                                          module_name=module_name)
+            module_props['struct_ordinary'] = parse_module(buffer, 'ТолстыйКлиентОбычноеПриложение', exclude_areas,
+                                                           skeleton=SKELETON_MODE_ON, module_name=module_name)
         except:
             raise Exception("Ошибка при разборе модуля : " + module_name)
     return gl_common_modules_props
@@ -167,21 +254,22 @@ def get_functions_subcalls(gl_form_props, gl_common_modules_props, gl_ep_module,
     """
     log('Вычисление вызовов в процедурах и функциях')
     gl_func_subcalls = dict()
-    gl_func_subcalls[APP_TYPE_MANAGED] = dict()
-    gl_func_subcalls[APP_TYPE_ORDINARY] = dict()
+    gl_func_subcalls[APP_TYPE_MANAGED] = FuncSubcallsType()
+    gl_func_subcalls[APP_TYPE_ORDINARY] = FuncSubcallsType()
 
+    # имена функций по их канонической форме (см. names1c.fold())
     all_funcs_desc_lower = dict()
-    all_funcs_desc_lower[APP_TYPE_MANAGED] = set()
-    all_funcs_desc_lower[APP_TYPE_ORDINARY] = set()
+    all_funcs_desc_lower[APP_TYPE_MANAGED] = dict()
+    all_funcs_desc_lower[APP_TYPE_ORDINARY] = dict()
     for app_type, funcs_desc in gl_all_funcs_desc.items():
-        all_funcs_desc_lower[app_type] = [full_func_name.lower() for full_func_name in funcs_desc]
+        all_funcs_desc_lower[app_type] = names1c.fold_map(funcs_desc, first_wins=True)
 
     # заполняет gl_func_subcalls по процедурам и функциями модуля обработки
     for proc_func in gl_ep_module['struct'].proc_funcs_list:
-        sub_calls_dict = get_sub_call_list(gl_all_funcs_desc[APP_TYPE_ORDINARY], all_funcs_desc_lower[APP_TYPE_ORDINARY],
-                                           proc_func.body.statements, DATA_PROCESSOR, object_name)
         full_func_name = DATA_PROCESSOR + '.' + object_name + '.' + proc_func.name
-        gl_func_subcalls[APP_TYPE_ORDINARY][full_func_name] = sub_calls_dict
+        gl_func_subcalls[APP_TYPE_ORDINARY].add(full_func_name,
+            gl_all_funcs_desc[APP_TYPE_ORDINARY], all_funcs_desc_lower[APP_TYPE_ORDINARY],
+            proc_func, DATA_PROCESSOR, object_name)
 
     # цикл заполняет gl_func_subcalls по процедурам и функциями форм
     for form_name, form_props in gl_form_props.items():
@@ -192,25 +280,22 @@ def get_functions_subcalls(gl_form_props, gl_common_modules_props, gl_ep_module,
             else:
                 form_type = FORM_ORDINARY
                 app_type = APP_TYPE_ORDINARY
-            sub_calls_dict = get_sub_call_list(gl_all_funcs_desc[app_type], all_funcs_desc_lower[app_type],
-                                               proc_func.body.statements, form_type, form_name)
             full_func_name = form_type + '.' + form_name + '.' + proc_func.name
-            gl_func_subcalls[app_type][full_func_name] = sub_calls_dict
+            gl_func_subcalls[app_type].add(full_func_name,
+                gl_all_funcs_desc[app_type], all_funcs_desc_lower[app_type], proc_func, form_type, form_name)
 
     # цикл заполняет gl_func_subcalls по процедурам и функциями общих модулей
     for module_name, module_props in gl_common_modules_props.items():
         for proc_func in module_props['struct_managed'].proc_funcs_list:
-            sub_calls_dict = get_sub_call_list(gl_all_funcs_desc[APP_TYPE_MANAGED],
-                                               all_funcs_desc_lower[app_type],
-                                               proc_func.body.statements, COMMON_MODULE, module_name)
             full_func_name = COMMON_MODULE + '.' + module_name + '.' + proc_func.name
-            gl_func_subcalls[APP_TYPE_MANAGED][full_func_name] = sub_calls_dict
+            gl_func_subcalls[APP_TYPE_MANAGED].add(full_func_name,
+                gl_all_funcs_desc[APP_TYPE_MANAGED], all_funcs_desc_lower[app_type],
+                proc_func, COMMON_MODULE, module_name)
         for proc_func in module_props['struct_ordinary'].proc_funcs_list:
-            sub_calls_dict = get_sub_call_list(gl_all_funcs_desc[APP_TYPE_ORDINARY],
-                                               all_funcs_desc_lower[app_type],
-                                               proc_func.body.statements, COMMON_MODULE, module_name)
             full_func_name = COMMON_MODULE + '.' + module_name + '.' + proc_func.name
-            gl_func_subcalls[APP_TYPE_ORDINARY][full_func_name] = sub_calls_dict
+            gl_func_subcalls[APP_TYPE_ORDINARY].add(full_func_name,
+                gl_all_funcs_desc[APP_TYPE_ORDINARY], all_funcs_desc_lower[app_type],
+                proc_func, COMMON_MODULE, module_name)
     return gl_func_subcalls
 
 def update_local_calls_to_common(gl_func_subcalls):
@@ -221,21 +306,28 @@ def update_local_calls_to_common(gl_func_subcalls):
     """
     log('Замена обращений к локальным процедурам и функциям на обращения через общий модуль')
     for app_type, func_calls in gl_func_subcalls.items():
-        for full_func_name, sub_calls_dict in func_calls.items():
-            for called_func_name, sub_calls_list in sub_calls_dict.items():
-                for index in range(len(sub_calls_list)):
-                    sub_call = sub_calls_list[index]
-                    if isinstance(sub_call, strct1c.FuncCall):
-                        parts = called_func_name.split('.')
-                        if parts[0] == COMMON_MODULE:
-                            owner = strct1c.get_owner(sub_call)
-                            new_call = strct1c.DottedExpression(strct1c.Identifier(parts[1]))
-                            new_call.append(sub_call)
-                            strct1c.set_owner(new_call, owner)
-                            strct1c.set_owner(sub_call, new_call)
-                            owner.replace_obj(sub_call, new_call)
-                            sub_calls_list[index] = new_call
-    pass
+        # замена выполняется для каждого вычисленного списка вызовов (см. FuncSubcallsType)
+        func_calls.add_handler(replace_local_calls_to_common)
+
+def replace_local_calls_to_common(sub_calls_dict):
+    """
+    Заменяет в теле функции вызовы функций общих модулей как локальных на вызовы с обращением через общий модуль.
+    @param sub_calls_dict (dict): вызовы функции, см. get_sub_call_list()
+    @return None:
+    """
+    for called_func_name, sub_calls_list in sub_calls_dict.items():
+        for index in range(len(sub_calls_list)):
+            sub_call = sub_calls_list[index]
+            if isinstance(sub_call, strct1c.FuncCall):
+                parts = called_func_name.split('.')
+                if parts[0] == COMMON_MODULE:
+                    owner = strct1c.get_owner(sub_call)
+                    new_call = strct1c.DottedExpression(strct1c.Identifier(parts[1]))
+                    new_call.append(sub_call)
+                    strct1c.set_owner(new_call, owner)
+                    strct1c.set_owner(sub_call, new_call)
+                    owner.replace_obj(sub_call, new_call)
+                    sub_calls_list[index] = new_call
 
 def get_primary_context(dump_folder, build_params, exclude_areas):
 
@@ -275,6 +367,8 @@ def get_primary_context(dump_folder, build_params, exclude_areas):
 def get_sub_call_list(all_funcs_set, all_funcs_set_in_lower, statements, module_type, module_name):
     '''
     По переданному описанию функции составляет список вызываемых из неё процедур и функций.
+    @param all_funcs_set (dict): описания функций приложения
+    @param all_funcs_set_in_lower (dict): имена функций по их канонической форме (см. names1c.fold_map())
     @param proc_func (strct1c.Function): описание функций
     @param module_type (str): тип модуля: CommonModule, FormManaged, FormOrdinary
     @param module_name (str): имя общего модуля или формы
@@ -294,11 +388,9 @@ def get_sub_call_list(all_funcs_set, all_funcs_set_in_lower, statements, module_
             # обращение к функции этого модуля
             full_func_name_called = module_type + "." + module_name + "." + func_name_called
         # отбираем только функции модулей (без встроенных функций)
-        if full_func_name_called.lower() in all_funcs_set_in_lower:
-            for name in all_funcs_set:
-                if name.lower() == full_func_name_called.lower():
-                    full_func_name_called = name
-                    break
+        folded_name = names1c.fold(full_func_name_called)
+        if folded_name in all_funcs_set_in_lower:
+            full_func_name_called = all_funcs_set_in_lower[folded_name]
             # в функции может быть несколько обращений к одной и тойже (другой) функции
             val = result.get(full_func_name_called, [])
             val.append(func_rec[0])
@@ -3,6 +3,7 @@
 from epfcomp.base_const import *
 from epfcomp import locsettings
 from epfcomp import move_funcs
+from epfcomp import names1c
 from epfcomp import strct1c
 from epfcomp import utils
 import os.path
@@ -72,7 +73,7 @@ def update_functions_to_move_primary_module(app_type, primary_module_config, con
         # некоторые функции содержат в названии префикс "гл_" - это признак того, что функцию
         # следует перенести в основную форму
         for full_func_name in context.gl_all_funcs_desc['managed']:
-            if full_func_name.split('.')[2].lower().startswith("гл_") and \
+            if names1c.fold(full_func_name.split('.')[2]).startswith("гл_") and \
                             full_func_name not in primary_module_config.functions_to_move:
                 primary_module_config.functions_to_move.add(full_func_name)
                 move_funcs.fill_direct_call_chain(primary_module_config.functions_to_move,
@@ -82,7 +83,7 @@ def update_functions_to_move_primary_module(app_type, primary_module_config, con
 
 
 gl_special_calls = {"ПолучитьОписаниеОповещенияСВызовомФункции", "СоздатьОбъектОписанияОповещения"}
-gl_special_calls = {name.lower() for name in gl_special_calls}
+gl_special_calls = {names1c.fold(name) for name in gl_special_calls}
 
 def find_spec_calls(functions_to_move, func_subcalls):
     """
@@ -105,7 +106,7 @@ def find_spec_calls(functions_to_move, func_subcalls):
         for full_func_name in funcs_to_check:
             for called_func_name, calls_list in func_subcalls[full_func_name].items():
                 called_func_name_short = called_func_name.split(".")[2]
-                if called_func_name_short.lower() in gl_special_calls:
+                if names1c.fold(called_func_name_short) in gl_special_calls:
                     # Если вызывамая функция - это одна из тех что указаны в special_calls,
                     # требуется перенести ещё функцию указанную в параметре.
                     for call in calls_list:
@@ -117,15 +118,16 @@ def find_spec_calls(functions_to_move, func_subcalls):
                             # на обращения к функциям общего модуля
                             raise Exception("Необработанный вызов : " + call)
                         sub_call_full_name = "CommonModule." + module_name + "." + func_name
-                        for full_name_correct in func_subcalls:
-                            # задаем корректное имя функции, "по описанию"
-                            if full_name_correct.lower() == sub_call_full_name.lower():
-                                sub_call_full_name = full_name_correct
+                        # задаем корректное имя функции, "по описанию"
+                        sub_call_full_name = func_subcalls_names.get(names1c.fold(sub_call_full_name),
+                                                                     sub_call_full_name)
                         if not sub_call_full_name in implicit_called_funcs:
                             implicit_called_funcs.add(sub_call_full_name)
                             fill_implicit_called_funcs([sub_call_full_name])
 
     implicit_called_funcs = set()
+    # имена функций по их канонической форме (при совпадении - последнее, как при переборе)
+    func_subcalls_names = names1c.fold_map(func_subcalls)
     fill_implicit_called_funcs(functions_to_move)
     return implicit_called_funcs
 
@@ -167,7 +169,7 @@ def handle_form_module_func_proc(func_proc_desc, sub_call_list):
         # то подменяем параметры на сборочные.
         parts = called_func_name.split(".")
         called_func_name_short = parts[0] if len(parts) == 1 else parts[1]
-        if called_func_name_short.lower() in gl_special_calls:
+        if names1c.fold(called_func_name_short) in gl_special_calls:
             if isinstance(call, strct1c.DottedExpression):
                 call.properties_list[1].param_list[1] = strct1c.Identifier('ЭтотОбъект')
             else:
@@ -192,7 +194,7 @@ def update_primary_module_after_transfer(app_mode, module_struct):
         replacements = {'гл_iBank2_ИмяФайлаОбработки': 'ЭтотОбъект.КэшДанных.ИмяОбработки',
                         'гл_iBank2_РежимРаботы': 'ЭтотОбъект.КэшДанных.РежимРаботы'}
 
-    replacements = {key.lower(): val for key, val in replacements.items()}
+    replacements = {names1c.fold(key): val for key, val in replacements.items()}
     filter = {x for x in replacements}
 
     id_call_list = []
@@ -201,8 +203,9 @@ def update_primary_module_after_transfer(app_mode, module_struct):
 
     for rec in id_call_list:
         id_name = rec[1]
-        if id_name.lower() in replacements and isinstance(rec[0], strct1c.Identifier):
-            rec[0].id = replacements[id_name.lower()]
+        id_name = names1c.fold(id_name)
+        if id_name in replacements and isinstance(rec[0], strct1c.Identifier):
+            rec[0].id = replacements[id_name]
     pass
 
 def update_context(context):
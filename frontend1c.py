@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# frontend1c.py
+#
+# front end for 1C modules: regions and preprocessor instructions
+# are processed as events of the token stream of a single lexer pass
+# ------------------------------------------------------------
+from epfcomp import lexer1c
+from epfcomp import names1c
+from epfcomp import preproc1c
+import bisect
+import re
+
+DEF_IF_CODE = lexer1c.TOKEN_CODES['DEF_IF']
+DEF_ELSE_IF_CODE = lexer1c.TOKEN_CODES['DEF_ELSE_IF']
+DEF_ELSE_CODE = lexer1c.TOKEN_CODES['DEF_ELSE']
+DEF_END_IF_CODE = lexer1c.TOKEN_CODES['DEF_END_IF']
+DEF_AREA_CODE = lexer1c.TOKEN_CODES['DEF_AREA']
+DEF_END_AREA_CODE = lexer1c.TOKEN_CODES['DEF_END_AREA']
+DEF_UNKNOWN_CODE = lexer1c.TOKEN_CODES[lexer1c.UNKNOWN_DIRECTIVE]
+THEN_CODE = lexer1c.TOKEN_CODES['THEN']
+
+# Поиск инструкций препроцессора и областей по колонке кодов типов токенов (см. lexer1c.TokenBuffer.types)
+DIRECTIVES_RE = re.compile(b'[' + re.escape(bytes([DEF_IF_CODE, DEF_ELSE_IF_CODE, DEF_ELSE_CODE, DEF_END_IF_CODE,
+                                                   DEF_AREA_CODE, DEF_END_AREA_CODE, DEF_UNKNOWN_CODE])) + b']')
+
+# Операции условия препроцессора в том виде, в котором их принимает preproc1c.eval_condition()
+CONDITION_OPERATORS = {
+    lexer1c.TOKEN_CODES['NOT']: 'не',
+    lexer1c.TOKEN_CODES['AND']: 'и',
+    lexer1c.TOKEN_CODES['OR']: 'или',
+    lexer1c.TOKEN_CODES['LPAREN']: '(',
+    lexer1c.TOKEN_CODES['RPAREN']: ')',
+}
+
+def get_line_text(buffer, index):
+    # текст строки модуля, начиная с токена index - для сообщений об ошибках
+    start = buffer.starts[index]
+    end = buffer.data.find('\n', start)
+    return buffer.data[start:] if end == -1 else buffer.data[start:end]
+
+def get_condition_tokens(buffer, index, line_end):
+    '''
+    Выделяет условие инструкции препроцессора: токены между инструкцией и "Тогда" на строке инструкции.
+    @param buffer (lexer1c.TokenBuffer): токены модуля
+    @param index (int): индекс токена инструкции
+    @param line_end (int): индекс первого токена следующей строки
+    @return (list): токены условия для preproc1c.eval_condition()
+    '''
+    result = []
+    for token_index in range(index + 1, line_end):
+        code = buffer.types[token_index]
+        if code == THEN_CODE:
+            return result
+        result.append(CONDITION_OPERATORS.get(code) or names1c.fold(buffer.value(token_index)))
+    raise Exception("Не верная инструкция препроцессора: " + get_line_text(buffer, index))
+
+def preprocess(buffer, mode, areas_to_delete=[], symbols_to_retain=[]):
+    '''
+    Вычисляет инструкции препроцессора и удаляет области в потоке токенов модуля - так же,
+    как preproc1c.Preprocessor1C.execute() в тексте модуля, но за один проход по токенам:
+    строка инструкции (от инструкции до конца строки) удаляется или сохраняется целиком,
+    участки между инструкциями копируются в результат срезами колонок буфера.
+    Инструкции внутри строковых литералов и комментариев инструкциями не считаются.
+    Неизвестная инструкция препроцессора - ошибка, если она не в удаляемой области или невыбранной ветви.
+    В отличие от Preprocessor1C условие #ИначеЕсли вычисляется (а не выбирается как #Иначе),
+    а строка, следующая за #КонецЕсли вложенного блока сохраняемой ветви, не пропускается.
+
+    @param buffer (lexer1c.TokenBuffer): токены исходного текста модуля (см. lexer1c.tokenize())
+    @param mode (str): контекст исполнения кода 1С, см. preproc1c.Preprocessor1C.do_preproc()
+    @param areas_to_delete (list): названия областей, которые необходимо вырезать
+    @param symbols_to_retain (list): символы препроцессора, блоки с условиями только из этих символов
+                                     сохраняются "как есть", после их #КонецЕсли добавляется ";"
+                                     (см. utils.add_semicolon_after_preproc())
+    @return (lexer1c.TokenBuffer): токены модуля для синтаксического разбора, позиции и номера строк - в исходном тексте
+    '''
+    areas_to_delete = {names1c.fold(name) for name in areas_to_delete}
+    result = lexer1c.TokenBuffer(buffer.data)
+    types = buffer.types
+    lines = buffer.lines
+
+    # Блоки #Если .. #КонецЕсли: [выводится ли код вокруг блока, выбрана ли уже ветвь, сохраняется ли блок "как есть"]
+    blocks = []
+    # Выводятся ли токены текущей ветви
+    emit = True
+    # Уровень вложенности областей внутри удаляемой области, 0 - вне удаляемой области
+    deleted_level = 0
+    # Первый токен, еще не перенесенный в результат и не пропущенный
+    pos = 0
+
+    for match in DIRECTIVES_RE.finditer(types.tobytes()):
+        index = match.start()
+        if index < pos:
+            # вторая инструкция на строке инструкции - строка уже обработана целиком
+            continue
+        if emit and not deleted_level:
+            result.extend(buffer, pos, index)
+        line_end = bisect.bisect_right(lines, lines[index], index)
+        pos = line_end
+        code = types[index]
+
+        if deleted_level:
+            if code == DEF_AREA_CODE:
+                deleted_level += 1
+            elif code == DEF_END_AREA_CODE:
+                deleted_level -= 1
+        elif code == DEF_UNKNOWN_CODE:
+            if emit:
+                raise Exception("Не верная инструкция препроцессора: " + get_line_text(buffer, index))
+        elif code == DEF_AREA_CODE:
+            if index + 1 == line_end:
+                raise Exception("Не указано имя области: " + get_line_text(buffer, index))
+            if names1c.fold(buffer.value(index + 1)) in areas_to_delete:
+                deleted_level = 1
+        elif code == DEF_END_AREA_CODE:
+            pass
+        elif code == DEF_IF_CODE:
+            if emit:
+                condition = get_condition_tokens(buffer, index, line_end)
+                retain = preproc1c.condition_should_be_retained(condition, symbols_to_retain)
+                chosen = bool(preproc1c.eval_condition(condition, mode)) or retain
+                if retain:
+                    result.extend(buffer, index, line_end)
+                blocks.append([True, chosen, retain])
+                emit = chosen
+            else:
+                # внутри невыбранной ветви условия вложенных блоков не вычисляются
+                blocks.append([False, True, False])
+        elif not blocks:
+            # #Иначе, #КонецЕсли без #Если остаются в потоке токенов
+            result.extend(buffer, index, line_end)
+        else:
+            outer_emit, chosen, retain = blocks[-1]
+            if code == DEF_END_IF_CODE:
+                blocks.pop()
+                if outer_emit and retain:
+                    result.extend(buffer, index, index + 1)
+                    end = buffer.ends[index]
+                    result.append('SEMI', end, end, lines[index], ';')
+                    result.extend(buffer, index + 1, line_end)
+                emit = outer_emit
+            elif outer_emit:
+                if retain:
+                    result.extend(buffer, index, line_end)
+                    emit = True
+                elif chosen:
+                    emit = False
+                elif code == DEF_ELSE_IF_CODE:
+                    emit = bool(preproc1c.eval_condition(get_condition_tokens(buffer, index, line_end), mode))
+                else:
+                    emit = True
+                blocks[-1][1] = chosen or emit
+
+    if blocks or deleted_level:
+        raise Exception("Не найдено окончание " + ("инструкции препроцессора #Если" if blocks else "области"))
+    result.extend(buffer, pos, len(types))
+    return result
+
+def tokenize(data, mode, areas_to_delete=[], symbols_to_retain=[]):
+    '''
+    Выполняет лексический разбор исходного текста модуля и обработку областей и препроцессора (см. preprocess()).
+    @param data (str): исходный текст модуля
+    @return (lexer1c.TokenBuffer): токены модуля для синтаксического разбора
+    '''
+    return preprocess(lexer1c.tokenize(data), mode, areas_to_delete, symbols_to_retain)
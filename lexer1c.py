@@ -6,9 +6,27 @@
 # tokenizer for a 1C:Enterprise embedded language "1C"
 # ------------------------------------------------------------
 import ply.lex as lex
+from epfcomp import names1c
+from array import array
+import bisect
+import hashlib
+import os
 import re
 import sys
 
+# Ревизия правил лексера. Увеличивается вручную, если меняется логика функций-правил
+# без изменения их регулярных выражений (см. LEXER_VERSION).
+LEXER_REVISION = 3
+
+# В режиме таблиц лексер при первом обращении загружается из сгенерированного модуля lextab1c
+# (без повторной проверки правил), иначе строится из правил этого модуля.
+LEXTAB_MODE_ON = True
+
+# Реализация лексического разбора текста модуля в буфер токенов (см. tokenize()):
+#   'scanner' - сканер на одном общем регулярном выражении (scanner1c), поток токенов совпадает с ply;
+#   'ply' - лексер ply, построенный из правил этого модуля.
+LEXER_BACKEND = 'scanner'
+
 states = (
    ('compstring','exclusive'),
 )
@@ -54,6 +72,64 @@ reserved = {
     'возврат'           : 'RETURN'
 }
 
+# reserved words of the English syntax
+reserved_en = {
+    '#if'               : 'DEF_IF',
+    '#elsif'            : 'DEF_ELSE_IF',
+    '#else'             : 'DEF_ELSE',
+    '#endif'            : 'DEF_END_IF',
+    'if'                : 'IF',
+    'then'              : 'THEN',
+    'elsif'             : 'ELSE_IF',
+    'else'              : 'ELSE',
+    'endif'             : 'END_IF',
+    'for'               : 'FOR',
+    'to'                : 'TO',
+    'in'                : 'FROM',
+    'while'             : 'WHILE',
+    'do'                : 'DO',
+    'enddo'             : 'END_DO',
+    'continue'          : 'CONTINUE',
+    'break'             : 'BREAK',
+    'function'          : 'FUNCTION',
+    'endfunction'       : 'END_FUNCTION',
+    'procedure'         : 'PROCEDURE',
+    'endprocedure'      : 'END_PROCEDURE',
+    'goto'              : 'GOTO',
+    'undefined'         : 'UNDEFINED',
+    'val'               : 'VAL',
+    'var'               : 'VAR',
+    'export'            : 'EXPORT',
+    'true'              : 'TRUE',
+    'false'             : 'FALSE',
+    'not'               : 'NOT',
+    'and'               : 'AND',
+    'or'                : 'OR',
+    'new'               : 'NEW',
+    'try'               : 'TRY',
+    'except'            : 'EXCEPTION',
+    'endtry'            : 'END_TRY',
+    'raise'             : 'RAISE',
+    'return'            : 'RETURN'
+}
+
+# Зарезервированные слова обоих вариантов синтаксиса - одна хеш-таблица по канонической форме слова
+# (names1c.fold()), поэтому поиск занимает одно обращение к словарю независимо от количества слов
+reserved.update(reserved_en)
+
+# Инструкции областей. В список токенов синтаксического процессора не входят:
+# области вырезаются из потока токенов до синтаксического разбора (см. frontend1c)
+areas = {
+    '#область'          : 'DEF_AREA',
+    '#конецобласти'     : 'DEF_END_AREA',
+    '#region'           : 'DEF_AREA',
+    '#endregion'        : 'DEF_END_AREA',
+}
+
+# Тип токена неизвестной инструкции препроцессора. В список токенов синтаксического процессора не входит:
+# инструкция в удаляемой области или невыбранной ветви вырезается, в сохраняемом коде - ошибка (см. frontend1c)
+UNKNOWN_DIRECTIVE = 'DEF_UNKNOWN'
+
 # List of token names. This is always required.
 tokens = [
    'STRING',
@@ -84,7 +160,7 @@ tokens = [
    'ID', 
    'FOR_EACH',
    'DIRECTIVE',
-   'LABEL'] + list(reserved.values())
+   'LABEL'] + list(dict.fromkeys(reserved.values()))
 
 # Regular expression rules for simple tokens
 t_STRING    = r'"(?:[^"]|"")*"'
@@ -114,12 +190,13 @@ t_COLON     = r':'
 
 def t_preprocessor(t):
     r'\#[a-zA-Zа-яА-Я_][a-zA-Zа-яА-Я_0-9]*'
-    t.type = reserved.get(t.value.lower(), 'invalid preprocessor instruction: ' + t.value)
+    folded = names1c.fold(t.value)
+    t.type = reserved.get(folded) or areas.get(folded, UNKNOWN_DIRECTIVE)
     return t
 
 # double identificator
 def t_FOR_EACH(t):
-    r'для[\s]*каждого'
+    r'для[\s]*каждого|for[\s]*each\b'
     t.type  = 'FOR_EACH'
     t.value = 'Для Каждого'
     return t
@@ -127,7 +204,12 @@ def t_FOR_EACH(t):
 # identificator
 def t_ID(t):
     r'[a-zA-Zа-яА-Я_][a-zA-Zа-яЁёА-Я_0-9]*'
-    t.type = reserved.get(t.value.lower(), 'ID')
+    t.value = names1c.intern(t.value)
+    t.type = reserved.get(names1c.fold(t.value), 'ID')
+    if t.type != 'ID' and t.lexer.last_type == 'DOT':
+        # имя свойства или метода после точки (Сообщение.To, Запрос.Новый) - идентификатор,
+        # даже если совпадает с зарезервированным словом (см. Lexer1C)
+        t.type = 'ID'
     return t
 
 # A regular expression rule with some action code
@@ -159,24 +241,29 @@ def t_error(t):
 def t_compstring(t):
     '\"'
     t.lexer.begin('compstring')
-    t.value = ""
-    while lexer.lexstate == 'compstring':
-        curr = t.lexer.next()
-        t.value += curr.value
+    # части литерала собираются в список и соединяются один раз - длинные многострочные литералы
+    # (тексты запросов, шаблоны) разбираются за линейное время
+    parts = []
+    while t.lexer.lexstate == 'compstring':
+        parts.append(t.lexer.next().value)
+    t.value = ''.join(parts)
     t.type = 'STRING'
     return t
 
 def t_compstring_next_block_type(t):
     r'[^"\n]{1,}'
     t.type = 'STRING'
+    quotes = 0
     while (t.lexer.lexdata[t.lexer.lexpos] == '"'):
         if (t.lexer.lexdata[t.lexer.lexpos+1] == '"'):
             t.lexer.lexpos += 2
-            t.value += '"'
+            quotes += 1
         else:
             t.lexer.lexpos += 1
             t.lexer.begin('INITIAL')
             break
+    if quotes:
+        t.value += '"' * quotes
     return t
 
 def t_compstring_quotes(t):
@@ -212,11 +299,364 @@ def t_compstring_error(t):
     print("== string state processing error: %s" % str(t))
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex(reflags=re.I)
+## lexer building
+
+def get_rules_signature():
+    '''
+    Вычисляет хеш правил лексера: состояний, зарезервированных слов, токенов и регулярных выражений
+    всех правил в порядке их определения.
+    @return (str): сокращенный sha1 правил
+    '''
+    parts = [repr(states), repr(sorted(reserved.items())), repr(sorted(areas.items())), UNKNOWN_DIRECTIVE, repr(tokens)]
+    for name, value in globals().items():
+        if name.startswith('t_'):
+            parts.append(name + ':' + (value if isinstance(value, str) else value.__doc__ or ''))
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:12]
+
+# Версия лексера: ревизия и хеш правил. Используется для проверки актуальности lextab1c.
+LEXER_VERSION = '%d.%s' % (LEXER_REVISION, get_rules_signature())
+
+LEXTAB_MODULE = 'lextab1c'
+
+class Lexer1C(lex.Lexer):
+    '''
+    Лексер ply, запоминающий тип последнего возвращенного токена: t_ID проверяет, что слово следует
+    за токеном точки (комментарии и переводы строк токенов не образуют).
+    '''
+
+    # тип последнего возвращенного токена, None - в начале текста
+    last_type = None
+
+    def input(self, s):
+        super().input(s)
+        self.last_type = None
+
+    def token(self):
+        tok = super().token()
+        if tok is not None:
+            self.last_type = tok.type
+        return tok
+
+# Лексер строится при первом обращении, см. get_lexer()
+__gl_lexer = None
+
+def get_lexer():
+    '''
+    Возвращает лексер, при первом обращении строит его.
+    В режиме LEXTAB_MODE_ON мастер-выражения загружаются из lextab1c, если версия таблиц
+    совпадает с LEXER_VERSION, иначе лексер строится из правил модуля (без записи таблиц на диск).
+    @return (Lexer1C): лексер
+    '''
+    global __gl_lexer
+    if __gl_lexer is None:
+        lextab = None
+        if LEXTAB_MODE_ON:
+            try:
+                from epfcomp import lextab1c as lextab
+            except ImportError:
+                pass
+            if lextab is not None and getattr(lextab, '_lexversion', None) != LEXER_VERSION:
+                lextab = None
+        if lextab is not None:
+            built = lex.lex(optimize=True, lextab=lextab)
+            # в оптимизированном режиме ply не проверяет типы токенов, возвращаемые функциями-правилами
+            # (например, неизвестные инструкции препроцессора) - сохраняем проверку
+            built.lexoptimize = False
+        else:
+            built = lex.lex(reflags=re.I)
+        # инструкции областей и неизвестные инструкции - допустимые типы токенов лексера
+        # (в tokens они не входят, см. areas, UNKNOWN_DIRECTIVE)
+        built.lextokens_all = built.lextokens_all | set(areas.values()) | {UNKNOWN_DIRECTIVE}
+        # ply создает экземпляр ply.lex.Lexer, класс задается после построения
+        built.__class__ = Lexer1C
+        __gl_lexer = built
+    return __gl_lexer
+
+def new_lexer():
+    '''
+    Возвращает независимый экземпляр лексера. Экземпляры разделяют только неизменяемые
+    мастер-выражения и функции-правила, поэтому несколько модулей можно разбирать одновременно.
+    @return (Lexer1C): новый лексер
+    '''
+    lexer = get_lexer().clone()
+    lexer.lexstatestack = []
+    lexer.lineno = 1
+    lexer.begin('INITIAL')
+    return lexer
+
+## token buffer
+
+# Коды типов токенов в TokenBuffer - индексы в TOKEN_TYPES
+TOKEN_TYPES = tuple(tokens) + tuple(dict.fromkeys(areas.values())) + (UNKNOWN_DIRECTIVE,)
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_TYPES)}
+STRING_CODE = TOKEN_CODES['STRING']
+ID_CODE = TOKEN_CODES['ID']
+
+class TokenBuffer:
+    '''
+    Колоночное хранилище токенов модуля: коды типов, границы токенов в исходном тексте и номера строк
+    хранятся в компактных массивах, значение токена вырезается из исходного текста при обращении.
+    Отдельно (в словаре values) хранятся только значения, отличные от среза текста: строковые литералы,
+    "Для Каждого", синтетические токены.
+    '''
+
+    # исходный текст модуля
+    data = ""
+
+    def __init__(self, data):
+        self.data = data
+        self.types = array('B')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+        self.values = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def append(self, type, start, end, lineno, value=None):
+        '''
+        Добавляет токен в буфер.
+        @param type (str): тип токена
+        @param start, end (int): границы токена в исходном тексте
+        @param lineno (int): номер строки начала токена
+        @param value (str): значение, если оно отличается от среза исходного текста
+        '''
+        if value is not None and value != self.data[start:end]:
+            self.values[len(self.types)] = value
+        self.types.append(TOKEN_CODES[type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(lineno)
+
+    def type(self, index):
+        return TOKEN_TYPES[self.types[index]]
+
+    def value(self, index):
+        value = self.values.get(index)
+        if value is None:
+            value = self.data[self.starts[index]:self.ends[index]]
+        return value
+
+    def end_line(self, index):
+        '''
+        @return (int): номер строки, на которой заканчивается токен
+        '''
+        lineno = self.lines[index]
+        if self.types[index] == STRING_CODE:
+            # как и лексер, учитываем переводы строк только внутри строковых литералов
+            # (t_FOR_EACH перевод строки между "Для" и "Каждого" не учитывает)
+            lineno += self.data.count('\n', self.starts[index], self.ends[index])
+        return lineno
+
+    def nbytes(self):
+        '''
+        @return (int): размер колонок буфера в байтах (без исходного текста и словаря значений)
+        '''
+        return sum(column.itemsize * len(column) for column in (self.types, self.starts, self.ends, self.lines))
+
+    def reader(self, start=0, stop=None):
+        '''
+        @return (TokenReader): поток токенов буфера в диапазоне [start, stop) для синтаксического разбора
+        '''
+        return TokenReader(self, start, stop)
+
+    def extend(self, other, start=0, stop=None, pos_delta=0, line_delta=0):
+        '''
+        Добавляет в конец буфера токены другого буфера со сдвигом позиций и номеров строк.
+        @param other (TokenBuffer): буфер-источник, его текст на участке токенов должен совпадать со сдвинутым участком текста буфера
+        @param start, stop (int): диапазон токенов источника
+        @param pos_delta (int): сдвиг позиций в тексте
+        @param line_delta (int): сдвиг номеров строк
+        '''
+        stop = len(other) if stop is None else stop
+        base = len(self.types) - start
+        self.types.extend(other.types[start:stop])
+        if pos_delta:
+            self.starts.extend(pos + pos_delta for pos in other.starts[start:stop])
+            self.ends.extend(pos + pos_delta for pos in other.ends[start:stop])
+        else:
+            self.starts.extend(other.starts[start:stop])
+            self.ends.extend(other.ends[start:stop])
+        if line_delta:
+            self.lines.extend(lineno + line_delta for lineno in other.lines[start:stop])
+        else:
+            self.lines.extend(other.lines[start:stop])
+        values = other.values
+        if stop - start < len(values):
+            # короткий диапазон (например, участок между инструкциями препроцессора) - без обхода всех значений
+            for index in range(start, stop):
+                value = values.get(index)
+                if value is not None:
+                    self.values[index + base] = value
+        else:
+            for index, value in values.items():
+                if start <= index < stop:
+                    self.values[index + base] = value
+
+class TokenReader:
+    '''
+    Поток токенов TokenBuffer с интерфейсом лексера ply (token(), lineno), который принимает yacc.
+    Объекты токенов создаются по одному в момент чтения и не накапливаются.
+    '''
+
+    def __init__(self, buffer, start=0, stop=None):
+        self.buffer = buffer
+        self.index = start
+        self.stop = len(buffer) if stop is None else stop
+        self.lineno = buffer.lines[start] if start < self.stop else 1
+
+    def token(self):
+        index = self.index
+        if index >= self.stop:
+            return None
+        self.index = index + 1
+        buffer = self.buffer
+        tok = lex.LexToken()
+        code = buffer.types[index]
+        tok.type = TOKEN_TYPES[code]
+        tok.value = buffer.value(index)
+        if code == ID_CODE:
+            # одинаковые идентификаторы в структуре модуля - один объект строки (см. names1c)
+            tok.value = names1c.intern(tok.value)
+        tok.lineno = buffer.lines[index]
+        tok.lexpos = buffer.starts[index]
+        # конец токена в тексте - для записи позиций узлов (см. parser1c.new_positions_productions())
+        tok.endlexpos = buffer.ends[index]
+        tok.lexer = self
+        self.lineno = buffer.end_line(index)
+        return tok
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+def tokenize(data, lexer=None):
+    '''
+    Выполняет лексический разбор текста модуля в колоночный буфер токенов.
+    @param data (str): текст модуля
+    @param lexer (ply.lex.Lexer): лексер ply для разбора, если не задан - разбор выполняется
+                                  реализацией LEXER_BACKEND (для ply - новым экземпляром лексера, см. new_lexer())
+    @return (TokenBuffer): токены модуля
+    '''
+    if lexer is None:
+        if LEXER_BACKEND == 'scanner':
+            from epfcomp import scanner1c
+            return scanner1c.tokenize(data)
+        lexer = new_lexer()
+    lexer.lineno = 1
+    lexer.input(data)
+    buffer = TokenBuffer(data)
+    append = buffer.append
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            break
+        # после возврата токена позиция лексера - конец токена (в т.ч. для строк, прочитанных в t_compstring)
+        append(tok.type, tok.lexpos, lexer.lexpos, tok.lineno, tok.value)
+    return buffer
+
+def line_offset(data, lineno):
+    '''
+    @return (int): позиция начала строки lineno (нумерация с 1) в тексте, len(data) - если строк меньше
+    '''
+    pos = 0
+    for _ in range(lineno - 1):
+        pos = data.find('\n', pos) + 1
+        if pos == 0:
+            return len(data)
+    return pos
+
+def relex(prev, data, first_line, last_line, lexer=None):
+    '''
+    Выполняет инкрементальный лексический разбор измененного текста модуля.
+    Разбор начинается с токена, предшествующего измененным строкам (токен может продолжаться
+    на следующей строке: "Для" + "Каждого", многострочная строка с "|"), и продолжается до
+    синхронизации с прежним разбором - первого токена после измененных строк, который начинается
+    на той же позиции неизмененного хвоста текста, что и один из прежних токенов. Начиная с этого
+    токена лексер проходит тот же текст в том же состоянии, поэтому остальные токены копируются
+    из прежнего буфера со сдвигом позиций и номеров строк.
+
+    @param prev (TokenBuffer): токены прежнего текста модуля
+    @param data (str): новый текст модуля
+    @param first_line, last_line (int): диапазон измененных строк нового текста (нумерация с 1, включительно),
+                                        текст до first_line и после last_line совпадает с прежним;
+                                        для удаления строк last_line = first_line - 1
+    @param lexer (ply.lex.Lexer): лексер для разбора, по умолчанию - новый экземпляр (см. new_lexer())
+    @return (TokenBuffer): токены нового текста, совпадают с результатом tokenize(data)
+    '''
+    pos_delta = len(data) - len(prev.data)
+    edit_start = line_offset(data, first_line)
+    edit_end = line_offset(data, last_line + 1)
+
+    # первый токен, заканчивающийся после начала изменений, и предшествующий ему токен - точка перезапуска
+    restart = max(bisect.bisect_right(prev.ends, edit_start) - 1, 0)
+    buffer = TokenBuffer(data)
+    buffer.extend(prev, 0, restart)
+
+    lexer = lexer or new_lexer()
+    lexer.input(data)
+    # t_ID учитывает предыдущий токен: зарезервированное слово после точки - идентификатор
+    lexer.last_type = prev.type(restart - 1) if restart else None
+    if restart < len(prev):
+        lexer.lexpos = min(prev.starts[restart], edit_start)
+        lexer.lineno = prev.lines[restart] if lexer.lexpos == prev.starts[restart] else first_line
+    else:
+        lexer.lexpos = edit_start
+        lexer.lineno = first_line
+
+    append = buffer.append
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            return buffer
+        if tok.lexpos >= edit_end:
+            old_pos = tok.lexpos - pos_delta
+            index = bisect.bisect_left(prev.starts, old_pos)
+            # тип токена сверяется: зарезервированное слово после точки в измененных строках - идентификатор
+            if index < len(prev) and prev.starts[index] == old_pos and prev.types[index] == TOKEN_CODES[tok.type]:
+                # сдвиг номеров строк берется по счетчику лексера, а не по количеству переводов строк:
+                # t_FOR_EACH не учитывает перевод строки между "Для" и "Каждого"
+                buffer.extend(prev, index, None, pos_delta, tok.lineno - prev.lines[index])
+                return buffer
+        append(tok.type, tok.lexpos, lexer.lexpos, tok.lineno, tok.value)
+
+def __getattr__(name):
+    # совместимость: lexer1c.lexer - лексер, построенный при первом обращении
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+def write_lextab(outputdir=None):
+    '''
+    Генерирует модуль таблиц лексера lextab1c для текущей версии правил.
+    Модуль записывается в кодировке utf-8 и дополняется версией лексера _lexversion.
+    @param outputdir (str): каталог для записи, по умолчанию - каталог пакета
+    @return (str): путь к записанному модулю
+    '''
+    outputdir = outputdir or os.path.dirname(os.path.abspath(__file__))
+    file_name = os.path.join(outputdir, LEXTAB_MODULE + '.py')
+    lex.lex(reflags=re.I).writetab(LEXTAB_MODULE, outputdir)
+    # ply пишет таблицы в кодировке по умолчанию - перезаписываем в utf-8
+    with open(file_name) as f:
+        text = f.read()
+    with open(file_name, 'w', encoding='utf-8') as f:
+        f.write('# -*- coding: utf-8 -*-\n')
+        f.write(text)
+        f.write('_lexversion   = %s\n' % repr(LEXER_VERSION))
+    return file_name
 
 if __name__ == '__main__':
+    if sys.argv[1:] == ['--lextab']:
+        print(write_lextab())
+        sys.exit()
     data = open("samples/sample.1c", encoding='utf-8').read()
+    lexer = get_lexer()
     lexer.input(data)
     for lextoken in lexer:
         print(lextoken, lexer.lexstate)
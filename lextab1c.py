@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# lextab1c.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BREAK', 'COLON', 'COMMA', 'CONTINUE', 'DATE', 'DEF_ELSE', 'DEF_ELSE_IF', 'DEF_END_IF', 'DEF_IF', 'DIRECTIVE', 'DIVIDE', 'DO', 'DOT', 'ELSE', 'ELSE_IF', 'END_DO', 'END_FUNCTION', 'END_IF', 'END_PROCEDURE', 'END_TRY', 'EQ', 'EXCEPTION', 'EXPORT', 'FALSE', 'FOR', 'FOR_EACH', 'FROM', 'FUNCTION', 'GE', 'GOTO', 'GT', 'ID', 'IF', 'LABEL', 'LE', 'LPAREN', 'LSB', 'LT', 'MINUS', 'MOD', 'NEW', 'NOT', 'NOT_EQ', 'NUMBER', 'OR', 'PLUS', 'PROCEDURE', 'QSTN', 'RAISE', 'RETURN', 'RPAREN', 'RSB', 'SEMI', 'STRING', 'THEN', 'TIMES', 'TO', 'TRUE', 'TRY', 'UNDEFINED', 'VAL', 'VAR', 'WHILE'))
+_lexreflags   = 2
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'compstring': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_preprocessor>\\#[a-zA-Zа-яА-Я_][a-zA-Zа-яА-Я_0-9]*)|(?P<t_FOR_EACH>для[\\s]*каждого|for[\\s]*each\\b)|(?P<t_ID>[a-zA-Zа-яА-Я_][a-zA-Zа-яЁёА-Я_0-9]*)|(?P<t_NUMBER>\\d+\\.\\d+|\\d+)|(?P<t_comment>\\/\\/.*)|(?P<t_newline>\\n+)|(?P<t_compstring>")|(?P<t_LABEL>~[a-zA-Zа-яА-Я_][a-zA-Zа-яА-Я_0-9]*)|(?P<t_DIRECTIVE>&[a-zA-Zа-яА-Я]*)|(?P<t_STRING>"(?:[^"]|"")*")|(?P<t_DATE>\\\'(\\d|-)+\\\')|(?P<t_NOT_EQ>\\<\\>)|(?P<t_LE>\\<=)|(?P<t_GE>\\>=)|(?P<t_LSB>\\[)|(?P<t_RSB>\\])|(?P<t_QSTN>\\?)|(?P<t_LT>\\<)|(?P<t_GT>\\>)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_DOT>\\.)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_EQ>=)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MOD>%)|(?P<t_COMMA>,)|(?P<t_SEMI>;)|(?P<t_COLON>:)', [None, ('t_preprocessor', 'preprocessor'), ('t_FOR_EACH', 'FOR_EACH'), ('t_ID', 'ID'), ('t_NUMBER', 'NUMBER'), ('t_comment', 'comment'), ('t_newline', 'newline'), ('t_compstring', 'compstring'), (None, 'LABEL'), (None, 'DIRECTIVE'), (None, 'STRING'), (None, 'DATE'), None, (None, 'NOT_EQ'), (None, 'LE'), (None, 'GE'), (None, 'LSB'), (None, 'RSB'), (None, 'QSTN'), (None, 'LT'), (None, 'GT'), (None, 'PLUS'), (None, 'TIMES'), (None, 'DOT'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'EQ'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MOD'), (None, 'COMMA'), (None, 'SEMI'), (None, 'COLON')])], 'compstring': [('(?P<t_compstring_next_block_type>[^"\\n]{1,})|(?P<t_compstring_quotes>\\")|(?P<t_compstring_newline>\\n\\s*\\|)|(?P<t_compstring_newline_withcomment>\\n\\s*\\/\\/.*)', [None, ('t_compstring_next_block_type', 'next_block_type'), ('t_compstring_quotes', 'quotes'), ('t_compstring_newline', 'newline'), ('t_compstring_newline_withcomment', 'newline_withcomment')])]}
+_lexstateignore = {'INITIAL': ' \t\ufeff', 'compstring': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'compstring': 't_compstring_error'}
+_lexstateeoff = {}
+_lexversion   = '3.3244b35805c7'
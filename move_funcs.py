@@ -2,6 +2,7 @@
 
 from epfcomp.base_const import *
 from epfcomp import  custom_handlers
+from epfcomp import  names1c
 from epfcomp import  strct1c
 from epfcomp import  utils
 import copy
@@ -68,7 +69,7 @@ def transfer_functions_to_dataprocessor_module(context, dataproc_module_config,
 
     # Перенос в модуль основной формы глобальных переменных
     for gl_var_desc in context.gl_app_module[APP_TYPE_ORDINARY]['struct'].global_vars_list:
-        if object_name.lower() in gl_var_desc.vars_list[0].name.lower():
+        if names1c.fold(object_name) in names1c.fold(gl_var_desc.vars_list[0].name):
             gl_var_desc_new = copy.deepcopy(gl_var_desc)
             gl_var_desc_new.directive = None
             # Возможно не все переменные в модуле объекта должны быть экспортными, но что бы не делать
@@ -201,16 +202,17 @@ def fill_secondary_forms_config(context, build_params, primary_form_config, seco
        то вызов заменяется на обращение к основной форме.
     """
 
-    for full_func_name, sub_calls in context.gl_func_subcalls[APP_TYPE_MANAGED].items():
+    for full_func_name in context.gl_func_subcalls[APP_TYPE_MANAGED]:
         # full_func_name = 'FormManaged.СписокДоверенныхПолучателей.ДоверенныеПолучатели_ЭкземплярСистемыПриИзменении'
-        # sub_calls = gl_func_subcalls[APP_TYPE_MANAGED].get(full_func_name)
         parts = full_func_name.split(".")
         if parts[0] != FORM_MANAGED or parts[1] == build_params.main_managed_form:
             # отбираем только вспомогательные формы
             continue
+        # вызовы вычисляются при обращении (см. context.FuncSubcallsType) - только для функций вспомогательных форм
+        sub_calls = context.gl_func_subcalls[APP_TYPE_MANAGED].get(full_func_name)
 
         force_move_to_form = False
-        directive = context.gl_all_funcs_desc[APP_TYPE_MANAGED][full_func_name].directive.lower()
+        directive = names1c.fold(context.gl_all_funcs_desc[APP_TYPE_MANAGED][full_func_name].directive)
         if directive == "&насервере" or directive == "&насерверебезконтекста":
             # это "чистый" серверный вызов - все клиент-серверные процедуры
             # и функции необходимо переносить в форму
@@ -398,7 +400,7 @@ def transfer_functions_to_main_form(context, move_config, build_params):
 
     # Перенос в модуль основной формы глобальных переменных.
     for gl_var_desc in context.gl_app_module[APP_TYPE_MANAGED]['struct'].global_vars_list:
-        if build_params.object_name.lower() in gl_var_desc.vars_list[0].name.lower():
+        if names1c.fold(build_params.object_name) in names1c.fold(gl_var_desc.vars_list[0].name):
             gl_var_desc_new = copy.deepcopy(gl_var_desc)
             gl_var_desc_new.directive = "&НаКлиенте"
             main_form_struct.global_vars_list.append(gl_var_desc_new)
@@ -422,8 +424,8 @@ def transfer_functions_to_secondary_form(context, move_config, object_name):
 
     vars_list = set()
     for gl_var_desc in context.gl_app_module[APP_TYPE_ORDINARY]['struct'].global_vars_list:
-        if object_name.lower() in gl_var_desc.vars_list[0].name.lower():
-            vars_list.add(gl_var_desc.vars_list[0].name.lower())
+        if names1c.fold(object_name) in names1c.fold(gl_var_desc.vars_list[0].name):
+            vars_list.add(names1c.fold(gl_var_desc.vars_list[0].name))
 
     # Готовим конструкцию для замены обращения к глобальной переменной.
     # Например, в модуле управляемого приложения была перменная гл_Subsys_НастройкиПрограммы,
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# names1c.py
+#
+# case-folded name table for 1C identifiers
+# ------------------------------------------------------------
+import sys
+
+# Таблица имен: написание имени -> каноническая форма (нижний регистр, интернированная строка).
+# Заполняется при лексическом разборе и при первом обращении к имени, поэтому каждое написание
+# приводится к нижнему регистру один раз за время работы.
+__gl_folded = {}
+
+def fold(name):
+    '''
+    Возвращает каноническую форму имени 1С без учета регистра.
+    Для имен, совпадающих без учета регистра, возвращается один и тот же объект строки,
+    поэтому сравнение канонических форм сводится к сравнению ссылок.
+    @param name (str): имя в любом регистре
+    @return (str): имя в нижнем регистре
+    '''
+    folded = __gl_folded.get(name)
+    if folded is None:
+        folded = sys.intern(name.lower())
+        __gl_folded[sys.intern(name)] = folded
+    return folded
+
+def get_folded_lookup():
+    '''
+    Возвращает функцию поиска в таблице имен для горячих циклов (без вызова fold() для уже известных написаний):
+        folded = lookup(name) or fold(name)
+    @return (function): поиск канонической формы по написанию, None - если написание еще не встречалось
+    '''
+    return __gl_folded.get
+
+def intern(name):
+    '''
+    Регистрирует имя в таблице имен (используется лексером для идентификаторов).
+    @param name (str): имя в том написании, в котором оно встретилось в тексте
+    @return (str): интернированное написание имени - для одинаковых написаний один объект строки
+    '''
+    fold(name)
+    return sys.intern(name)
+
+def fold_map(names, first_wins=False):
+    '''
+    Строит соответствие канонической формы имени самому имени.
+    @param names (iterable): имена
+    @param first_wins (bool): при совпадении канонических форм оставить первое имя, иначе - последнее
+    @return (dict): каноническая форма -> имя
+    '''
+    result = {}
+    if first_wins:
+        for name in names:
+            result.setdefault(fold(name), name)
+    else:
+        for name in names:
+            result[fold(name)] = name
+    return result
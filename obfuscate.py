@@ -1,4 +1,5 @@
 from epfcomp.base_const import *
+from epfcomp import names1c
 from random import random
 import re
 
@@ -60,12 +61,12 @@ def do_obfuscate(context, dataproc_module_config, params, form_handlers_replacem
                 raise Exception(except_text)
 
     for id in overall_ids_list:
-        replacements_dict[id.lower()] = get_obf_id()
+        replacements_dict[names1c.fold(id)] = get_obf_id()
 
     # Заполняем идентификаторов для замен обработчиков в форме
     for form_name, form_handlers in form_handlers_replacements.items():
         for handler_name in form_handlers:
-            form_handlers[handler_name] = replacements_dict.get(handler_name.lower(), None)
+            form_handlers[handler_name] = replacements_dict.get(names1c.fold(handler_name), None)
 
     log('Обфускация модуля объекта обработки')
 
@@ -86,7 +87,7 @@ def replace_ids(text, replacements_dict):
     match = regex.search(text, 0)
     while match:
         old_value = text[match.start():match.end()]
-        new_value = replacements_dict.get(old_value.lower(), '<<идентификатор замены не найден>>')
+        new_value = replacements_dict.get(names1c.fold(old_value), '<<идентификатор замены не найден>>')
         text = text[:match.start()] + new_value + text[match.end():]
         pos = match.end() - (len(old_value) - len(new_value))
         match = regex.search(text, pos)
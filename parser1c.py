@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import ply.yacc as yacc
+from array import array
+import bisect
+import copy
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import time
+from epfcomp import lexer1c
 from epfcomp import strct1c
 from epfcomp.lexer1c import *
 
@@ -13,6 +23,10 @@ precedence = (
                ('right', 'UMINUS', 'UPLUS')
 )
 
+# Леворекурсивные правила списков (statements, proc_func_list, params_list, ...) дополняют список p[1] на месте:
+# после свертки значение p[1] больше нигде не используется, поэтому список из N элементов строится за O(N),
+# без копирования накопленного списка на каждой свертке.
+
 ## content
 
 def p_module_1(p):
@@ -34,7 +48,7 @@ def p_module_4(p):
 ## global vars
 def p_global_vars_1(p):
     '''global_vars : global_vars SEMI directive VAR global_var_decl_list'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.VariablesDeclaration(p[5], p[3]))
 
 def p_global_vars_2(p):
@@ -43,7 +57,7 @@ def p_global_vars_2(p):
 
 def p_global_var_decl_list_1(p):
     '''global_var_decl_list : global_var_decl_list COMMA global_var_decl'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(p[3])
 
 def p_global_var_decl_list_2(p):
@@ -71,7 +85,7 @@ def p_directive_empty(p):
 def p_func_decls(p):
     '''proc_func_list : proc_func_list func_decl
                       | proc_func_list proc_decl'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(p[2])
 
 def p_func_decls_one(p):
@@ -99,7 +113,7 @@ def p_proc_decl_export(p):
 
 def p_init_declarator_list_1(p):
     '''declarator_list : declarator_list COMMA init_declarator'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(p[3])
 
 def p_init_declarator_list_2(p):
@@ -152,7 +166,7 @@ def p_func_body_statements(p):
 
 def p_perem_decl_list_1(p):
     '''vars_decls_list : vars_decls_list SEMI VAR vars_list'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.VariablesDeclaration(p[4]))
 
 def p_perem_decl_list_2(p):
@@ -161,7 +175,7 @@ def p_perem_decl_list_2(p):
 
 def p_perems_list_1(p):
     '''vars_list : vars_list COMMA ID'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.VarDesc(p[3]))
 
 def p_perems_list_2(p):
@@ -172,7 +186,7 @@ def p_perems_list_2(p):
 
 def p_statements_list(p):
     '''statements : statements SEMI statement'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     if not isinstance(p[3], strct1c.Empty):
         # пропускаем завершающий пустой блок
         p[0].append(p[3])
@@ -232,7 +246,7 @@ def p_else_block_empty(p):
 
 def p_else_block_1(p):
     '''else_block : else_if_collection ELSE statements'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.ElseStatement(p[3]))
 
 def p_else_block_2(p):
@@ -245,7 +259,7 @@ def p_else_block_3(p):
 
 def p_else_if_collection_1(p):
     '''else_if_collection : else_if_collection ELSE_IF expr THEN statements'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.ElseStatement(p[5], p[3]))
 
 def p_else_if_collection_2(p):
@@ -304,12 +318,12 @@ def p_preproc_else_block_empty(p):
 
 def p_preproc_else_block_1(p):
     '''preproc_else_block : preproc_else_if_collection DEF_ELSE statements'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.PreprocElse(p[3]))
 
 def p_preproc_else_block_2(p):
     '''preproc_else_block : preproc_else_if_collection'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
 
 def p_preproc_else_block_3(p):
     '''preproc_else_block : DEF_ELSE statements'''
@@ -317,7 +331,7 @@ def p_preproc_else_block_3(p):
 
 def p_preproc_else_if_collection_1(p):
     '''preproc_else_if_collection : preproc_else_if_collection DEF_ELSE_IF preproc_expr THEN statements'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(strct1c.PreprocElse(p[5], p[3]))
 
 def p_preproc_else_if_collection_2(p):
@@ -407,7 +421,12 @@ def p_expr_binary(p):
             | expr GE expr
             | expr EQ expr
             '''
-    p[0] = strct1c.BinaryExpr(p[1], p[3], p[2])
+    # левый операнд - цепочка той же операции (А + Б) + В: операнд добавляется в цепочку, см. strct1c.BinaryExpr
+    if isinstance(p[1], strct1c.BinaryExpr) and p[1].oper == p[2]:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else:
+        p[0] = strct1c.BinaryExpr(p[1], p[3], p[2])
 
 def p_expr_qstn(p):
     '''expr : QSTN LPAREN expr COMMA expr COMMA expr RPAREN'''
@@ -427,7 +446,7 @@ def p_expr_new_3(p):
 
 def p_new_params_list_1(p):
     '''new_params_list : new_params_list COMMA expr'''
-    p[0] = [x for x in p[1]]
+    p[0] = p[1]
     p[0].append(p[3])
 
 def p_new_params_list_2(p):
@@ -448,15 +467,13 @@ def p_expr_uplus(p):
 
 def p_params_list_1(p):
     '''params_list : params_list COMMA expr'''
-    res = [x for x in p[1]]
-    res += [p[3]]
-    p[0] = res
+    p[0] = p[1]
+    p[0].append(p[3])
 
 def p_params_list_2(p):
     '''params_list : params_list COMMA empty'''
-    res = [x for x in p[1]]
-    res += [p[3]]
-    p[0] = res
+    p[0] = p[1]
+    p[0].append(p[3])
 
 def p_params_list_empty(p):
     '''params_list : empty'''
@@ -502,12 +519,586 @@ def p_empty(p):
 def p_error(p):
     print("Syntax error in input on %d"  % p.lexer.lineno)
 
-# Build the parser
-parser = yacc.yacc()
+## parser building
+
+def get_grammar_signature():
+    '''
+    Вычисляет хеш грамматики: токенов, приоритетов операций и правил всех функций p_ в порядке их определения.
+    @return (str): сокращенный sha1 грамматики
+    '''
+    parts = [repr(tokens), repr(precedence)]
+    for name, value in globals().items():
+        if name.startswith('p_') and name != 'p_error' and callable(value):
+            parts.append(name + ':' + (value.__doc__ or ''))
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:12]
+
+# Версия грамматики. Используется для проверки актуальности таблиц разбора parsetab1c.
+GRAMMAR_VERSION = get_grammar_signature()
+
+PARSETAB_MODULE = 'parsetab1c'
+
+# В режиме таблиц таблицы LALR-разбора загружаются из поставляемого модуля parsetab1c (без проверки грамматики),
+# иначе строятся из грамматики этого модуля. В обоих случаях на диск ничего не записывается.
+PARSETAB_MODE_ON = True
+
+# Реализация синтаксического разбора буфера токенов (см. Parser1C.parse_tokens()):
+#   'rd' - рекурсивный спуск по этой грамматике (rdparser1c), структура модуля совпадает с ply;
+#   'lalr' - LALR-разбор ply по таблицам грамматики.
+# Модуль с синтаксической ошибкой разбирается ply: сообщения об ошибках и восстановление после них не меняются.
+PARSER_BACKEND = 'rd'
+
+# Таблицы разбора загружаются или строятся при первом обращении, см. get_lr_parser()
+__gl_lr_parser = None
+
+def get_lr_parser():
+    '''
+    Возвращает LR-парсер ply, при первом обращении загружает таблицы разбора из parsetab1c
+    (если версия таблиц совпадает с GRAMMAR_VERSION) или строит их из грамматики.
+    @return (ply.yacc.LRParser): LR-парсер
+    '''
+    global __gl_lr_parser
+    if __gl_lr_parser is None:
+        parsetab = None
+        if PARSETAB_MODE_ON:
+            try:
+                from epfcomp import parsetab1c as parsetab
+            except ImportError:
+                pass
+            if parsetab is not None and getattr(parsetab, '_grammarversion', None) != GRAMMAR_VERSION:
+                parsetab = None
+        if parsetab is not None:
+            __gl_lr_parser = yacc.yacc(optimize=True, tabmodule=parsetab, debug=False, write_tables=False)
+        else:
+            __gl_lr_parser = yacc.yacc(debug=False, write_tables=False)
+    return __gl_lr_parser
+
+def write_parsetab(outputdir=None):
+    '''
+    Генерирует модуль таблиц разбора parsetab1c для текущей версии грамматики.
+    Модуль записывается в кодировке utf-8 и дополняется версией грамматики _grammarversion.
+    @param outputdir (str): каталог для записи, по умолчанию - каталог пакета
+    @return (str): путь к записанному модулю
+    '''
+    outputdir = outputdir or os.path.dirname(os.path.abspath(__file__))
+    file_name = os.path.join(outputdir, PARSETAB_MODULE + '.py')
+    # таблицы строятся во временном каталоге под уникальным именем модуля, что бы ply
+    # не загрузил вместо построения уже существующий parsetab1c
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tabmodule = '%s_%s' % (PARSETAB_MODULE, GRAMMAR_VERSION)
+        yacc.yacc(debug=False, write_tables=True, tabmodule=tabmodule, outputdir=tmp_dir)
+        with open(os.path.join(tmp_dir, tabmodule + '.py')) as f:
+            text = f.read()
+    with open(file_name, 'w', encoding='utf-8') as f:
+        f.write('# -*- coding: utf-8 -*-\n')
+        f.write(text.replace(tabmodule, PARSETAB_MODULE))
+        f.write('_grammarversion = %s\n' % repr(GRAMMAR_VERSION))
+    return file_name
+
+## parse profiling
+
+class ParseProfile:
+    '''
+    Статистика синтаксического разбора (см. new_profiling_parser()): количество сверток и время действий
+    функций-правил грамматики, количество созданных узлов strct1c по классам.
+    Время функции-правила - время только ее действия: вложенные конструкции к этому моменту уже свернуты.
+    '''
+    def __init__(self):
+        # имя функции-правила -> [количество сверток, время действий в секундах]
+        self.rules = {}
+        # имя класса strct1c -> количество узлов
+        self.nodes = {}
+        # количество разобранных модулей и общее время их разбора в секундах
+        self.modules = 0
+        self.elapsed = 0.0
+    def add(self, other):
+        '''
+        Добавляет статистику другого разбора (для сводного отчета по нескольким модулям).
+        @param other (ParseProfile): статистика
+        '''
+        for name, (count, elapsed) in other.rules.items():
+            stats = self.rules.setdefault(name, [0, 0.0])
+            stats[0] += count
+            stats[1] += elapsed
+        for name, count in other.nodes.items():
+            self.nodes[name] = self.nodes.get(name, 0) + count
+        self.modules += other.modules
+        self.elapsed += other.elapsed
+    def count_nodes(self, subject):
+        # подсчет узлов структуры модуля по классам, обход без рекурсии
+        stack = [subject]
+        while stack:
+            subject = stack.pop()
+            if isinstance(subject, list):
+                stack.extend(subject)
+            elif type(subject).__module__ == strct1c.__name__:
+                name = type(subject).__name__
+                self.nodes[name] = self.nodes.get(name, 0) + 1
+                stack.extend(vars(subject).values())
+    def get_report(self, title):
+        '''
+        @param title (str): заголовок отчета
+        @return (str): отчет: функции-правила по убыванию времени действий, узлы по убыванию количества
+        '''
+        actions = sum(elapsed for _, elapsed in self.rules.values())
+        lines = ['%s: модулей %d, разбор %.2f ms, действия правил %.2f ms (%.1f%%)' % (
+            title, self.modules, self.elapsed * 1000, actions * 1000, actions * 100 / (self.elapsed or 1))]
+        for name, (count, elapsed) in sorted(self.rules.items(), key=lambda item: -item[1][1]):
+            lines.append('  %-36s %10d сверток %10.2f ms %6.1f%%' % (
+                name, count, elapsed * 1000, elapsed * 100 / (actions or 1)))
+        nodes = sum(self.nodes.values())
+        lines.append('  узлов strct1c: %d' % nodes)
+        for name, count in sorted(self.nodes.items(), key=lambda item: -item[1]):
+            lines.append('  %-36s %10d %6.1f%%' % (name, count, count * 100 / nodes))
+        return '\n'.join(lines)
+
+## source positions
+
+class SourcePositions:
+    '''
+    Позиции операторов и процедур/функций структуры модуля в исходном тексте: границы в тексте
+    (начало первого и конец последнего токена) хранятся в двух массивах, записанный узел strct1c хранит
+    номер своей записи в атрибуте position_id - таблица не ссылается на узлы и не держит их в памяти.
+    Номер относится к таблице разбора, создавшего узел: узел записывается в одну таблицу, копия узла
+    (copy.deepcopy()) получает позицию оригинала.
+    Позиция остальных узлов (выражений, параметров, ветвей условий) - позиция ближайшего владельца
+    с записью (strct1c.get_owner()).
+    Границы отсчитываются в тексте модуля до препроцессора: frontend1c.preprocess() сохраняет позиции
+    исходного текста, поэтому одна таблица подходит для результатов препроцессора во всех контекстах исполнения.
+    '''
+
+    # исходный текст модуля
+    data = ""
+
+    def __init__(self, data):
+        self.data = data
+        self.starts = array('i')
+        self.ends = array('i')
+        # позиции начала строк текста, вычисляются при первом обращении (см. get_line())
+        self.line_starts = None
+    def add(self, node, start, end):
+        '''
+        @param node: узел strct1c
+        @param start, end (int): границы узла в исходном тексте, end - позиция после последнего символа
+        '''
+        if getattr(node, 'position_id', None) is None:
+            node.position_id = len(self.starts)
+            self.starts.append(start)
+            self.ends.append(end)
+    def discard(self, node):
+        # удаляет запись узла, не вошедшего в структуру модуля (место в массивах границ не освобождается)
+        node.position_id = None
+    def truncate(self, count):
+        '''
+        Удаляет записи, добавленные после первых count - узлы разбора, результат которого отброшен
+        (номера записей остаются в отброшенных узлах, позиции которых не запрашиваются).
+        @param count (int): количество сохраняемых записей
+        '''
+        if len(self.starts) > count:
+            del self.starts[count:]
+            del self.ends[count:]
+    def get_span(self, node):
+        '''
+        @param node: узел strct1c
+        @return (tuple): границы (начало, конец) узла или его ближайшего владельца с записью в исходном тексте,
+                         None - если позиция не известна (узел создан не разбором)
+        '''
+        while node is not None:
+            index = getattr(node, 'position_id', None)
+            if index is not None:
+                return self.starts[index], self.ends[index]
+            node = strct1c.get_owner(node)
+        return None
+    def get_line(self, pos):
+        # номер строки исходного текста по позиции
+        if self.line_starts is None:
+            self.line_starts = array('i', [0])
+            self.line_starts.extend(match.end() for match in re.finditer('\n', self.data))
+        return bisect.bisect_right(self.line_starts, pos)
+    def get_lines(self, node):
+        '''
+        @param node: узел strct1c
+        @return (tuple): номера первой и последней строки узла в исходном тексте, None - позиция не известна
+        '''
+        span = self.get_span(node)
+        if span is None:
+            return None
+        start, end = span
+        return self.get_line(start), self.get_line(max(start, end - 1))
+    def nbytes(self):
+        '''
+        @return (int): размер таблицы в байтах: массивы границ (без номеров записей в узлах)
+        '''
+        return sum(column.itemsize * len(column) for column in (self.starts, self.ends))
+
+# Нетерминалы грамматики, узлы которых записываются в SourcePositions при LALR-разборе
+POSITION_SYMBOLS = {'statement', 'func_decl', 'proc_decl'}
+
+def new_positions_productions(productions):
+    '''
+    Оборачивает функции-правила продукций для записи позиций при LALR-разборе (см. Parser1C.parse_tokens()):
+    границы свернутого нетерминала вычисляются по непустым символам продукции (у токенов - lexpos и endlexpos,
+    см. lexer1c.TokenReader) и сохраняются в его символе, узлы операторов и процедур/функций записываются
+    в таблицу позиций, назначенную потоку токенов (атрибут positions объекта TokenReader).
+    Отслеживание позиций ply (tracking) не используется: у пустых продукций ply берет позицию
+    уже прочитанного следующего токена.
+    @param productions (list): продукции таблиц разбора (ply.yacc.LRParser.productions)
+    @return (list): копии продукций с обернутыми функциями-правилами
+    '''
+    def tracked(func, name):
+        def action(p):
+            func(p)
+            symbols = [symbol for symbol in p.slice[1:] if hasattr(symbol, 'endlexpos')]
+            if not symbols:
+                return
+            start = symbols[0].lexpos
+            end = symbols[-1].endlexpos
+            p.slice[0].lexpos = start
+            p.slice[0].endlexpos = end
+            if name in POSITION_SYMBOLS and p[0] is not None and not isinstance(p[0], strct1c.Empty):
+                p.lexer.positions.add(p[0], start, end)
+        return action
+
+    result = []
+    for production in productions:
+        if production.callable:
+            production = copy.copy(production)
+            production.callable = tracked(production.callable, production.name)
+        result.append(production)
+    return result
+
+# Продукции с записью позиций, создаются при первом обращении (см. get_positions_productions())
+__gl_positions_productions = None
+
+def get_positions_productions():
+    '''
+    @return (list): продукции таблиц разбора общего LR-парсера с записью позиций, см. new_positions_productions()
+    '''
+    global __gl_positions_productions
+    if __gl_positions_productions is None:
+        __gl_positions_productions = new_positions_productions(get_lr_parser().productions)
+    return __gl_positions_productions
+
+## skeleton parsing
+
+# Коды токенов начала процедуры/функции и соответствующих им токенов окончания
+FUNCTION_END_CODES = {
+    lexer1c.TOKEN_CODES['FUNCTION']: lexer1c.TOKEN_CODES['END_FUNCTION'],
+    lexer1c.TOKEN_CODES['PROCEDURE']: lexer1c.TOKEN_CODES['END_PROCEDURE'],
+}
+FUNCTION_BOUNDS_RE = re.compile(b'[' + re.escape(bytes(list(FUNCTION_END_CODES) + list(FUNCTION_END_CODES.values()))) + b']')
+ID_CODE = lexer1c.TOKEN_CODES['ID']
+LPAREN_CODE = lexer1c.TOKEN_CODES['LPAREN']
+RPAREN_CODE = lexer1c.TOKEN_CODES['RPAREN']
+EXPORT_CODE = lexer1c.TOKEN_CODES['EXPORT']
+
+def get_body_start(types, begin, end):
+    # первый токен тела процедуры/функции: после ")" списка параметров и "Экспорт", None - заголовок не распознан
+    if begin + 2 >= end or types[begin + 1] != ID_CODE or types[begin + 2] != LPAREN_CODE:
+        return None
+    depth = 0
+    for index in range(begin + 2, end):
+        code = types[index]
+        if code == LPAREN_CODE:
+            depth += 1
+        elif code == RPAREN_CODE:
+            depth -= 1
+            if not depth:
+                return index + 2 if types[index + 1] == EXPORT_CODE else index + 1
+    return None
+
+def get_function_spans(buffer):
+    '''
+    Находит процедуры и функции в потоке токенов модуля.
+    @param buffer (lexer1c.TokenBuffer): токены модуля после препроцессора (см. frontend1c.preprocess())
+    @return (list): для каждого токена Функция/Процедура - (индекс токена, индекс первого токена тела,
+                    индекс токена КонецФункции/КонецПроцедуры); индекс первого токена тела - None,
+                    если заголовок или окончание не распознаны и процедура/функция разбирается целиком
+    '''
+    types = buffer.types
+    result = []
+    begin = None
+    for match in FUNCTION_BOUNDS_RE.finditer(types.tobytes()):
+        index = match.start()
+        code = types[index]
+        if code in FUNCTION_END_CODES:
+            if begin is not None:
+                result.append((begin, None, None))
+            begin = index
+        elif begin is not None:
+            if FUNCTION_END_CODES[types[begin]] == code:
+                result.append((begin, get_body_start(types, begin, index), index))
+            else:
+                result.append((begin, None, None))
+            begin = None
+    if begin is not None:
+        result.append((begin, None, None))
+    return result
+
+class FuncBodySource:
+    '''
+    Токены процедуры/функции для отложенного разбора ее тела (см. Parser1C.parse_skeleton()).
+    Тело разбирается синтаксическим процессором, разобравшим заголовки модуля.
+    '''
+    # синтаксический процессор модуля (Parser1C)
+    parser = None
+    buffer = None
+    start = None
+    stop = None
+    # таблица позиций узлов (SourcePositions), None - позиции не записываются
+    positions = None
+    # имя модуля для сообщений об ошибках, None - не известно
+    module_name = None
+    def __init__(self, parser, buffer, start, stop, positions=None, module_name=None):
+        self.parser = parser
+        self.buffer = buffer
+        self.start = start
+        self.stop = stop
+        self.positions = positions
+        self.module_name = module_name
+    def get_error_message(self):
+        message = "тело процедуры/функции в строке %d" % self.buffer.lines[self.start]
+        if self.module_name is None:
+            return "Ошибка при разборе: " + message
+        return "Ошибка при разборе модуля : %s (%s)" % (self.module_name, message)
+    def parse_body(self):
+        '''
+        Выполняет синтаксический разбор процедуры/функции синтаксическим процессором модуля.
+        @return (strct1c.FuncBody): тело процедуры/функции
+        @raise Exception: ошибка разбора с именем модуля и строкой процедуры/функции, в том числе ошибка,
+                          после которой ply восстановил разбор (тело без операторов, см. p_statements_error())
+        '''
+        errors = []
+        lr_parser = self.parser.lr_parser
+        # ошибки собираются вместо вывода p_error(): тело с ошибкой не возвращается (у экземпляра своя копия LR-парсера)
+        lr_parser.errorfunc = errors.append
+        try:
+            module = self.parser.parse_tokens(self.buffer, self.start, self.stop, self.positions)
+        except Exception as e:
+            raise Exception(self.get_error_message()) from e
+        finally:
+            lr_parser.errorfunc = p_error
+        if errors or module is None or not module.proc_funcs_list or len(module.proc_funcs_list) != 1:
+            raise Exception(self.get_error_message())
+        if self.positions is not None:
+            # в структуру модуля попадает только тело, процедура/функция - из разбора заголовков
+            self.positions.discard(module.proc_funcs_list[0])
+        return module.proc_funcs_list[0].body
+
+class Parser1C:
+    '''
+    Синтаксический процессор модулей 1С: собственный лексер и собственное состояние LR-разбора.
+    Таблицы разбора разделяются между экземплярами только для чтения.
+    '''
+    lexer = None
+    lr_parser = None
+    # статистика разбора (см. new_profiling_parser()), None - разбор без профилирования
+    profile = None
+    def __init__(self, lexer, lr_parser):
+        self.lexer = lexer
+        self.lr_parser = lr_parser
+    def __reduce__(self):
+        # в pickle (источники тел с отложенным разбором, см. FuncBodySource) сохраняется только способ
+        # создания: после загрузки тела разбираются новым экземпляром, общим для всех ссылок одного pickle
+        return new_parser, ()
+    def parse(self, text):
+        '''
+        Выполняет синтаксический разбор текста модуля.
+        @param text (str): текст модуля (после препроцессора)
+        @return (strct1c.Module): структура модуля
+        '''
+        if lexer1c.LEXER_BACKEND != 'ply':
+            return self.parse_tokens(lexer1c.tokenize(text))
+        self.lexer.lineno = 1
+        return self.lr_parser.parse(text, lexer=self.lexer)
+    def parse_tokens(self, buffer, start=0, stop=None, positions=None):
+        '''
+        Выполняет синтаксический разбор токенов из буфера лексера реализацией PARSER_BACKEND.
+        @param buffer (lexer1c.TokenBuffer): токены модуля (см. lexer1c.tokenize())
+        @param start, stop (int): диапазон токенов для разбора, по умолчанию - все токены
+        @param positions (SourcePositions): таблица, в которую записываются позиции операторов и процедур/функций,
+                                            None - позиции не записываются (и при профилировании разбора)
+        @return (strct1c.Module): структура модуля
+        '''
+        if self.profile is not None:
+            return self.parse_profiled(buffer, start, stop)
+        if PARSER_BACKEND == 'rd':
+            from epfcomp import rdparser1c
+            count = len(positions.starts) if positions is not None else 0
+            try:
+                return rdparser1c.parse_tokens(buffer, start, stop, positions)
+            except (rdparser1c.ParserError, RecursionError):
+                if positions is not None:
+                    positions.truncate(count)
+        reader = buffer.reader(start, stop)
+        if positions is None:
+            return self.lr_parser.parse(lexer=reader)
+        reader.positions = positions
+        lr_parser = copy.copy(self.lr_parser)
+        lr_parser.productions = get_positions_productions()
+        return lr_parser.parse(lexer=reader)
+    def parse_stream(self, buffer, start=0, stop=None, collect=True):
+        '''
+        Выполняет синтаксический разбор токенов из буфера лексера с выдачей каждой процедуры/функции сразу после
+        ее разбора (после КонецФункции/КонецПроцедуры) - обработка процедур и функций не ждет разбора всего модуля.
+        Процедуры и функции выдаются рекурсивным спуском (rdparser1c). При синтаксической ошибке и при разборе
+        ply (PARSER_BACKEND, профилирование) модуль разбирается ply целиком, как в parse_tokens(), и выдаются
+        процедуры и функции, еще не выданные до ошибки. Владелец процедуры/функции (модуль) устанавливается
+        после разбора всего модуля.
+        Для обработки модуля без накопления его структуры в памяти процедуры и функции не сохраняются в структуре
+        модуля (collect=False), а ссылки на владельцев обработанных процедур и функций удаляются
+        (strct1c.del_owner_links()).
+        @param buffer (lexer1c.TokenBuffer): токены модуля (см. lexer1c.tokenize())
+        @param start, stop (int): диапазон токенов для разбора, по умолчанию - все токены
+        @param collect (bool): сохранять ли процедуры и функции в структуре модуля
+        @return (generator): процедуры и функции (strct1c.Function), значение StopIteration - структура модуля
+                             (strct1c.Module, при collect=False - без процедур и функций)
+        '''
+        yielded = []
+        count = 0
+        if PARSER_BACKEND == 'rd' and self.profile is None:
+            from epfcomp import rdparser1c
+            stream = rdparser1c.iter_tokens(buffer, start, stop, collect)
+            while True:
+                try:
+                    function = next(stream)
+                except StopIteration as e:
+                    return e.value
+                except (rdparser1c.ParserError, RecursionError):
+                    break
+                count += 1
+                if collect:
+                    yielded.append(function)
+                yield function
+            module = self.lr_parser.parse(lexer=buffer.reader(start, stop))
+        else:
+            module = self.parse_tokens(buffer, start, stop)
+        if module is None or not module.proc_funcs_list:
+            return module
+        for function in module.proc_funcs_list[count:]:
+            yield function
+        if collect:
+            # процедуры и функции до ошибки ply разбирает так же - в структуре остаются уже выданные объекты
+            module.proc_funcs_list[:count] = yielded
+            strct1c.set_owner(yielded, module)
+        else:
+            module.proc_funcs_list[:] = []
+        return module
+    def parse_profiled(self, buffer, start=0, stop=None):
+        '''
+        Выполняет LALR-разбор ply (у rdparser1c нет действий правил) токенов из буфера лексера
+        и добавляет его статистику в self.profile.
+        @return (strct1c.Module): структура модуля, параметры - см. parse_tokens()
+        '''
+        start_time = time.perf_counter()
+        module = self.lr_parser.parse(lexer=buffer.reader(start, stop))
+        self.profile.elapsed += time.perf_counter() - start_time
+        self.profile.modules += 1
+        self.profile.count_nodes(module)
+        return module
+    def parse_skeleton(self, buffer, positions=None, module_name=None):
+        '''
+        Выполняет синтаксический разбор модуля без тел процедур и функций: разбираются заголовки
+        (директива, имя, параметры, признак экспорта), а тело разбирается при первом обращении
+        к strct1c.Function.body (см. FuncBodySource). Синтаксическая ошибка в теле (и ошибка, после которой
+        ply восстановил разбор) выдается исключением с именем модуля при разборе тела.
+        @param buffer (lexer1c.TokenBuffer): токены модуля после препроцессора (см. frontend1c.preprocess())
+        @param positions (SourcePositions): таблица позиций узлов, None - позиции не записываются
+        @param module_name (str): имя модуля для сообщений об ошибках разбора тел
+        @return (strct1c.Module): структура модуля
+        '''
+        spans = get_function_spans(buffer)
+        skeleton = lexer1c.TokenBuffer(buffer.data)
+        pos = 0
+        for _, body_start, end in spans:
+            if body_start is not None and body_start < end:
+                skeleton.extend(buffer, pos, body_start)
+                pos = end
+        skeleton.extend(buffer, pos, len(buffer))
+        count = len(positions.starts) if positions is not None else 0
+        module = self.parse_tokens(skeleton, positions=positions)
+        if module is None or module.proc_funcs_list is None or len(module.proc_funcs_list) != len(spans):
+            # после синтаксической ошибки процедуры и функции не сопоставить токенам - разбор целиком
+            if positions is not None:
+                positions.truncate(count)
+            return self.parse_tokens(buffer, positions=positions)
+        for function, (begin, body_start, end) in zip(module.proc_funcs_list, spans):
+            if body_start is not None and body_start < end:
+                function.body_source = FuncBodySource(self, buffer, begin, end + 1, positions, module_name)
+        return module
+
+def new_parser():
+    '''
+    Возвращает независимый экземпляр синтаксического процессора со своим лексером.
+    Стеки разбора ply хранит в атрибутах объекта парсера, поэтому у каждого экземпляра своя копия.
+    @return (Parser1C): новый синтаксический процессор
+    '''
+    return Parser1C(new_lexer(), copy.copy(get_lr_parser()))
+
+def new_profiling_parser():
+    '''
+    Возвращает синтаксический процессор с профилированием: разбор выполняется LALR-разбором ply, функции-правила
+    накапливают количество сверток и время действий в его атрибуте profile (см. ParseProfile). Для отчета
+    по каждому модулю атрибуту profile перед разбором присваивается новый ParseProfile.
+    @return (Parser1C): синтаксический процессор
+    '''
+    parser = new_parser()
+    parser.profile = ParseProfile()
+
+    def timed(func):
+        def action(p):
+            start = time.perf_counter()
+            try:
+                func(p)
+            finally:
+                stats = parser.profile.rules.setdefault(func.__name__, [0, 0.0])
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+        return action
+
+    # продукции таблиц разбора экземпляры разделяют - подменяется копия списка продукций
+    productions = []
+    for production in parser.lr_parser.productions:
+        if production.callable:
+            production = copy.copy(production)
+            production.callable = timed(production.callable)
+        productions.append(production)
+    parser.lr_parser.productions = productions
+    return parser
+
+# Общий синтаксический процессор, создается при первом обращении (см. get_parser())
+__gl_parser = None
+
+def get_parser():
+    '''
+    Возвращает общий синтаксический процессор модуля.
+    Не допускает одновременного разбора нескольких модулей - для этого используется new_parser().
+    @return (Parser1C): синтаксический процессор
+    '''
+    global __gl_parser
+    if __gl_parser is None:
+        __gl_parser = new_parser()
+    return __gl_parser
+
+def __getattr__(name):
+    # совместимость: parser1c.parser - общий синтаксический процессор
+    if name == 'parser':
+        return get_parser()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+def parse(text):
+    '''
+    Выполняет синтаксический разбор текста модуля общим синтаксическим процессором.
+    @param text (str): текст модуля (после препроцессора)
+    @return (strct1c.Module): структура модуля
+    '''
+    return get_parser().parse(text)
 
 if __name__ == '__main__':
+    if sys.argv[1:] == ['--parsetab']:
+        print(write_parsetab())
+        sys.exit()
     data = open("samples/sample.1c", encoding='utf-8').read()
-    result = parser.parse(data)
+    result = parse(data)
     strct1c.localize('ru')
     strct1c.get_tokens_list(result.statements_list, obj_type="function", filter=set())
     strct1c.set_str_locale('ru')
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# parsetab1c.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORANDleftEQNOT_EQLTLEGTGEleftPLUSMINUSleftTIMESDIVIDEMODrightUNOTrightUMINUSUPLUSAND BREAK COLON COMMA CONTINUE DATE DEF_ELSE DEF_ELSE_IF DEF_END_IF DEF_IF DIRECTIVE DIVIDE DO DOT ELSE ELSE_IF END_DO END_FUNCTION END_IF END_PROCEDURE END_TRY EQ EXCEPTION EXPORT FALSE FOR FOR_EACH FROM FUNCTION GE GOTO GT ID IF LABEL LE LPAREN LSB LT MINUS MOD NEW NOT NOT_EQ NUMBER OR PLUS PROCEDURE QSTN RAISE RETURN RPAREN RSB SEMI STRING THEN TIMES TO TRUE TRY UNDEFINED VAL VAR WHILEmodule : global_vars SEMI proc_func_list statementsmodule : global_vars SEMI statementsmodule : proc_func_list statementsmodule : statementsglobal_vars : global_vars SEMI directive VAR global_var_decl_listglobal_vars : directive VAR global_var_decl_listglobal_var_decl_list : global_var_decl_list COMMA global_var_declglobal_var_decl_list : global_var_declglobal_var_decl : IDglobal_var_decl : ID EXPORTdirective : DIRECTIVEdirective : emptyproc_func_list : proc_func_list func_decl\n                      | proc_func_list proc_declproc_func_list : func_decl\n                      | proc_declfunc_decl : directive FUNCTION ID LPAREN declarator_list RPAREN func_body END_FUNCTIONfunc_decl : directive FUNCTION ID LPAREN declarator_list RPAREN EXPORT func_body END_FUNCTIONproc_decl : directive PROCEDURE ID LPAREN declarator_list RPAREN func_body END_PROCEDUREproc_decl : directive PROCEDURE ID LPAREN declarator_list RPAREN EXPORT func_body END_PROCEDUREdeclarator_list : declarator_list COMMA init_declaratordeclarator_list : init_declaratordeclarator_list : emptyinit_declarator : IDinit_declarator : VAL IDinit_declarator : ID EQ func_param_initializerinit_declarator : VAL ID EQ func_param_initializerfunc_param_initializer : bool\n                              | strings\n                              | number\n                              | date\n                              | undefinedfunc_body : vars_decls_list SEMI statementsfunc_body : vars_decls_listfunc_body : statementsvars_decls_list : vars_decls_list SEMI VAR vars_listvars_decls_list : VAR vars_listvars_list : vars_list COMMA IDvars_list : IDstatements : statements SEMI statementstatements : statementstatements : statements error SEMI statementstatement : iteration_statement\n                 | jump_statement\n                 | if_else_statement\n                 | try_statement\n                 | labeled_statement\n                 | preproc_statementstatement : property EQ exprstatement : propertystatement : emptytry_statement : TRY statements EXCEPTION statements END_TRYlabeled_statement : LABEL COLON statementif_else_statement : IF expr THEN statements else_block END_IFelse_block : emptyelse_block : else_if_collection ELSE statementselse_block : else_if_collectionelse_block : ELSE statementselse_if_collection : else_if_collection ELSE_IF expr THEN statementselse_if_collection : ELSE_IF expr THEN statementsiteration_statement : for_each_block\n                           | for_block\n                           | while_blockfor_each_block : FOR_EACH ID FROM expr DO statements END_DOfor_block : FOR ID EQ expr TO expr DO statements END_DOwhile_block : WHILE expr DO statements END_DOjump_statement : CONTINUE\n                      | BREAKjump_statement : RETURN expr_opt\n                      | RAISE expr_opt\n                      | GOTO LABELexpr_opt : emptyexpr_opt : exprpreproc_statement : DEF_IF preproc_expr THEN statements preproc_else_block DEF_END_IFpreproc_else_block : emptypreproc_else_block : preproc_else_if_collection DEF_ELSE statementspreproc_else_block : preproc_else_if_collectionpreproc_else_block : DEF_ELSE statementspreproc_else_if_collection : preproc_else_if_collection DEF_ELSE_IF preproc_expr THEN statementspreproc_else_if_collection : DEF_ELSE_IF preproc_expr THEN statementspreproc_expr : preproc_expr AND preproc_expr\n                    | preproc_expr OR preproc_exprpreproc_expr : LPAREN preproc_expr RPARENpreproc_expr : IDpreproc_expr : NOT preproc_expr %prec UNOTproperty : property DOT prop_elementproperty : prop_elementprop_element : prop_element LSB expr RSBprop_element : func_callprop_element : IDfunc_call : ID LPAREN params_list RPARENexpr : property\n            | bool\n            | number\n            | date\n            | strings\n            | undefinedexpr : LPAREN expr RPARENexpr : expr PLUS expr\n            | expr MINUS expr\n            | expr TIMES expr\n            | expr DIVIDE expr\n            | expr MOD expr\n            | expr OR expr\n            | expr AND expr\n            | expr NOT_EQ expr\n            | expr LT expr\n            | expr LE expr\n            | expr GT expr\n            | expr GE expr\n            | expr EQ expr\n            expr : QSTN LPAREN expr COMMA expr COMMA expr RPARENexpr : NEW IDexpr : NEW ID LPAREN params_list RPARENexpr : NEW LPAREN new_params_list RPARENnew_params_list : new_params_list COMMA exprnew_params_list : exprexpr : NOT expr %prec UNOTexpr : MINUS expr %prec UMINUSexpr : PLUS expr %prec UPLUSparams_list : params_list COMMA exprparams_list : params_list COMMA emptyparams_list : emptyparams_list : exprbool : TRUE\n            | FALSEnumber : NUMBERdate : DATEundefined : UNDEFINEDstrings : strings STRINGstrings : STRINGempty : '
+    
+_lr_action_items = {'DIRECTIVE':([0,3,6,7,36,38,39,85,242,248,256,260,],[9,9,-15,-16,9,-13,-14,9,-17,-19,-18,-20,]),'VAR':([0,5,9,10,36,87,199,202,225,232,244,],[-132,44,-11,-12,-132,134,228,228,228,228,258,]),'FUNCTION':([0,3,5,6,7,9,10,36,38,39,40,41,85,87,242,248,256,260,],[-132,-132,45,-15,-16,-11,-12,-132,-13,-14,45,-12,-132,45,-17,-19,-18,-20,]),'PROCEDURE':([0,3,5,6,7,9,10,36,38,39,40,41,85,87,242,248,256,260,],[-132,-132,46,-15,-16,-11,-12,-132,-13,-14,46,-12,-132,46,-17,-19,-18,-20,]),'SEMI':([0,2,3,4,6,7,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,31,35,36,37,38,39,41,42,43,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,75,76,85,86,88,89,90,91,92,98,99,113,115,116,118,120,121,122,123,124,132,133,135,137,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,160,161,162,166,169,170,171,182,187,189,193,195,197,199,202,204,206,207,209,211,212,214,216,225,226,227,232,234,236,237,239,240,241,242,244,245,246,248,251,252,253,254,255,256,257,260,261,262,263,264,265,266,],[-132,36,-132,42,-15,-16,-41,-51,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-132,-87,-89,-132,42,-13,-14,-51,-132,89,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,42,-51,-132,42,-40,-132,-6,-8,-9,-49,-86,-130,-120,-119,-113,-118,-53,-132,-132,-132,-132,42,-42,-10,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,42,42,42,-88,42,-5,-7,-115,-132,-52,-132,-132,-66,-132,-132,-114,-54,-132,42,-74,-132,42,42,-132,244,42,-132,42,-132,42,-132,-64,-132,-17,-132,-37,-39,-19,-132,42,-132,42,42,-18,42,-20,-112,42,42,-65,-36,-38,]),'error':([0,3,4,6,7,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,31,35,36,37,38,39,41,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,75,76,85,86,88,89,98,99,113,115,116,118,120,121,122,123,124,132,133,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,160,161,162,166,169,182,187,189,193,195,197,199,202,204,206,207,209,211,212,214,216,225,227,232,234,236,237,239,240,241,242,244,248,251,252,253,254,255,256,257,260,261,262,263,264,],[-132,-132,43,-15,-16,-41,-51,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-132,-87,-89,-132,43,-13,-14,-51,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,43,-51,-132,43,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-132,-132,-132,43,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,43,43,43,-88,43,-115,-132,-52,-132,-132,-66,-132,-132,-114,-54,-132,43,-74,-132,43,43,-132,43,-132,43,-132,43,-132,-64,-132,-17,-132,-19,-132,43,-132,43,43,-18,43,-20,-112,43,43,-65,]),'$end':([0,1,3,4,6,7,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,36,37,38,39,41,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,85,86,88,89,98,99,113,115,116,118,120,121,133,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,182,189,197,204,206,211,240,242,248,256,260,261,264,],[-132,0,-132,-4,-15,-16,-41,-51,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-3,-13,-14,-51,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-132,-2,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-1,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,-115,-52,-66,-114,-54,-74,-64,-17,-19,-18,-20,-112,-65,]),'CONTINUE':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[22,22,-15,-16,22,22,-13,-14,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-17,22,-19,22,22,-18,-20,]),'BREAK':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[23,23,-15,-16,23,23,-13,-14,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-17,23,-19,23,23,-18,-20,]),'RETURN':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[24,24,-15,-16,24,24,-13,-14,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-17,24,-19,24,24,-18,-20,]),'RAISE':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[25,25,-15,-16,25,25,-13,-14,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-17,25,-19,25,25,-18,-20,]),'GOTO':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[26,26,-15,-16,26,26,-13,-14,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-17,26,-19,26,26,-18,-20,]),'IF':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[28,28,-15,-16,28,28,-13,-14,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-17,28,-19,28,28,-18,-20,]),'TRY':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[29,29,-15,-16,29,29,-13,-14,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-17,29,-19,29,29,-18,-20,]),'LABEL':([0,3,6,7,26,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[27,27,-15,-16,72,27,27,-13,-14,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-17,27,-19,27,27,-18,-20,]),'DEF_IF':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[30,30,-15,-16,30,30,-13,-14,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-17,30,-19,30,30,-18,-20,]),'FOR_EACH':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[32,32,-15,-16,32,32,-13,-14,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-17,32,-19,32,32,-18,-20,]),'FOR':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[33,33,-15,-16,33,33,-13,-14,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-17,33,-19,33,33,-18,-20,]),'WHILE':([0,3,6,7,29,36,38,39,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,242,244,248,251,253,256,260,],[34,34,-15,-16,34,34,-13,-14,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-17,34,-19,34,34,-18,-20,]),'ID':([0,3,6,7,24,25,28,29,30,32,33,34,36,38,39,42,44,45,46,47,48,49,59,60,61,63,64,73,78,80,81,85,89,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,122,123,124,125,126,130,131,132,134,136,138,139,141,157,176,180,183,187,188,193,194,195,196,199,200,202,207,208,212,213,225,228,232,233,236,239,241,242,244,248,251,253,256,258,259,260,],[11,11,-15,-16,11,11,11,11,79,82,83,11,11,-13,-14,11,92,93,94,11,11,11,11,11,11,118,11,11,79,79,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,79,79,11,11,11,92,92,172,172,11,11,201,11,11,11,11,11,79,11,11,11,172,11,11,11,11,79,11,246,11,11,11,11,11,-17,11,-19,11,11,-18,246,266,-20,]),'EXCEPTION':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,75,76,88,89,98,99,113,115,116,118,120,121,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,182,189,197,204,206,211,240,261,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,123,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,-115,-52,-66,-114,-54,-74,-64,-112,-65,]),'ELSE':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,122,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,160,166,182,186,189,197,204,206,211,236,240,251,252,261,262,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,187,-88,-115,207,-52,-66,-114,-54,-74,-132,-64,-132,-60,-112,-59,-65,]),'ELSE_IF':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,122,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,160,166,182,186,189,197,204,206,211,236,240,251,252,261,262,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,188,-88,-115,208,-52,-66,-114,-54,-74,-132,-64,-132,-60,-112,-59,-65,]),'END_IF':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,122,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,160,166,182,184,185,186,187,189,197,204,206,207,209,211,234,236,240,251,252,261,262,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-132,-88,-115,206,-55,-57,-132,-52,-66,-114,-54,-132,-58,-74,-56,-132,-64,-132,-60,-112,-59,-65,]),'END_TRY':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,123,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,161,166,182,189,197,204,206,211,240,261,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,189,-88,-115,-52,-66,-114,-54,-74,-64,-112,-65,]),'DEF_ELSE':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,124,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,162,166,182,189,192,197,204,206,211,239,240,253,254,261,263,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,193,-88,-115,-52,212,-66,-114,-54,-74,-132,-64,-132,-80,-112,-79,-65,]),'DEF_ELSE_IF':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,124,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,162,166,182,189,192,197,204,206,211,239,240,253,254,261,263,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,194,-88,-115,-52,213,-66,-114,-54,-74,-132,-64,-132,-80,-112,-79,-65,]),'DEF_END_IF':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,124,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,162,166,182,189,190,191,192,193,197,204,206,211,212,214,237,239,240,253,254,261,263,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-132,-88,-115,-52,211,-75,-77,-132,-66,-114,-54,-74,-132,-78,-76,-132,-64,-132,-80,-112,-79,-65,]),'END_DO':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,132,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,169,182,189,195,197,204,206,211,216,240,241,255,261,264,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-132,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,197,-115,-52,-132,-66,-114,-54,-74,240,-64,-132,264,-112,-65,]),'END_FUNCTION':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,182,189,197,199,204,206,211,224,225,226,227,240,243,244,245,246,257,261,264,265,266,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,-115,-52,-66,-132,-114,-54,-74,242,-132,-34,-35,-64,256,-132,-37,-39,-33,-112,-65,-36,-38,]),'END_PROCEDURE':([8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,35,42,50,51,52,53,54,55,56,57,58,65,66,67,68,69,70,71,72,73,76,88,89,98,99,113,115,116,118,120,121,135,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,182,189,197,202,204,206,211,226,227,231,232,240,244,245,246,249,257,261,264,265,266,],[-41,-90,-43,-44,-45,-46,-47,-48,-50,-61,-62,-63,-67,-68,-132,-132,-87,-89,-132,-69,-72,-73,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-70,-71,-132,-51,-40,-132,-49,-86,-130,-120,-119,-113,-118,-53,-42,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,-115,-52,-66,-132,-114,-54,-74,-34,-35,248,-132,-64,-132,-37,-39,260,-33,-112,-65,-36,-38,]),'LSB':([11,31,35,99,140,166,],[-90,81,-89,81,-91,-88,]),'EQ':([11,18,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,83,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,172,178,182,201,203,204,205,210,217,235,250,261,],[-90,48,-87,-89,112,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,112,131,112,112,112,-86,-130,112,-120,-119,-113,-118,112,-91,-99,-100,-101,-102,-103,112,112,-106,-107,-108,-109,-110,-111,-98,112,112,-88,112,112,198,112,-115,230,112,-114,112,112,112,112,112,-112,]),'DOT':([11,18,31,35,53,99,140,166,],[-90,49,-87,-89,49,-86,-91,-88,]),'PLUS':([11,24,25,28,31,34,35,47,48,52,53,54,55,56,57,58,59,60,61,64,65,66,67,68,69,70,74,81,84,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,129,130,131,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,159,166,167,168,178,180,182,183,188,196,203,204,205,208,210,217,233,235,250,261,],[-90,60,60,60,-87,60,-89,60,60,100,-92,-93,-94,-95,-96,-97,60,60,60,60,-125,-126,-127,-128,-131,-129,100,60,100,100,100,-86,60,60,60,60,60,60,60,60,60,60,60,60,60,-130,100,-120,-119,60,-113,60,-118,100,60,60,-91,60,-99,-100,-101,-102,-103,100,100,100,100,100,100,100,100,-98,100,60,100,-88,100,100,100,60,-115,60,60,60,100,-114,100,60,100,100,60,100,100,-112,]),'MINUS':([11,24,25,28,31,34,35,47,48,52,53,54,55,56,57,58,59,60,61,64,65,66,67,68,69,70,74,81,84,96,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,129,130,131,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,159,166,167,168,178,180,182,183,188,196,203,204,205,208,210,217,233,235,250,261,],[-90,61,61,61,-87,61,-89,61,61,101,-92,-93,-94,-95,-96,-97,61,61,61,61,-125,-126,-127,-128,-131,-129,101,61,101,101,101,-86,61,61,61,61,61,61,61,61,61,61,61,61,61,-130,101,-120,-119,61,-113,61,-118,101,61,61,-91,61,-99,-100,-101,-102,-103,101,101,101,101,101,101,101,101,-98,101,61,101,-88,101,101,101,61,-115,61,61,61,101,-114,101,61,101,101,61,101,101,-112,]),'TIMES':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,102,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,102,102,102,102,-86,-130,102,-120,-119,-113,-118,102,-91,102,102,-101,-102,-103,102,102,102,102,102,102,102,102,-98,102,102,-88,102,102,102,-115,102,-114,102,102,102,102,102,-112,]),'DIVIDE':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,103,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,103,103,103,103,-86,-130,103,-120,-119,-113,-118,103,-91,103,103,-101,-102,-103,103,103,103,103,103,103,103,103,-98,103,103,-88,103,103,103,-115,103,-114,103,103,103,103,103,-112,]),'MOD':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,104,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,104,104,104,104,-86,-130,104,-120,-119,-113,-118,104,-91,104,104,-101,-102,-103,104,104,104,104,104,104,104,104,-98,104,104,-88,104,104,104,-115,104,-114,104,104,104,104,104,-112,]),'OR':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,77,79,84,96,98,99,113,114,115,116,118,120,127,128,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,163,164,165,166,167,168,178,182,203,204,205,210,215,217,235,238,250,261,],[-90,-87,-89,105,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,105,126,-84,105,105,105,-86,-130,105,-120,-119,-113,-118,126,-85,105,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,105,105,-81,-82,-83,-88,105,105,105,-115,105,-114,105,105,126,105,105,126,105,-112,]),'AND':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,77,79,84,96,98,99,113,114,115,116,118,120,127,128,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,163,164,165,166,167,168,178,182,203,204,205,210,215,217,235,238,250,261,],[-90,-87,-89,106,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,106,125,-84,106,106,106,-86,-130,106,-120,-119,-113,-118,125,-85,106,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,106,106,-81,-82,-83,-88,106,106,106,-115,106,-114,106,106,125,106,106,125,106,-112,]),'NOT_EQ':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,107,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,107,107,107,107,-86,-130,107,-120,-119,-113,-118,107,-91,-99,-100,-101,-102,-103,107,107,-106,-107,-108,-109,-110,-111,-98,107,107,-88,107,107,107,-115,107,-114,107,107,107,107,107,-112,]),'LT':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,108,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,108,108,108,108,-86,-130,108,-120,-119,-113,-118,108,-91,-99,-100,-101,-102,-103,108,108,-106,-107,-108,-109,-110,-111,-98,108,108,-88,108,108,108,-115,108,-114,108,108,108,108,108,-112,]),'LE':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,109,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,109,109,109,109,-86,-130,109,-120,-119,-113,-118,109,-91,-99,-100,-101,-102,-103,109,109,-106,-107,-108,-109,-110,-111,-98,109,109,-88,109,109,109,-115,109,-114,109,109,109,109,109,-112,]),'GT':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,110,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,110,110,110,110,-86,-130,110,-120,-119,-113,-118,110,-91,-99,-100,-101,-102,-103,110,110,-106,-107,-108,-109,-110,-111,-98,110,110,-88,110,110,110,-115,110,-114,110,110,110,110,110,-112,]),'GE':([11,31,35,52,53,54,55,56,57,58,65,66,67,68,69,70,74,84,96,98,99,113,114,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,159,166,167,168,178,182,203,204,205,210,217,235,250,261,],[-90,-87,-89,111,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,111,111,111,111,-86,-130,111,-120,-119,-113,-118,111,-91,-99,-100,-101,-102,-103,111,111,-106,-107,-108,-109,-110,-111,-98,111,111,-88,111,111,111,-115,111,-114,111,111,111,111,111,-112,]),'THEN':([11,31,35,53,54,55,56,57,58,65,66,67,68,69,70,74,77,79,99,113,115,116,118,120,128,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,163,164,165,166,182,204,210,215,235,238,261,],[-90,-87,-89,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,122,124,-84,-86,-130,-120,-119,-113,-118,-85,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-81,-82,-83,-88,-115,-114,236,239,251,253,-112,]),'DO':([11,31,35,53,54,55,56,57,58,65,66,67,68,69,70,84,99,113,115,116,118,120,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,167,182,204,217,261,],[-90,-87,-89,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,132,-86,-130,-120,-119,-113,-118,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,195,-115,-114,241,-112,]),'RPAREN':([11,31,35,47,53,54,55,56,57,58,65,66,67,68,69,70,79,95,96,97,99,113,114,115,116,118,120,127,128,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,163,164,165,166,172,173,174,175,177,178,179,181,182,201,204,205,218,219,220,221,222,223,229,247,250,261,],[-90,-87,-89,-132,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-84,140,-124,-123,-86,-130,155,-120,-119,-113,-118,165,-85,-132,-132,-91,-132,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-132,182,-117,-81,-82,-83,-88,-24,199,-22,-23,202,-121,-122,204,-115,-25,-114,-116,-26,-28,-29,-30,-31,-32,-21,-27,261,-112,]),'COMMA':([11,31,35,47,53,54,55,56,57,58,65,66,67,68,69,70,90,91,92,95,96,97,99,113,115,116,118,120,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,166,170,171,172,173,174,175,177,178,179,181,182,201,203,204,205,218,219,220,221,222,223,229,245,246,247,261,265,266,],[-90,-87,-89,-132,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,136,-8,-9,141,-124,-123,-86,-130,-120,-119,-113,-118,-10,-132,-132,-91,-132,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,180,-132,183,-117,-88,136,-7,-24,200,-22,-23,200,-121,-122,141,-115,-25,233,-114,-116,-26,-28,-29,-30,-31,-32,-21,259,-39,-27,-112,259,-38,]),'RSB':([11,31,35,53,54,55,56,57,58,65,66,67,68,69,70,99,113,115,116,118,120,129,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,182,204,261,],[-90,-87,-89,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-86,-130,-120,-119,-113,-118,166,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,-115,-114,-112,]),'TO':([11,31,35,53,54,55,56,57,58,65,66,67,68,69,70,99,113,115,116,118,120,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,166,168,182,204,261,],[-90,-87,-89,-92,-93,-94,-95,-96,-97,-125,-126,-127,-128,-131,-129,-86,-130,-120,-119,-113,-118,-91,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-98,-88,196,-115,-114,-112,]),'LPAREN':([11,24,25,28,30,34,47,48,59,60,61,62,63,64,78,80,81,93,94,100,101,102,103,104,105,106,107,108,109,110,111,112,117,118,119,125,126,130,131,141,157,180,183,188,194,196,208,213,233,],[47,59,59,59,78,59,59,59,59,59,59,117,119,59,78,78,59,138,139,59,59,59,59,59,59,59,59,59,59,59,59,59,59,157,59,78,78,59,59,59,59,59,59,59,78,59,59,78,59,]),'QSTN':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,208,233,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'NEW':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,208,233,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'NOT':([24,25,28,30,34,47,48,59,60,61,64,78,80,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,125,126,130,131,141,157,180,183,188,194,196,208,213,233,],[64,64,64,80,64,64,64,64,64,64,64,80,80,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,80,80,64,64,64,64,64,64,64,80,64,64,80,64,]),'TRUE':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'FALSE':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'NUMBER':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'DATE':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'STRING':([24,25,28,34,47,48,57,59,60,61,64,69,81,100,101,102,103,104,105,106,107,108,109,110,111,112,113,117,119,130,131,141,157,180,183,188,196,198,208,220,230,233,],[69,69,69,69,69,69,113,69,69,69,69,-131,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-130,69,69,69,69,69,69,69,69,69,69,69,69,113,69,69,]),'UNDEFINED':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'COLON':([27,],[73,]),'FROM':([82,],[130,]),'EXPORT':([92,199,202,],[137,225,232,]),'VAL':([138,139,200,],[176,176,176,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'module':([0,],[1,]),'global_vars':([0,],[2,]),'proc_func_list':([0,36,],[3,85,]),'statements':([0,3,29,36,85,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[4,37,75,86,133,160,161,162,169,209,214,216,227,227,234,237,227,227,252,254,255,257,262,263,]),'directive':([0,3,36,85,],[5,40,87,40,]),'func_decl':([0,3,36,85,],[6,38,6,38,]),'proc_decl':([0,3,36,85,],[7,39,7,39,]),'statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[8,8,8,8,88,121,8,135,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'empty':([0,3,24,25,29,36,42,47,73,85,89,122,123,124,132,138,139,141,157,160,162,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[10,41,51,51,76,10,76,97,76,41,76,76,76,76,76,175,175,179,97,185,191,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'iteration_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'jump_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'if_else_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'try_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'labeled_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'preproc_statement':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'property':([0,3,24,25,28,29,34,36,42,47,48,59,60,61,64,73,81,85,89,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,122,123,124,130,131,132,141,157,180,183,187,188,193,195,196,199,202,207,208,212,225,232,233,236,239,241,244,251,253,],[18,18,53,53,53,18,53,18,18,53,53,53,53,53,53,18,53,18,18,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,18,18,18,53,53,18,53,53,53,53,18,53,18,18,53,18,18,18,53,18,18,18,53,18,18,18,18,18,18,]),'for_each_block':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'for_block':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'while_block':([0,3,29,36,42,73,85,89,122,123,124,132,187,193,195,199,202,207,212,225,232,236,239,241,244,251,253,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'prop_element':([0,3,24,25,28,29,34,36,42,47,48,49,59,60,61,64,73,81,85,89,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,122,123,124,130,131,132,141,157,180,183,187,188,193,195,196,199,202,207,208,212,225,232,233,236,239,241,244,251,253,],[31,31,31,31,31,31,31,31,31,31,31,99,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'func_call':([0,3,24,25,28,29,34,36,42,47,48,49,59,60,61,64,73,81,85,89,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,122,123,124,130,131,132,141,157,180,183,187,188,193,195,196,199,202,207,208,212,225,232,233,236,239,241,244,251,253,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'expr_opt':([24,25,],[50,71,]),'expr':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,208,233,],[52,52,74,84,96,98,114,115,116,120,129,142,143,144,145,146,147,148,149,150,151,152,153,154,156,159,167,168,178,96,203,205,210,217,235,250,]),'bool':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,219,54,219,54,]),'number':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,221,55,221,55,]),'date':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,222,56,222,56,]),'strings':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,220,57,220,57,]),'undefined':([24,25,28,34,47,48,59,60,61,64,81,100,101,102,103,104,105,106,107,108,109,110,111,112,117,119,130,131,141,157,180,183,188,196,198,208,230,233,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,223,58,223,58,]),'preproc_expr':([30,78,80,125,126,194,213,],[77,127,128,163,164,215,238,]),'global_var_decl_list':([44,134,],[90,170,]),'global_var_decl':([44,134,136,],[91,91,171,]),'params_list':([47,157,],[95,181,]),'new_params_list':([119,],[158,]),'declarator_list':([138,139,],[173,177,]),'init_declarator':([138,139,200,],[174,174,229,]),'else_block':([160,],[184,]),'else_if_collection':([160,],[186,]),'preproc_else_block':([162,],[190,]),'preproc_else_if_collection':([162,],[192,]),'func_param_initializer':([198,230,],[218,247,]),'func_body':([199,202,225,232,],[224,231,243,249,]),'vars_decls_list':([199,202,225,232,],[226,226,226,226,]),'vars_list':([228,258,],[245,265,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> module","S'",1,None,None,None),
+  ('module -> global_vars SEMI proc_func_list statements','module',4,'p_module_1','parser1c.py',25),
+  ('module -> global_vars SEMI statements','module',3,'p_module_2','parser1c.py',29),
+  ('module -> proc_func_list statements','module',2,'p_module_3','parser1c.py',33),
+  ('module -> statements','module',1,'p_module_4','parser1c.py',37),
+  ('global_vars -> global_vars SEMI directive VAR global_var_decl_list','global_vars',5,'p_global_vars_1','parser1c.py',42),
+  ('global_vars -> directive VAR global_var_decl_list','global_vars',3,'p_global_vars_2','parser1c.py',47),
+  ('global_var_decl_list -> global_var_decl_list COMMA global_var_decl','global_var_decl_list',3,'p_global_var_decl_list_1','parser1c.py',51),
+  ('global_var_decl_list -> global_var_decl','global_var_decl_list',1,'p_global_var_decl_list_2','parser1c.py',56),
+  ('global_var_decl -> ID','global_var_decl',1,'p_global_var_decl_1','parser1c.py',60),
+  ('global_var_decl -> ID EXPORT','global_var_decl',2,'p_global_var_decl_2','parser1c.py',64),
+  ('directive -> DIRECTIVE','directive',1,'p_directive','parser1c.py',68),
+  ('directive -> empty','directive',1,'p_directive_empty','parser1c.py',72),
+  ('proc_func_list -> proc_func_list func_decl','proc_func_list',2,'p_func_decls','parser1c.py',78),
+  ('proc_func_list -> proc_func_list proc_decl','proc_func_list',2,'p_func_decls','parser1c.py',79),
+  ('proc_func_list -> func_decl','proc_func_list',1,'p_func_decls_one','parser1c.py',84),
+  ('proc_func_list -> proc_decl','proc_func_list',1,'p_func_decls_one','parser1c.py',85),
+  ('func_decl -> directive FUNCTION ID LPAREN declarator_list RPAREN func_body END_FUNCTION','func_decl',8,'p_func_decl','parser1c.py',91),
+  ('func_decl -> directive FUNCTION ID LPAREN declarator_list RPAREN EXPORT func_body END_FUNCTION','func_decl',9,'p_func_decl_export','parser1c.py',95),
+  ('proc_decl -> directive PROCEDURE ID LPAREN declarator_list RPAREN func_body END_PROCEDURE','proc_decl',8,'p_proc_decl','parser1c.py',99),
+  ('proc_decl -> directive PROCEDURE ID LPAREN declarator_list RPAREN EXPORT func_body END_PROCEDURE','proc_decl',9,'p_proc_decl_export','parser1c.py',103),
+  ('declarator_list -> declarator_list COMMA init_declarator','declarator_list',3,'p_init_declarator_list_1','parser1c.py',107),
+  ('declarator_list -> init_declarator','declarator_list',1,'p_init_declarator_list_2','parser1c.py',112),
+  ('declarator_list -> empty','declarator_list',1,'p_init_declarator_list_3','parser1c.py',116),
+  ('init_declarator -> ID','init_declarator',1,'p_init_declarator_1','parser1c.py',120),
+  ('init_declarator -> VAL ID','init_declarator',2,'p_init_declarator_2','parser1c.py',124),
+  ('init_declarator -> ID EQ func_param_initializer','init_declarator',3,'p_init_declarator_3','parser1c.py',128),
+  ('init_declarator -> VAL ID EQ func_param_initializer','init_declarator',4,'p_init_declarator_4','parser1c.py',132),
+  ('func_param_initializer -> bool','func_param_initializer',1,'p_initializer','parser1c.py',136),
+  ('func_param_initializer -> strings','func_param_initializer',1,'p_initializer','parser1c.py',137),
+  ('func_param_initializer -> number','func_param_initializer',1,'p_initializer','parser1c.py',138),
+  ('func_param_initializer -> date','func_param_initializer',1,'p_initializer','parser1c.py',139),
+  ('func_param_initializer -> undefined','func_param_initializer',1,'p_initializer','parser1c.py',140),
+  ('func_body -> vars_decls_list SEMI statements','func_body',3,'p_func_body_1','parser1c.py',148),
+  ('func_body -> vars_decls_list','func_body',1,'p_func_body_vars_decls_list','parser1c.py',152),
+  ('func_body -> statements','func_body',1,'p_func_body_statements','parser1c.py',156),
+  ('vars_decls_list -> vars_decls_list SEMI VAR vars_list','vars_decls_list',4,'p_perem_decl_list_1','parser1c.py',160),
+  ('vars_decls_list -> VAR vars_list','vars_decls_list',2,'p_perem_decl_list_2','parser1c.py',165),
+  ('vars_list -> vars_list COMMA ID','vars_list',3,'p_perems_list_1','parser1c.py',169),
+  ('vars_list -> ID','vars_list',1,'p_perems_list_2','parser1c.py',174),
+  ('statements -> statements SEMI statement','statements',3,'p_statements_list','parser1c.py',180),
+  ('statements -> statement','statements',1,'p_statements_simple','parser1c.py',187),
+  ('statements -> statements error SEMI statement','statements',4,'p_statements_error','parser1c.py',191),
+  ('statement -> iteration_statement','statement',1,'p_statement_block','parser1c.py',197),
+  ('statement -> jump_statement','statement',1,'p_statement_block','parser1c.py',198),
+  ('statement -> if_else_statement','statement',1,'p_statement_block','parser1c.py',199),
+  ('statement -> try_statement','statement',1,'p_statement_block','parser1c.py',200),
+  ('statement -> labeled_statement','statement',1,'p_statement_block','parser1c.py',201),
+  ('statement -> preproc_statement','statement',1,'p_statement_block','parser1c.py',202),
+  ('statement -> property EQ expr','statement',3,'p_statement_eq','parser1c.py',206),
+  ('statement -> property','statement',1,'p_statement_func_call','parser1c.py',210),
+  ('statement -> empty','statement',1,'p_statement_empty','parser1c.py',216),
+  ('try_statement -> TRY statements EXCEPTION statements END_TRY','try_statement',5,'p_try_statement','parser1c.py',220),
+  ('labeled_statement -> LABEL COLON statement','labeled_statement',3,'p_labeled_statement','parser1c.py',226),
+  ('if_else_statement -> IF expr THEN statements else_block END_IF','if_else_statement',6,'p_if_else_statement','parser1c.py',232),
+  ('else_block -> empty','else_block',1,'p_else_block_empty','parser1c.py',236),
+  ('else_block -> else_if_collection ELSE statements','else_block',3,'p_else_block_1','parser1c.py',240),
+  ('else_block -> else_if_collection','else_block',1,'p_else_block_2','parser1c.py',245),
+  ('else_block -> ELSE statements','else_block',2,'p_else_block_3','parser1c.py',249),
+  ('else_if_collection -> else_if_collection ELSE_IF expr THEN statements','else_if_collection',5,'p_else_if_collection_1','parser1c.py',253),
+  ('else_if_collection -> ELSE_IF expr THEN statements','else_if_collection',4,'p_else_if_collection_2','parser1c.py',258),
+  ('iteration_statement -> for_each_block','iteration_statement',1,'p_iteration_statement','parser1c.py',264),
+  ('iteration_statement -> for_block','iteration_statement',1,'p_iteration_statement','parser1c.py',265),
+  ('iteration_statement -> while_block','iteration_statement',1,'p_iteration_statement','parser1c.py',266),
+  ('for_each_block -> FOR_EACH ID FROM expr DO statements END_DO','for_each_block',7,'p_for_each','parser1c.py',270),
+  ('for_block -> FOR ID EQ expr TO expr DO statements END_DO','for_block',9,'p_for_block','parser1c.py',274),
+  ('while_block -> WHILE expr DO statements END_DO','while_block',5,'p_while_block','parser1c.py',278),
+  ('jump_statement -> CONTINUE','jump_statement',1,'p_jump_statement','parser1c.py',283),
+  ('jump_statement -> BREAK','jump_statement',1,'p_jump_statement','parser1c.py',284),
+  ('jump_statement -> RETURN expr_opt','jump_statement',2,'p_jump_statement_two','parser1c.py',288),
+  ('jump_statement -> RAISE expr_opt','jump_statement',2,'p_jump_statement_two','parser1c.py',289),
+  ('jump_statement -> GOTO LABEL','jump_statement',2,'p_jump_statement_two','parser1c.py',290),
+  ('expr_opt -> empty','expr_opt',1,'p_expr_opt_1','parser1c.py',294),
+  ('expr_opt -> expr','expr_opt',1,'p_expr_opt_2','parser1c.py',298),
+  ('preproc_statement -> DEF_IF preproc_expr THEN statements preproc_else_block DEF_END_IF','preproc_statement',6,'p_preproc_if_else_block','parser1c.py',304),
+  ('preproc_else_block -> empty','preproc_else_block',1,'p_preproc_else_block_empty','parser1c.py',308),
+  ('preproc_else_block -> preproc_else_if_collection DEF_ELSE statements','preproc_else_block',3,'p_preproc_else_block_1','parser1c.py',312),
+  ('preproc_else_block -> preproc_else_if_collection','preproc_else_block',1,'p_preproc_else_block_2','parser1c.py',317),
+  ('preproc_else_block -> DEF_ELSE statements','preproc_else_block',2,'p_preproc_else_block_3','parser1c.py',321),
+  ('preproc_else_if_collection -> preproc_else_if_collection DEF_ELSE_IF preproc_expr THEN statements','preproc_else_if_collection',5,'p_preproc_else_if_collection_1','parser1c.py',325),
+  ('preproc_else_if_collection -> DEF_ELSE_IF preproc_expr THEN statements','preproc_else_if_collection',4,'p_preproc_else_if_collection_2','parser1c.py',330),
+  ('preproc_expr -> preproc_expr AND preproc_expr','preproc_expr',3,'p_preproc_expr_binary','parser1c.py',334),
+  ('preproc_expr -> preproc_expr OR preproc_expr','preproc_expr',3,'p_preproc_expr_binary','parser1c.py',335),
+  ('preproc_expr -> LPAREN preproc_expr RPAREN','preproc_expr',3,'p_preproc_expr_rb','parser1c.py',339),
+  ('preproc_expr -> ID','preproc_expr',1,'p_preproc_expr_simple','parser1c.py',343),
+  ('preproc_expr -> NOT preproc_expr','preproc_expr',2,'p_preproc_expr_not','parser1c.py',347),
+  ('property -> property DOT prop_element','property',3,'p_property_1','parser1c.py',354),
+  ('property -> prop_element','property',1,'p_property_2','parser1c.py',363),
+  ('prop_element -> prop_element LSB expr RSB','prop_element',4,'p_prop_element_1','parser1c.py',367),
+  ('prop_element -> func_call','prop_element',1,'p_prop_element_2','parser1c.py',375),
+  ('prop_element -> ID','prop_element',1,'p_prop_element_3','parser1c.py',379),
+  ('func_call -> ID LPAREN params_list RPAREN','func_call',4,'p_func_call','parser1c.py',383),
+  ('expr -> property','expr',1,'p_expr_simple','parser1c.py',389),
+  ('expr -> bool','expr',1,'p_expr_simple','parser1c.py',390),
+  ('expr -> number','expr',1,'p_expr_simple','parser1c.py',391),
+  ('expr -> date','expr',1,'p_expr_simple','parser1c.py',392),
+  ('expr -> strings','expr',1,'p_expr_simple','parser1c.py',393),
+  ('expr -> undefined','expr',1,'p_expr_simple','parser1c.py',394),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','parser1c.py',398),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binary','parser1c.py',402),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binary','parser1c.py',403),
+  ('expr -> expr TIMES expr','expr',3,'p_expr_binary','parser1c.py',404),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binary','parser1c.py',405),
+  ('expr -> expr MOD expr','expr',3,'p_expr_binary','parser1c.py',406),
+  ('expr -> expr OR expr','expr',3,'p_expr_binary','parser1c.py',407),
+  ('expr -> expr AND expr','expr',3,'p_expr_binary','parser1c.py',408),
+  ('expr -> expr NOT_EQ expr','expr',3,'p_expr_binary','parser1c.py',409),
+  ('expr -> expr LT expr','expr',3,'p_expr_binary','parser1c.py',410),
+  ('expr -> expr LE expr','expr',3,'p_expr_binary','parser1c.py',411),
+  ('expr -> expr GT expr','expr',3,'p_expr_binary','parser1c.py',412),
+  ('expr -> expr GE expr','expr',3,'p_expr_binary','parser1c.py',413),
+  ('expr -> expr EQ expr','expr',3,'p_expr_binary','parser1c.py',414),
+  ('expr -> QSTN LPAREN expr COMMA expr COMMA expr RPAREN','expr',8,'p_expr_qstn','parser1c.py',419),
+  ('expr -> NEW ID','expr',2,'p_expr_new_1','parser1c.py',423),
+  ('expr -> NEW ID LPAREN params_list RPAREN','expr',5,'p_expr_new_2','parser1c.py',427),
+  ('expr -> NEW LPAREN new_params_list RPAREN','expr',4,'p_expr_new_3','parser1c.py',431),
+  ('new_params_list -> new_params_list COMMA expr','new_params_list',3,'p_new_params_list_1','parser1c.py',435),
+  ('new_params_list -> expr','new_params_list',1,'p_new_params_list_2','parser1c.py',440),
+  ('expr -> NOT expr','expr',2,'p_expr_not','parser1c.py',444),
+  ('expr -> MINUS expr','expr',2,'p_expr_uminus','parser1c.py',448),
+  ('expr -> PLUS expr','expr',2,'p_expr_uplus','parser1c.py',452),
+  ('params_list -> params_list COMMA expr','params_list',3,'p_params_list_1','parser1c.py',456),
+  ('params_list -> params_list COMMA empty','params_list',3,'p_params_list_2','parser1c.py',462),
+  ('params_list -> empty','params_list',1,'p_params_list_empty','parser1c.py',468),
+  ('params_list -> expr','params_list',1,'p_params_list_expr','parser1c.py',472),
+  ('bool -> TRUE','bool',1,'p_bool','parser1c.py',478),
+  ('bool -> FALSE','bool',1,'p_bool','parser1c.py',479),
+  ('number -> NUMBER','number',1,'p_number','parser1c.py',483),
+  ('date -> DATE','date',1,'p_date','parser1c.py',487),
+  ('undefined -> UNDEFINED','undefined',1,'p_undefined','parser1c.py',491),
+  ('strings -> strings STRING','strings',2,'p_strings_list','parser1c.py',495),
+  ('strings -> STRING','strings',1,'p_strings','parser1c.py',500),
+  ('empty -> <empty>','empty',0,'p_empty','parser1c.py',504),
+]
+_grammarversion = 'd129727d55a4'
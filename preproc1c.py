@@ -1,5 +1,200 @@
 # -*- coding: utf-8 -*-
 
+## Символы препроцессора
+
+def is_client(symbol):
+    """Клиент|Client"""
+    return symbol.lower().find('клиент') != -1 or symbol.lower().find('client')
+
+def is_server(symbol):
+    """Сервер|Server"""
+    return symbol.lower().find('сервер') != -1 or symbol.lower().find('server')
+
+def is_external_connection(symbol):
+    """ВнешнееСоединение|ExternalConnection"""
+    return symbol.lower() == "внешнеесоединение" or symbol.lower() == "externalconnection"
+
+def is_at_client(symbol):
+    """НаКлиенте|AtClient"""
+    return is_client(symbol)
+
+def is_at_server(symbol):
+    """НаСервере|AtServer"""
+    return is_server(symbol)
+
+def is_mobile_app_client(symbol):
+    """МобильноеПриложениеКлиент|MobileAppClient"""
+    return symbol.lower() == "мобильноеприложениеклиент" or symbol.lower() == "mobileappclient"
+
+def is_mobile_app_server(symbol):
+    """МобильноеПриложениеСервер|MobileAppServer"""
+    return symbol.lower() == "мобильноеприложениесервер" or symbol.lower() == "mobileappserver"
+
+def is_thick_client_ordinary_application(symbol):
+    """ТолстыйКлиентОбычноеПриложение|ThickClientOrdinaryApplication"""
+    return symbol.lower() == "толстыйклиентобычноеприложение" or symbol.lower() == "thickclientordinaryapplication"
+
+def is_thick_client_managed_application(symbol):
+    """ТолстыйКлиентУправляемоеПриложение|ThickClientManagedApplication"""
+    return symbol.lower() == "толстыйклиентуправляемоеприложение" or symbol.lower() == "thickclientmanagedapplication"
+
+def is_thin_client(symbol):
+    """ТонкийКлиент|ThinClient"""
+    return symbol.lower() == "тонкийклиент" or symbol.lower() == "thinclient"
+
+def is_web_client(symbol):
+    """ВебКлиент|WebClient"""
+    return symbol.lower() == "вебклиент" or symbol.lower() == "webclient"
+
+
+# Соответствия имен символов препроцессора функциям вычисления, формируются при первом обращении
+__gl_symbol_calculators = None
+
+def get_symbol_calculators():
+    '''
+    Формирует соответствие имени символа препроцессора функции, которая вычислит его значение для режима.
+    Соответствия формируются по строкам документации функций is_* один раз.
+    @return (tuple): соответствия для русских и для английских имен символов (в нижнем регистре)
+    '''
+    global __gl_symbol_calculators
+    if __gl_symbol_calculators is None:
+        symcalc_ru = {}
+        symcalc_en = {}
+        for func_name, func in globals().items():
+            if func_name[:3] == "is_":
+                symname_ru, symname_en = func.__doc__.split("|")
+                symcalc_ru[symname_ru.lower()] = func
+                symcalc_en[symname_en.lower()] = func
+        __gl_symbol_calculators = symcalc_ru, symcalc_en
+    return __gl_symbol_calculators
+
+
+def condition_should_be_retained(tokens, symbols_to_retain):
+    """
+    Проверяет, что все все перечисленные токены содержаться в symbols_to_retain.
+    Если так, то необходимо оставить условие "как есть" и возвратить весь текст включая препроцессор.
+    Символы сравниваются по функциям вычисления (см. get_symbol_calculators()), поэтому русское и английское
+    имя символа равнозначны: AtClient сохраняется так же, как НаКлиенте.
+    @param tokens (list): токены из условия препроцессора (в нижнем регистре)
+    @param symbols_to_retain (list): символы препроцессора, условия из которых сохраняются
+    @return (bool): True - условие необходимо сохранить, Иначе False
+    """
+    symcalc_ru, symcalc_en = get_symbol_calculators()
+
+    def get_calculator(symbol):
+        # неизвестный символ сравнивается по имени
+        symbol = symbol.lower()
+        return symcalc_ru.get(symbol) or symcalc_en.get(symbol) or symbol
+
+    symbols_to_retain = {get_calculator(x) for x in symbols_to_retain}
+    for token in tokens:
+        if token in {"не", "и", "или", "not", "and", "or", "(", ")"}:
+            pass
+        elif not get_calculator(token) in symbols_to_retain:
+            return False
+    return True
+
+
+## Условия препроцессора
+
+# Операции условия препроцессора на обоих языках -> операция синтаксической структуры условия
+CONDITION_OPERATORS = {"не": "не", "not": "не", "и": "и", "and": "и", "или": "или", "or": "или", "(": "(", ")": ")"}
+
+def parse_condition(tokens):
+    """
+    Разбирает условие препроцессора в синтаксическую структуру с приоритетами операций python:
+    НЕ связывает сильнее И, И - сильнее ИЛИ.
+    Структура - кортежи: ("не", условие), ("и", условие, условие), ("или", условие, условие),
+    ("символ", функция вычисления символа, см. get_symbol_calculators()).
+    @param tokens (tuple): токены условия, операции - как в CONDITION_OPERATORS
+    @return (tuple): синтаксическая структура условия
+    @raise KeyError: символ препроцессора не известен
+    @raise SyntaxError: условие не разбирается
+    """
+    symcalc_ru, symcalc_en = get_symbol_calculators()
+    index = 0
+
+    def error():
+        raise SyntaxError("Не верное условие препроцессора: " + " ".join(tokens))
+
+    def parse_or():
+        nonlocal index
+        left = parse_and()
+        while index < len(tokens) and tokens[index] == "или":
+            index += 1
+            left = ("или", left, parse_and())
+        return left
+
+    def parse_and():
+        nonlocal index
+        left = parse_not()
+        while index < len(tokens) and tokens[index] == "и":
+            index += 1
+            left = ("и", left, parse_not())
+        return left
+
+    def parse_not():
+        nonlocal index
+        if index >= len(tokens):
+            error()
+        token = tokens[index]
+        index += 1
+        if token == "не":
+            return ("не", parse_not())
+        if token == "(":
+            expr = parse_or()
+            if index >= len(tokens) or tokens[index] != ")":
+                error()
+            index += 1
+            return expr
+        if token in CONDITION_OPERATORS.values():
+            error()
+        return ("символ", symcalc_ru.get(token) or symcalc_en[token])
+
+    result = parse_or()
+    if index != len(tokens):
+        error()
+    return result
+
+def calc_condition(condition, mode):
+    """
+    @param condition (tuple): синтаксическая структура условия, см. parse_condition()
+    @param mode (str): контекст исполнения кода 1С
+    @return (bool): значение условия
+    """
+    operation = condition[0]
+    if operation == "символ":
+        return bool(condition[1](mode))
+    if operation == "не":
+        return not calc_condition(condition[1], mode)
+    if operation == "и":
+        return calc_condition(condition[1], mode) and calc_condition(condition[2], mode)
+    return calc_condition(condition[1], mode) or calc_condition(condition[2], mode)
+
+# Значения условий: (токены условия, контекст исполнения) -> значение; условия одинаковы во всех модулях
+__gl_conditions = {}
+
+def eval_condition(tokens, mode):
+    """
+    Вычисляет значение условия препроцессора. Условие разбирается один раз (см. parse_condition()),
+    значение запоминается для пары (условие, контекст исполнения).
+    @param tokens (list): токены из условия препроцессора (в нижнем регистре)
+    @param mode (str): контекст исполнения кода 1С
+    @return (bool): значение условия
+    """
+    key = (tuple(CONDITION_OPERATORS.get(token, token) for token in tokens), mode)
+    result = __gl_conditions.get(key)
+    if result is None:
+        result = calc_condition(parse_condition(key[0]), mode)
+        __gl_conditions[key] = result
+    return result
+
+
+def join_lines(lines):
+    # текст из строк, каждая строка завершается переводом строки
+    return '\n'.join(lines) + '\n' if lines else ""
+
+
 class Preprocessor1C:
     '''
     Выполняет вычисление и удаление инструкций препроцессора, а так же областей в коде 1С.
@@ -53,7 +248,8 @@ class Preprocessor1C:
 
         text_lines = self.text.split('\n')
         index = 0
-        new_text = ""
+        # строки результата, объединяются один раз
+        new_lines = []
 
         while index < len(text_lines):
             line = text_lines[index]
@@ -72,9 +268,9 @@ class Preprocessor1C:
                 continue
             elif codeline_is_area_end(line):
                 continue
-            new_text += line + '\n'
+            new_lines.append(line)
 
-        return new_text
+        return join_lines(new_lines)
 
     def do_preproc(self, mode, symbols_to_retain):
         """
@@ -92,65 +288,7 @@ class Preprocessor1C:
         @return:
         """
 
-        def is_client(symbol):
-            """Клиент|Client"""
-            return symbol.lower().find('клиент') != -1 or symbol.lower().find('client')
-
-        def is_server(symbol):
-            """Сервер|Server"""
-            return symbol.lower().find('сервер') != -1 or symbol.lower().find('server')
-
-        def is_external_connection(symbol):
-            """ВнешнееСоединение|ExternalConnection"""
-            raise Exception("Не поддерживается")
-
-        def is_at_client(symbol):
-            """НаКлиенте|AtClient"""
-            return is_client(symbol)
-
-        def is_at_server(symbol):
-            """НаСервере|AtServer"""
-            return is_server(symbol)
-
-        def is_mobile_app_client(symbol):
-            """МобильноеПриложениеКлиент|MobileAppClient"""
-            return symbol.lower() == "мобильноеприложениеклиент" or symbol.lower() == "mobileappclient"
-
-        def is_mobile_app_server(symbol):
-            """МобильноеПриложениеСервер|MobileAppServer"""
-            return symbol.lower() == "мобильноеприложениесервер" or symbol.lower() == "mobileappserver"
-
-        def is_thick_client_ordinary_application(symbol):
-            """ТолстыйКлиентОбычноеПриложение|ThickClientOrdinaryApplication"""
-            return symbol.lower() == "толстыйклиентобычноеприложение" or symbol.lower() == "thickclientordinaryapplication"
-
-        def is_thick_client_managed_application(symbol):
-            """ТолстыйКлиентУправляемоеПриложение|ThickClientManagedApplication"""
-            return symbol.lower() == "толстыйклиентуправляемоеприложение" or symbol.lower() == "thickclientmanagedapplication"
-
-        def is_thin_client(symbol):
-            """ТонкийКлиент|ThinClient"""
-            return symbol.lower() == "тонкийклиент" or symbol.lower() == "thinclient"
-
-        def is_web_client(symbol):
-            """ВебКлиент|WebClient"""
-            return symbol.lower() == "вебклиент" or symbol.lower() == "webclient"
-
-        ## Этап №1. Формирование соотвествия имени символа препроцессора функции, которая
-        ##           вычислит его значение для текущего режима.
-
-        func_list = [func_name for func_name in dir() if func_name[:3]=="is_"]
-        symcalc_ru = {}
-        symcalc_en = {}
-
-        for func_name in func_list:
-            func_desc_list = eval(func_name + ".__doc__").split("|")
-            symname_ru = func_desc_list[0]
-            symname_en = func_desc_list[1]
-            symcalc_ru[symname_ru.lower()] = eval(func_name)
-            symcalc_en[symname_en.lower()] = eval(func_name)
-
-        ## Этап №2. Проход по коду, вычисление препроцессора
+        ## Проход по коду, вычисление препроцессора (символы препроцессора - см. get_symbol_calculators())
 
         def check_begin_with(line, keyword):
             """
@@ -213,55 +351,9 @@ class Preprocessor1C:
             tokens = [x.lower() for x in tokens]
             return tokens
 
-        def check_define_should_be_retained(tokens):
-            """
-            Проверяет, что все все перечисленные токены содержаться в symbols_to_retain.
-            Если так, то необходимо оставить условие "как есть" и возвратить весь текст включая препроцессор.
-            @param tokens (list): токены из условия препроцессора
-            @return (bool): True - условие необходимо сохранить, Иначе False
-            """
-            nonlocal symbols_to_retain
-            retain = True
-            symbols_to_retain = {x.lower() for x in symbols_to_retain}
-
-            for token in tokens:
-                if token in {"не", "и", "или", "(", ")"}:
-                    pass
-                elif not token in symbols_to_retain:
-                    retain = False
-                    break
-            return retain
-
-        def eval_cond(tokens):
-            """
-            Пересобирает логическое выражение в терминах python и вычисляет его через eval.
-            @param tokens:
-            @return:
-            """
-
-            nonlocal symcalc_ru
-            nonlocal symcalc_en
-
-            expr = ""
-            for token in tokens:
-                if token == "не":
-                    expr += "not"
-                elif token == "и":
-                    expr += "and"
-                elif token == "или":
-                    expr += "or"
-                elif token in {"(", ")"}:
-                    expr += token
-                else:
-                    result = symcalc_ru[token](mode)
-                    expr += "True" if result else "False"
-                expr += " "
-            return eval(expr)
-
-
         def preproc_block():
             """
-            Вычисляет блок препроцессора и возвращает участок кода.
+            Вычисляет блок препроцессора и добавляет участок кода в new_lines.
                 #Если <условие препроцессора> Тогда
                     ..
                 #ИначеЕсли <условие препроцессора> Тогда
@@ -272,7 +364,6 @@ class Preprocessor1C:
 
             @param text_lines (list): строки кода
             @param index (int): текущий индекс
-            @return (str): участок кода (строка)
             """
 
             nonlocal text_lines
@@ -280,8 +371,6 @@ class Preprocessor1C:
             nonlocal mode
             nonlocal symbols_to_retain
 
-            new_text = ""
-
             # Признак, что какой то из блоков инструкции препроцессора уже был выбран.
             # Используется для того что бы пропустить остальные блоки условий.
             # Если не выбрано ни одно условие, выбирается блок #Иначе (если присутствует).
@@ -309,14 +398,14 @@ class Preprocessor1C:
                     cond = codeline_condition_text(text_lines[index])
                     # Разбить условие препроцессора на токены
                     tokens = get_expr_tokens(cond)
-                    choose_block = eval_cond(tokens)
+                    choose_block = eval_condition(tokens, mode)
 
                     # Проверить, что условие необходимо оставить "как есть", без удаления
                     if preproc_if(text_lines[index]):
-                        retain = check_define_should_be_retained(tokens)
+                        retain = condition_should_be_retained(tokens, symbols_to_retain)
 
                 if retain:
-                    new_text += text_lines[index] + '\n'
+                    new_lines.append(text_lines[index])
 
                 if (not already_chosen and choose_block) or retain:
                     already_chosen = True
@@ -325,12 +414,14 @@ class Preprocessor1C:
                         line = text_lines[index]
                         if preproc_if(line):
                             # Начало нового условия препроцессора.
-                            # Вызываем функцию рекурсивно для расчёта внутреннего блока.
-                            new_text += preproc_block() + '\n'
+                            # Вызываем функцию рекурсивно для расчёта внутреннего блока,
+                            # после внутреннего блока добавляется пустая строка.
+                            preproc_block()
+                            new_lines.append('')
                         elif preproc_line(line):
                             break
                         else:
-                            new_text += line + '\n'
+                            new_lines.append(line)
                 else:
                     # Пропускаем простые строки внутренние блоки препроцессора до
                     # тех пор пока не встретится "#ИначеЕсли" или "#Иначе" или "#КонецЕсли"
@@ -347,23 +438,23 @@ class Preprocessor1C:
                             break
 
             if retain:
-                new_text += text_lines[index] + '\n'
+                new_lines.append(text_lines[index])
 
             index += 1
-            return new_text
 
         text_lines = self.text.split('\n')
         index = 0
-        new_text = ""
+        # строки результата всех уровней вложенности блоков, объединяются один раз
+        new_lines = []
 
         while index < len(text_lines):
             line = text_lines[index]
             if preproc_if(line):
-                new_text += preproc_block()
+                preproc_block()
             else:
-                new_text += line + '\n'
+                new_lines.append(line)
                 index += 1
-        return new_text
+        return join_lines(new_lines)
 
 if __name__ == '__main__':
     data = open("samples/sample.1c", encoding='utf-8').read()
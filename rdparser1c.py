@@ -0,0 +1,583 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# rdparser1c.py
+#
+# recursive-descent parser for a 1C:Enterprise embedded language "1C",
+# an alternative backend to the ply LALR parser of parser1c
+# ------------------------------------------------------------
+from epfcomp import lexer1c
+from epfcomp import names1c
+from epfcomp import parser1c
+from epfcomp import strct1c
+
+TOKEN_CODES = lexer1c.TOKEN_CODES
+ID_CODE = TOKEN_CODES['ID']
+DIRECTIVE_CODE = TOKEN_CODES['DIRECTIVE']
+VAR_CODE = TOKEN_CODES['VAR']
+EXPORT_CODE = TOKEN_CODES['EXPORT']
+VAL_CODE = TOKEN_CODES['VAL']
+FUNCTION_CODE = TOKEN_CODES['FUNCTION']
+PROCEDURE_CODE = TOKEN_CODES['PROCEDURE']
+END_FUNCTION_CODE = TOKEN_CODES['END_FUNCTION']
+END_PROCEDURE_CODE = TOKEN_CODES['END_PROCEDURE']
+SEMI_CODE = TOKEN_CODES['SEMI']
+COMMA_CODE = TOKEN_CODES['COMMA']
+COLON_CODE = TOKEN_CODES['COLON']
+DOT_CODE = TOKEN_CODES['DOT']
+LPAREN_CODE = TOKEN_CODES['LPAREN']
+RPAREN_CODE = TOKEN_CODES['RPAREN']
+LSB_CODE = TOKEN_CODES['LSB']
+RSB_CODE = TOKEN_CODES['RSB']
+EQ_CODE = TOKEN_CODES['EQ']
+IF_CODE = TOKEN_CODES['IF']
+THEN_CODE = TOKEN_CODES['THEN']
+ELSE_IF_CODE = TOKEN_CODES['ELSE_IF']
+ELSE_CODE = TOKEN_CODES['ELSE']
+END_IF_CODE = TOKEN_CODES['END_IF']
+FOR_CODE = TOKEN_CODES['FOR']
+FOR_EACH_CODE = TOKEN_CODES['FOR_EACH']
+FROM_CODE = TOKEN_CODES['FROM']
+TO_CODE = TOKEN_CODES['TO']
+WHILE_CODE = TOKEN_CODES['WHILE']
+DO_CODE = TOKEN_CODES['DO']
+END_DO_CODE = TOKEN_CODES['END_DO']
+TRY_CODE = TOKEN_CODES['TRY']
+EXCEPTION_CODE = TOKEN_CODES['EXCEPTION']
+END_TRY_CODE = TOKEN_CODES['END_TRY']
+CONTINUE_CODE = TOKEN_CODES['CONTINUE']
+BREAK_CODE = TOKEN_CODES['BREAK']
+RETURN_CODE = TOKEN_CODES['RETURN']
+RAISE_CODE = TOKEN_CODES['RAISE']
+GOTO_CODE = TOKEN_CODES['GOTO']
+LABEL_CODE = TOKEN_CODES['LABEL']
+DEF_IF_CODE = TOKEN_CODES['DEF_IF']
+DEF_ELSE_IF_CODE = TOKEN_CODES['DEF_ELSE_IF']
+DEF_ELSE_CODE = TOKEN_CODES['DEF_ELSE']
+DEF_END_IF_CODE = TOKEN_CODES['DEF_END_IF']
+NOT_CODE = TOKEN_CODES['NOT']
+AND_CODE = TOKEN_CODES['AND']
+OR_CODE = TOKEN_CODES['OR']
+PLUS_CODE = TOKEN_CODES['PLUS']
+MINUS_CODE = TOKEN_CODES['MINUS']
+TRUE_CODE = TOKEN_CODES['TRUE']
+FALSE_CODE = TOKEN_CODES['FALSE']
+NUMBER_CODE = TOKEN_CODES['NUMBER']
+DATE_CODE = TOKEN_CODES['DATE']
+STRING_CODE = TOKEN_CODES['STRING']
+UNDEFINED_CODE = TOKEN_CODES['UNDEFINED']
+QSTN_CODE = TOKEN_CODES['QSTN']
+NEW_CODE = TOKEN_CODES['NEW']
+# Конец потока токенов
+END_CODE = -1
+
+def get_binary_levels():
+    '''
+    Уровни приоритета бинарных операций - по таблице приоритетов грамматики parser1c.precedence
+    (левоассоциативные операции, чем больше уровень - тем сильнее связывание).
+    @return (dict): код типа токена операции -> уровень приоритета
+    '''
+    result = {}
+    for level, (assoc, *names) in enumerate(parser1c.precedence, 1):
+        if assoc == 'left':
+            for name in names:
+                result[TOKEN_CODES[name]] = level
+    return result
+
+BINARY_LEVELS = get_binary_levels()
+UNARY_CODES = {NOT_CODE, MINUS_CODE, PLUS_CODE}
+INITIALIZER_CODES = {TRUE_CODE, FALSE_CODE, STRING_CODE, NUMBER_CODE, DATE_CODE, UNDEFINED_CODE}
+# Токены, с которых начинается выражение: после Возврат/ВызватьИсключение без них выражение пустое
+EXPR_START_CODES = UNARY_CODES | INITIALIZER_CODES | {ID_CODE, LPAREN_CODE, QSTN_CODE, NEW_CODE}
+
+class ParserError(Exception):
+    '''
+    Синтаксическая ошибка: токен, не допустимый грамматикой. Сообщения об ошибках и восстановление
+    после них выполняет синтаксический процессор ply (см. parser1c.Parser1C.parse_tokens()).
+    '''
+    pass
+
+class Parser:
+    '''
+    Разбор рекурсивным спуском по грамматике parser1c: каждое правило грамматики - метод parse_*,
+    выражения разбираются по уровням приоритета операций. Узлы strct1c создаются в том же порядке
+    и с теми же значениями, что и в действиях правил parser1c.
+    '''
+    def __init__(self, buffer, start=0, stop=None, positions=None):
+        stop = len(buffer) if stop is None else stop
+        self.buffer = buffer
+        self.start = start
+        # таблица позиций операторов и процедур/функций (parser1c.SourcePositions), None - не записываются
+        self.positions = positions
+        # коды типов токенов диапазона и признак конца потока
+        self.types = buffer.types[start:stop].tolist()
+        self.types.append(END_CODE)
+        self.index = 0
+
+    def error(self):
+        index = self.index
+        if index < len(self.types) - 1:
+            raise ParserError("Синтаксическая ошибка в строке %d: %s" % (
+                self.buffer.lines[self.start + index], lexer1c.TOKEN_TYPES[self.types[index]]))
+        raise ParserError("Синтаксическая ошибка: неожиданный конец модуля")
+
+    def value(self):
+        # значение текущего токена, токен пропускается
+        index = self.index
+        self.index = index + 1
+        return self.buffer.value(self.start + index)
+
+    def id_value(self):
+        if self.types[self.index] != ID_CODE:
+            self.error()
+        # одинаковые идентификаторы в структуре модуля - один объект строки (см. lexer1c.TokenReader)
+        return names1c.intern(self.value())
+
+    def expect(self, code):
+        if self.types[self.index] != code:
+            self.error()
+        self.index += 1
+
+    def add_position(self, node, first):
+        # границы узла в тексте: от токена first до последнего разобранного токена
+        buffer = self.buffer
+        self.positions.add(node, buffer.starts[self.start + first], buffer.ends[self.start + self.index - 1])
+
+    ## module
+
+    def parse_module(self):
+        global_vars_list = self.parse_module_vars()
+        proc_funcs_list = []
+        while self.at_function():
+            proc_funcs_list.append(self.parse_function())
+        return self.parse_module_end(global_vars_list, proc_funcs_list)
+
+    def iter_module(self, collect=True):
+        '''
+        Разбор модуля с выдачей процедур и функций по мере разбора (см. parser1c.Parser1C.parse_stream()).
+        @param collect (bool): сохранять ли процедуры и функции в структуре модуля
+        @return (strct1c.Module): структура модуля - значение StopIteration генератора
+        '''
+        global_vars_list = self.parse_module_vars()
+        proc_funcs_list = []
+        while self.at_function():
+            function = self.parse_function()
+            if collect:
+                proc_funcs_list.append(function)
+            yield function
+        return self.parse_module_end(global_vars_list, proc_funcs_list)
+
+    def parse_module_vars(self):
+        types = self.types
+        code = types[self.index]
+        if code == VAR_CODE or code == DIRECTIVE_CODE and types[self.index + 1] == VAR_CODE:
+            return self.parse_global_vars()
+        return []
+
+    def at_function(self):
+        # начинается ли с текущего токена процедура/функция
+        code = self.types[self.index]
+        if code == DIRECTIVE_CODE:
+            code = self.types[self.index + 1]
+        return code == FUNCTION_CODE or code == PROCEDURE_CODE
+
+    def parse_module_end(self, global_vars_list, proc_funcs_list):
+        # операторы после процедур и функций и структура модуля
+        statements_list = self.parse_statements()
+        self.expect(END_CODE)
+        return strct1c.Module(statements_list=statements_list, proc_funcs_list=proc_funcs_list,
+                              global_vars_list=global_vars_list)
+
+    def parse_global_vars(self):
+        # объявления переменных модуля, каждое - с завершающим ";"
+        types = self.types
+        result = []
+        while True:
+            directive = self.value() if types[self.index] == DIRECTIVE_CODE else ""
+            self.expect(VAR_CODE)
+            vars_list = []
+            while True:
+                name = self.id_value()
+                if types[self.index] == EXPORT_CODE:
+                    self.index += 1
+                    vars_list.append(strct1c.VarDesc(name, True))
+                else:
+                    vars_list.append(strct1c.VarDesc(name))
+                if types[self.index] != COMMA_CODE:
+                    break
+                self.index += 1
+            result.append(strct1c.VariablesDeclaration(vars_list, directive))
+            self.expect(SEMI_CODE)
+            code = types[self.index]
+            if code != VAR_CODE and (code != DIRECTIVE_CODE or types[self.index + 1] != VAR_CODE):
+                return result
+
+    ## funcs & procs
+
+    def parse_function(self):
+        types = self.types
+        first = self.index
+        directive = self.value() if types[self.index] == DIRECTIVE_CODE else ""
+        is_function = types[self.index] == FUNCTION_CODE
+        self.index += 1
+        name = self.id_value()
+        self.expect(LPAREN_CODE)
+        vars_list = []
+        code = types[self.index]
+        if code != RPAREN_CODE and code != COMMA_CODE:
+            vars_list.append(self.parse_init_declarator())
+        # как и в грамматике, пустым может быть только первый параметр: Процедура П(, Б)
+        while types[self.index] == COMMA_CODE:
+            self.index += 1
+            vars_list.append(self.parse_init_declarator())
+        self.expect(RPAREN_CODE)
+        is_export = types[self.index] == EXPORT_CODE
+        if is_export:
+            self.index += 1
+        body = self.parse_func_body()
+        self.expect(END_FUNCTION_CODE if is_function else END_PROCEDURE_CODE)
+        function = strct1c.Function(is_function, is_export, directive, name, vars_list, body)
+        if self.positions is not None:
+            self.add_position(function, first)
+        return function
+
+    def parse_init_declarator(self):
+        is_val = self.types[self.index] == VAL_CODE
+        if is_val:
+            self.index += 1
+        name = self.id_value()
+        if self.types[self.index] != EQ_CODE:
+            return strct1c.FuncVarInitDecl(is_val, name)
+        self.index += 1
+        if self.types[self.index] not in INITIALIZER_CODES:
+            self.error()
+        return strct1c.FuncVarInitDecl(is_val, name, self.parse_primary())
+
+    def parse_func_body(self):
+        types = self.types
+        if types[self.index] != VAR_CODE:
+            return strct1c.FuncBody(vars_decls_list=[], statements=self.parse_statements())
+        vars_decls_list = []
+        while True:
+            self.index += 1
+            vars_list = [strct1c.VarDesc(self.id_value())]
+            while types[self.index] == COMMA_CODE:
+                self.index += 1
+                vars_list.append(strct1c.VarDesc(self.id_value()))
+            vars_decls_list.append(strct1c.VariablesDeclaration(vars_list))
+            if types[self.index] != SEMI_CODE:
+                return strct1c.FuncBody(vars_decls_list=vars_decls_list, statements=[])
+            self.index += 1
+            if types[self.index] != VAR_CODE:
+                return strct1c.FuncBody(vars_decls_list=vars_decls_list, statements=self.parse_statements())
+
+    ## statements
+
+    def parse_statements(self):
+        types = self.types
+        result = []
+        while True:
+            statement = self.parse_statement()
+            if statement is not None:
+                result.append(statement)
+            if types[self.index] != SEMI_CODE:
+                return result
+            self.index += 1
+
+    def parse_statement(self):
+        '''
+        @return (strct1c.Statement): оператор, None - пустой оператор
+        '''
+        first = self.index
+        code = self.types[first]
+        if code == ID_CODE:
+            prop = self.parse_property()
+            if self.types[self.index] == EQ_CODE:
+                self.index += 1
+                statement = strct1c.StatementAssignment(prop, self.parse_expr())
+            else:
+                statement = strct1c.StatementFuncCall(prop)
+        else:
+            parse = STATEMENT_PARSERS.get(code)
+            if not parse:
+                return None
+            statement = parse(self)
+        if self.positions is not None:
+            self.add_position(statement, first)
+        return statement
+
+    def parse_if(self):
+        self.index += 1
+        if_expression = self.parse_expr()
+        self.expect(THEN_CODE)
+        if_statements = self.parse_statements()
+        else_collection = []
+        while self.types[self.index] == ELSE_IF_CODE:
+            self.index += 1
+            condition = self.parse_expr()
+            self.expect(THEN_CODE)
+            else_collection.append(strct1c.ElseStatement(self.parse_statements(), condition))
+        if self.types[self.index] == ELSE_CODE:
+            self.index += 1
+            else_collection.append(strct1c.ElseStatement(self.parse_statements()))
+        self.expect(END_IF_CODE)
+        return strct1c.IfElseStatement(if_expression, if_statements, else_collection)
+
+    def parse_for_each(self):
+        self.index += 1
+        id_name = self.id_value()
+        self.expect(FROM_CODE)
+        expression = self.parse_expr()
+        self.expect(DO_CODE)
+        statements = self.parse_statements()
+        self.expect(END_DO_CODE)
+        return strct1c.ForEachBlock(id_name, expression, statements)
+
+    def parse_for(self):
+        self.index += 1
+        id_name = self.id_value()
+        self.expect(EQ_CODE)
+        expression_start = self.parse_expr()
+        self.expect(TO_CODE)
+        expression_end = self.parse_expr()
+        self.expect(DO_CODE)
+        statements = self.parse_statements()
+        self.expect(END_DO_CODE)
+        return strct1c.ForBlock(id_name, expression_start, expression_end, statements)
+
+    def parse_while(self):
+        self.index += 1
+        expression = self.parse_expr()
+        self.expect(DO_CODE)
+        statements = self.parse_statements()
+        self.expect(END_DO_CODE)
+        return strct1c.WhileBlock(expression, statements)
+
+    def parse_try(self):
+        self.index += 1
+        try_statements = self.parse_statements()
+        self.expect(EXCEPTION_CODE)
+        except_statements = self.parse_statements()
+        self.expect(END_TRY_CODE)
+        return strct1c.TryStatement(try_statements, except_statements)
+
+    def parse_labeled(self):
+        label_name = self.value()
+        self.expect(COLON_CODE)
+        statement = self.parse_statement()
+        return strct1c.LabeledStatement(label_name, strct1c.Empty() if statement is None else statement)
+
+    def parse_jump(self):
+        return strct1c.JumpStatemets(self.value())
+
+    def parse_jump_expr(self):
+        key_word = self.value()
+        if self.types[self.index] in EXPR_START_CODES:
+            return strct1c.JumpStatemets(key_word, self.parse_expr())
+        return strct1c.JumpStatemets(key_word, strct1c.Empty())
+
+    def parse_goto(self):
+        key_word = self.value()
+        if self.types[self.index] != LABEL_CODE:
+            self.error()
+        return strct1c.JumpStatemets(key_word, self.value())
+
+    ## preproc statement
+
+    def parse_preproc_if(self):
+        self.index += 1
+        if_expression = self.parse_preproc_expr()
+        self.expect(THEN_CODE)
+        if_statements = self.parse_statements()
+        else_collection = []
+        while self.types[self.index] == DEF_ELSE_IF_CODE:
+            self.index += 1
+            condition = self.parse_preproc_expr()
+            self.expect(THEN_CODE)
+            else_collection.append(strct1c.PreprocElse(self.parse_statements(), condition))
+        if self.types[self.index] == DEF_ELSE_CODE:
+            self.index += 1
+            else_collection.append(strct1c.PreprocElse(self.parse_statements()))
+        self.expect(DEF_END_IF_CODE)
+        return strct1c.PreprocIfElseStatement(if_expression, if_statements, else_collection)
+
+    def parse_preproc_expr(self):
+        # И, ИЛИ - один уровень приоритета, левоассоциативные
+        left = self.parse_preproc_unary()
+        while self.types[self.index] == AND_CODE or self.types[self.index] == OR_CODE:
+            oper = self.value()
+            left = strct1c.PreprocExprBinary(left, self.parse_preproc_unary(), oper)
+        return left
+
+    def parse_preproc_unary(self):
+        code = self.types[self.index]
+        if code == NOT_CODE:
+            self.index += 1
+            return strct1c.PreprocExprNot(self.parse_preproc_unary())
+        if code == LPAREN_CODE:
+            # как и в p_preproc_expr_rb, в структуру попадает значение токена "(", а не выражение в скобках
+            value = self.value()
+            self.parse_preproc_expr()
+            self.expect(RPAREN_CODE)
+            return strct1c.PreprocExpr(value, True)
+        return strct1c.PreprocExpr(self.id_value(), False)
+
+    ## property & expression
+
+    def parse_property(self):
+        element = self.parse_prop_element()
+        if self.types[self.index] != DOT_CODE:
+            return element
+        property_dotted = strct1c.DottedExpression(element)
+        while self.types[self.index] == DOT_CODE:
+            self.index += 1
+            property_dotted.append(self.parse_prop_element())
+        return property_dotted
+
+    def parse_prop_element(self):
+        types = self.types
+        name = self.id_value()
+        if types[self.index] == LPAREN_CODE:
+            self.index += 1
+            element = strct1c.FuncCall(name, self.parse_params_list())
+            self.expect(RPAREN_CODE)
+        else:
+            element = strct1c.Identifier(name)
+        if types[self.index] == LSB_CODE:
+            self.index += 1
+            element = strct1c.PropertyIndexed(element, self.parse_expr())
+            self.expect(RSB_CODE)
+            while types[self.index] == LSB_CODE:
+                self.index += 1
+                element.apnd(self.parse_expr())
+                self.expect(RSB_CODE)
+        return element
+
+    def parse_params_list(self):
+        # пропущенный параметр - strct1c.Empty: Ф(), Ф(, 1), Ф(1, )
+        types = self.types
+        result = []
+        while True:
+            code = types[self.index]
+            if code == COMMA_CODE or code == RPAREN_CODE:
+                result.append(strct1c.Empty())
+            else:
+                result.append(self.parse_expr())
+            if types[self.index] != COMMA_CODE:
+                return result
+            self.index += 1
+
+    def parse_expr(self, min_level=1):
+        types = self.types
+        left = self.parse_unary()
+        while True:
+            level = BINARY_LEVELS.get(types[self.index])
+            if level is None or level < min_level:
+                return left
+            oper = self.value()
+            if isinstance(left, strct1c.BinaryExpr) and left.oper == oper:
+                # цепочка той же операции - как в parser1c.p_expr_binary()
+                left.append(self.parse_expr(level + 1))
+            else:
+                left = strct1c.BinaryExpr(left, self.parse_expr(level + 1), oper)
+
+    def parse_unary(self):
+        # унарные операции связывают сильнее любой бинарной операции
+        if self.types[self.index] in UNARY_CODES:
+            op = self.value()
+            return strct1c.UnaryExpr(op, self.parse_unary())
+        return self.parse_primary()
+
+    def parse_primary(self):
+        types = self.types
+        code = types[self.index]
+        if code == ID_CODE:
+            return self.parse_property()
+        if code == STRING_CODE:
+            strings = strct1c.Strings(self.value())
+            while types[self.index] == STRING_CODE:
+                strings.apnd(self.value())
+            return strings
+        if code == NUMBER_CODE:
+            return strct1c.Number(self.value())
+        if code == TRUE_CODE or code == FALSE_CODE:
+            return strct1c.Bool(self.value())
+        if code == UNDEFINED_CODE:
+            self.index += 1
+            return strct1c.Undefined()
+        if code == DATE_CODE:
+            return strct1c.Date(self.value())
+        if code == LPAREN_CODE:
+            self.index += 1
+            expr = self.parse_expr()
+            self.expect(RPAREN_CODE)
+            return strct1c.GroupedExpr(expr)
+        if code == QSTN_CODE:
+            self.index += 1
+            self.expect(LPAREN_CODE)
+            expr = self.parse_expr()
+            self.expect(COMMA_CODE)
+            first = self.parse_expr()
+            self.expect(COMMA_CODE)
+            second = self.parse_expr()
+            self.expect(RPAREN_CODE)
+            return strct1c.QuestionExpr(expr, first, second)
+        if code == NEW_CODE:
+            return self.parse_new()
+        self.error()
+
+    def parse_new(self):
+        types = self.types
+        self.index += 1
+        if types[self.index] == ID_CODE:
+            id = self.id_value()
+            if types[self.index] != LPAREN_CODE:
+                return strct1c.NewExpr(id=id)
+            self.index += 1
+            param_list = self.parse_params_list()
+            self.expect(RPAREN_CODE)
+            return strct1c.NewExpr(id=id, param_list=param_list)
+        self.expect(LPAREN_CODE)
+        param_list = [self.parse_expr()]
+        while types[self.index] == COMMA_CODE:
+            self.index += 1
+            param_list.append(self.parse_expr())
+        self.expect(RPAREN_CODE)
+        return strct1c.NewExpr(param_list=param_list)
+
+# Разбор операторов по первому токену (кроме присваивания и вызова процедуры, см. Parser.parse_statement())
+STATEMENT_PARSERS = {
+    IF_CODE: Parser.parse_if,
+    FOR_EACH_CODE: Parser.parse_for_each,
+    FOR_CODE: Parser.parse_for,
+    WHILE_CODE: Parser.parse_while,
+    TRY_CODE: Parser.parse_try,
+    LABEL_CODE: Parser.parse_labeled,
+    CONTINUE_CODE: Parser.parse_jump,
+    BREAK_CODE: Parser.parse_jump,
+    RETURN_CODE: Parser.parse_jump_expr,
+    RAISE_CODE: Parser.parse_jump_expr,
+    GOTO_CODE: Parser.parse_goto,
+    DEF_IF_CODE: Parser.parse_preproc_if,
+}
+
+def parse_tokens(buffer, start=0, stop=None, positions=None):
+    '''
+    Выполняет синтаксический разбор токенов из буфера лексера рекурсивным спуском.
+    @param buffer (lexer1c.TokenBuffer): токены модуля (см. lexer1c.tokenize())
+    @param start, stop (int): диапазон токенов для разбора, по умолчанию - все токены
+    @param positions (parser1c.SourcePositions): таблица, в которую записываются позиции операторов
+                                                 и процедур/функций, None - позиции не записываются
+    @return (strct1c.Module): структура модуля, такая же, как у parser1c
+    @raise ParserError: синтаксическая ошибка
+    '''
+    return Parser(buffer, start, stop, positions).parse_module()
+
+def iter_tokens(buffer, start=0, stop=None, collect=True):
+    '''
+    Выполняет синтаксический разбор токенов из буфера лексера рекурсивным спуском с выдачей процедур и функций
+    по мере разбора, см. Parser.iter_module().
+    @return (generator): процедуры и функции (strct1c.Function), значение StopIteration - структура модуля
+    @raise ParserError: синтаксическая ошибка (при получении очередной процедуры/функции)
+    '''
+    return Parser(buffer, start, stop).iter_module(collect)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# scanner1c.py
+#
+# single-regex scanner for a 1C:Enterprise embedded language "1C",
+# an alternative backend to the ply lexer of lexer1c
+# ------------------------------------------------------------
+from epfcomp import lexer1c
+from epfcomp import names1c
+import ply.lex as lex
+import re
+
+# Правила-функции lexer1c, поведение которых воспроизводит сканер (по состояниям лексера)
+HANDLED_FUNCTION_RULES = {
+    'INITIAL': {'preprocessor', 'FOR_EACH', 'ID', 'NUMBER', 'comment', 'newline', 'compstring'},
+    'compstring': {'next_block_type', 'quotes', 'newline', 'newline_withcomment'},
+}
+
+def get_state_rules(state):
+    '''
+    Собирает правила состояния лексера lexer1c в том порядке, в котором их пробует ply:
+    сначала правила-функции в порядке определения, затем правила-строки по убыванию длины выражения.
+    @param state (str): состояние лексера: INITIAL, compstring
+    @return (list): список (имя правила, регулярное выражение, функция-правило или None)
+    '''
+    state_names = {name for name, _ in lexer1c.states}
+    func_rules = []
+    str_rules = []
+    for name, value in vars(lexer1c).items():
+        if not name.startswith('t_'):
+            continue
+        # разбор имени правила как в ply: t_<состояние>_..._<токен>
+        parts = name.split('_')
+        for index, part in enumerate(parts[1:], 1):
+            if part not in state_names and part != 'ANY':
+                break
+        rule_states = tuple(parts[1:index]) if index > 1 else ('INITIAL',)
+        rule_name = '_'.join(parts[index:])
+        if state not in rule_states or rule_name in ('ignore', 'error', 'eof'):
+            continue
+        if callable(value):
+            func_rules.append((rule_name, value.__doc__, value))
+        else:
+            str_rules.append((rule_name, value, None))
+    func_rules.sort(key=lambda rule: rule[2].__code__.co_firstlineno)
+    str_rules.sort(key=lambda rule: len(rule[1]), reverse=True)
+
+    unknown = {rule[0] for rule in func_rules} - HANDLED_FUNCTION_RULES[state]
+    if unknown:
+        raise RuntimeError('scanner1c: не поддерживаются правила лексера состояния %s: %s' % (state, ', '.join(sorted(unknown))))
+    return func_rules + str_rules
+
+def build_string_re():
+    '''
+    Строит общее регулярное выражение состояния compstring: правила в порядке ply (именованные группы
+    по имени правила) и ошибочный символ - любой символ, не подошедший ни к одному правилу.
+    '''
+    groups = ['(?P<%s>%s)' % (name, regex) for name, regex, _ in get_state_rules('compstring')]
+    groups.append(r'(?P<error>[\s\S])')
+    return re.compile('|'.join(groups), re.I)
+
+def build_token_re():
+    '''
+    Строит общее регулярное выражение состояния INITIAL. Игнорируемые символы (t_ignore) и переводы строк
+    (t_newline) пропускаются префиксом выражения, поэтому каждый токен разбирается одним сопоставлением:
+    затем идут правила в порядке ply (именованные группы по имени правила) и ошибочный символ.
+    Ни одно из правил не начинается с пропускаемого символа, поэтому префикс не меняет выбор правила.
+    '''
+    skip = re.escape(lexer1c.t_ignore + '\n')
+    groups = []
+    for name, regex, _ in get_state_rules('INITIAL'):
+        if name == 'newline':
+            if regex != r'\n+':
+                raise RuntimeError('scanner1c: не поддерживается правило t_newline: ' + regex)
+            continue
+        groups.append('(?P<%s>%s)' % (name, regex))
+    groups.append('(?P<error>[^%s])' % skip)
+    return re.compile('[%s]*(?:%s)' % (skip, '|'.join(groups)), re.I)
+
+TOKEN_RE = build_token_re()
+STRING_RE = build_string_re()
+
+# Коды типов токенов для правил-строк, зарезервированных слов и инструкций областей
+RULE_CODES = {name: lexer1c.TOKEN_CODES[name] for name, _, func in get_state_rules('INITIAL') if func is None}
+KEYWORD_CODES = {word: lexer1c.TOKEN_CODES[name] for word, name in list(lexer1c.reserved.items()) + list(lexer1c.areas.items())}
+ID_CODE = lexer1c.TOKEN_CODES['ID']
+DOT_CODE = lexer1c.TOKEN_CODES['DOT']
+NUMBER_CODE = lexer1c.TOKEN_CODES['NUMBER']
+FOR_EACH_CODE = lexer1c.TOKEN_CODES['FOR_EACH']
+FOR_EACH_VALUE = 'Для Каждого'
+UNKNOWN_DIRECTIVE_CODE = lexer1c.TOKEN_CODES[lexer1c.UNKNOWN_DIRECTIVE]
+
+def print_error(message, data, pos, lineno):
+    # сообщение в том же виде, что выводят t_error и t_compstring_error лексера ply
+    tok = lex.LexToken()
+    tok.type = 'error'
+    tok.value = data[pos:]
+    tok.lineno = lineno
+    tok.lexpos = pos
+    print(message % str(tok))
+
+def scan_string(data, pos, lineno):
+    '''
+    Разбирает строковый литерал так же, как t_compstring и правила состояния compstring:
+    удвоенные кавычки заменяются одной, продолжение строки "|" - переводом строки,
+    строки комментариев внутри литерала пропускаются.
+    @param data (str): текст модуля
+    @param pos (int): позиция после открывающей кавычки
+    @param lineno (int): текущий номер строки
+    @return (tuple): значение литерала, позиция после закрывающей кавычки, номер строки
+    '''
+    match = STRING_RE.match
+    length = len(data)
+    parts = []
+    while True:
+        if pos >= length:
+            # как lexer.next() в t_compstring при незакрытой строке в конце текста
+            raise StopIteration
+        m = match(data, pos)
+        kind = m.lastgroup
+        end = m.end()
+        if kind == 'next_block_type':
+            parts.append(m.group())
+            pos = end
+            closed = False
+            while data[pos] == '"':
+                if data[pos + 1] == '"':
+                    pos += 2
+                    parts.append('"')
+                else:
+                    pos += 1
+                    closed = True
+                    break
+            if closed:
+                break
+        elif kind == 'quotes':
+            if end == length or data[end] != '"':
+                pos = end
+                break
+            pos = end + 1
+            parts.append('"')
+        elif kind == 'newline':
+            lineno += data.count('\n', pos, end)
+            parts.append('\n')
+            pos = end
+        elif kind == 'newline_withcomment':
+            lineno += data.count('\n', pos, end)
+            pos = end
+        else:
+            print_error("== string state processing error: %s", data, pos, lineno)
+            pos += 1
+    return ''.join(parts), pos, lineno
+
+def tokenize(data):
+    '''
+    Выполняет лексический разбор текста модуля в колоночный буфер токенов.
+    Поток токенов совпадает с потоком лексера ply (lexer1c.tokenize()), включая номера строк
+    и сообщения об ошибках.
+    @param data (str): текст модуля
+    @return (lexer1c.TokenBuffer): токены модуля
+    '''
+    buffer = lexer1c.TokenBuffer(data)
+    types = buffer.types
+    add_type = types.append
+    add_start = buffer.starts.append
+    add_end = buffer.ends.append
+    add_line = buffer.lines.append
+    values = buffer.values
+    match = TOKEN_RE.match
+    rule_codes = RULE_CODES
+    keyword_codes = KEYWORD_CODES
+    fold = names1c.fold
+    folded_lookup = names1c.get_folded_lookup()
+    pos = 0
+    lineno = 1
+    while True:
+        m = match(data, pos)
+        if m is None:
+            # до конца текста остались только пропускаемые символы
+            break
+        kind = m.lastgroup
+        start = m.start(kind)
+        if start != pos:
+            lineno += data.count('\n', pos, start)
+        end = m.end()
+        code = rule_codes.get(kind)
+        if code is None:
+            if kind == 'ID':
+                value = m.group(kind)
+                code = keyword_codes.get(folded_lookup(value) or fold(value), ID_CODE)
+                if code != ID_CODE and types and types[-1] == DOT_CODE:
+                    # зарезервированное слово после точки - имя свойства или метода (см. lexer1c.t_ID)
+                    code = ID_CODE
+            elif kind == 'comment':
+                pos = end
+                continue
+            elif kind == 'compstring':
+                value, end, end_lineno = scan_string(data, end, lineno)
+                values[len(buffer.types)] = value
+                add_type(lexer1c.STRING_CODE)
+                add_start(start)
+                add_end(end)
+                add_line(lineno)
+                pos = end
+                lineno = end_lineno
+                continue
+            elif kind == 'FOR_EACH':
+                code = FOR_EACH_CODE
+                if m.group(kind) != FOR_EACH_VALUE:
+                    values[len(buffer.types)] = FOR_EACH_VALUE
+            elif kind == 'NUMBER':
+                code = NUMBER_CODE
+            elif kind == 'preprocessor':
+                code = keyword_codes.get(fold(m.group(kind)), UNKNOWN_DIRECTIVE_CODE)
+            else:
+                print_error("== Illegal character: %s", data, start, lineno)
+                pos = start + 1
+                continue
+        add_type(code)
+        add_start(start)
+        add_end(end)
+        add_line(lineno)
+        pos = end
+    return buffer
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
+from epfcomp import names1c
+import copy
 import re
 
 # Localization
+# имя функции НСтр в обоих вариантах синтаксиса
+NSTR = {names1c.fold('НСтр'), names1c.fold('NStr')}
+
 __gl_str_loc = None
 def set_str_locale(loc):
     global __gl_str_loc
@@ -15,7 +20,7 @@ def localize(loc):
     for child, parent in __gl_owners.items():
         if not isinstance(child, Strings):
             continue
-        if isinstance(parent, FuncCall) and parent.name.lower() == 'нстр':
+        if isinstance(parent, FuncCall) and names1c.fold(parent.name) in NSTR:
             nstr_owner = get_owner(parent)
             nstr_owner.replace_obj(parent, child)
             to_delete.add(parent)
@@ -82,6 +87,21 @@ def del_owner_link(subject):
     global __gl_owners
     del __gl_owners[subject]
 
+def del_owner_links(subject):
+    '''
+    Удаляет ссылки на владельцев узла и всех вложенных в него узлов. Словарь владельцев удерживает узлы в памяти,
+    поэтому ссылки удаляются у больше не используемых узлов (см. parser1c.Parser1C.parse_stream()).
+    @param subject: узел или список узлов
+    '''
+    stack = [subject]
+    while stack:
+        subject = stack.pop()
+        if isinstance(subject, list):
+            stack.extend(subject)
+        elif hasattr(subject, '__dict__'):
+            __gl_owners.pop(subject, None)
+            stack.extend(vars(subject).values())
+
 def set_owner(subject, owner, recursive = False):
     if not subject or isinstance(subject, str) or isinstance(subject, int):
         return
@@ -168,7 +188,8 @@ class Function:
     directive = None
     name = None
     vars_list = None
-    body = None
+    # Источник тела для отложенного разбора (см. parser1c.Parser1C.parse_skeleton()), None - тело уже разобрано
+    body_source = None
     def __init__(self, is_function, is_export, directive, name, vars_list, body):
         self.is_function = is_function
         self.is_export = is_export
@@ -177,6 +198,26 @@ class Function:
         self.vars_list = vars_list
         self.body = body
         self.set_owner()
+    @property
+    def body(self):
+        if self.body_source is not None:
+            # тело разбирается при первом обращении
+            self.body = self.body_source.parse_body()
+            set_owner(self.__dict__['body'], self)
+        return self.__dict__['body']
+    @body.setter
+    def body(self, body):
+        self.__dict__.pop('body_source', None)
+        self.__dict__['body'] = body
+    def __deepcopy__(self, memo):
+        # копия получает разобранное тело со всеми изменениями, внесенными в него до копирования;
+        # в pickle тело с отложенным разбором сохраняется неразобранным (источник тела - токены)
+        self.body
+        result = Function.__new__(Function)
+        memo[id(self)] = result
+        for key, value in self.__dict__.items():
+            result.__dict__[key] = copy.deepcopy(value, memo)
+        return result
     def set_owner(self, recursive = False):
         set_owner(self.vars_list, self, recursive)
         set_owner(self.body, self, recursive)
@@ -539,7 +580,7 @@ class DottedExpression:
             # полный путь обращения к идентификатору
             id_text = ""
             for prop_element in self.properties_list:
-                if isinstance(prop_element, Identifier) and prop_element.id.lower() in filter:
+                if isinstance(prop_element, Identifier) and names1c.fold(prop_element.id) in filter:
                     id_was_found = True
                 if id_text:
                     id_text += "."
@@ -642,7 +683,7 @@ class Identifier:
         pass
     def get_tokens_list(self, obj_type, filter = set()):
         result = []
-        if obj_type == "id" and filter and self.id.lower() in filter:
+        if obj_type == "id" and filter and names1c.fold(self.id) in filter:
             result = [(self, self.id)]
         return result
     def get_text(self):
@@ -676,26 +717,29 @@ class GroupedExpr(Expr):
 
 
 class BinaryExpr(Expr):
-    expr1 = None
-    expr2 = None
+    # Цепочка операций с одинаковым написанием (А + Б + В) хранится одним узлом: exprs - операнды
+    # в порядке записи, операции левоассоциативны. Глубина дерева не растет с длиной цепочки.
+    exprs = None
     oper  = None
     def __init__(self, expr1, expr2, oper):
-        self.expr1 = expr1
-        self.expr2 = expr2
+        self.exprs = [expr1, expr2]
         self.oper = oper
         self.set_owner()
+    def append(self, expr):
+        # добавляет правый операнд в конец цепочки: (А + Б) + В
+        self.exprs.append(expr)
+        set_owner(expr, self)
     def set_owner(self, recursive = False):
-        set_owner(self.expr1, self, recursive)
-        set_owner(self.expr2, self, recursive)
+        set_owner(self.exprs, self, recursive)
     def replace_obj(self, obj_from, obj_to):
-        if self.expr1 == obj_from:
-            self.expr1 = obj_to
-        if self.expr2 == obj_from:
-            self.expr2 = obj_to
+        replace_object(self.exprs, obj_from, obj_to)
     def get_tokens_list(self, obj_type, filter = set()):
-        return self.expr1.get_tokens_list(obj_type, filter) + self.expr2.get_tokens_list(obj_type, filter)
+        tokens_list = []
+        for expr in self.exprs:
+            tokens_list += expr.get_tokens_list(obj_type, filter)
+        return tokens_list
     def get_text(self):
-        return self.expr1.get_text() + " " + self.oper + " " + self.expr2.get_text()
+        return (" " + self.oper + " ").join([expr.get_text() for expr in self.exprs])
 
 
 class QuestionExpr(Expr):
@@ -933,16 +977,9 @@ class Strings (SimpleType):
     def get_text(self):
         return self.format_1c_str(self.value[0])
     def format_1c_str(self, origin_text):
-        text = '"'
-        for ch in origin_text:
-            if ch == '"':
-                text += '""'
-            elif ch == '\n':
-                text += ch + get_indent_spaces() + "|"
-            else:
-                text += ch
-        text += '"'
-        return text
+        # кавычки удваиваются, каждая следующая строка литерала начинается с отступа и "|"
+        text = origin_text.replace('"', '""').replace('\n', '\n' + get_indent_spaces() + "|")
+        return '"' + text + '"'
 
 class Undefined (SimpleType):
     def __init__(self):
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# tests1c.py
+#
+# tests for the 1C front end: lexer and parser backends, preprocessor
+#
+# texts for the backend parity tests are built by bench1c, the benchmarks run these tests
+#
+#   python -m epfcomp.tests1c [test ...]
+# ------------------------------------------------------------
+import argparse
+import sys
+import traceback
+
+## lexer
+
+# Модуль на русском синтаксисе с именами свойств и методов, совпадающими с зарезервированными словами
+MEMBER_NAMES_MODULE = '''Процедура П()
+    Сообщение.To = 1;
+    А = Б.New(В.Do, Г.
+        Если);
+    Для Каждого Стр Из Т.In Цикл
+        Д.EndDo();
+    КонецЦикла;
+КонецПроцедуры
+'''
+
+def token_types(buffer):
+    return [buffer.type(index) for index in range(len(buffer))]
+
+def test_member_names_after_dot():
+    '''
+    Слово после точки - идентификатор в обоих лексерах, модуль разбирается обоими синтаксическими процессорами.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import rdparser1c
+    from epfcomp import scanner1c
+    from epfcomp import strct1c
+    for buffer in (scanner1c.tokenize(MEMBER_NAMES_MODULE), lexer1c.tokenize(MEMBER_NAMES_MODULE, lexer1c.new_lexer())):
+        types = token_types(buffer)
+        for index, token_type in enumerate(types):
+            if index and types[index - 1] == 'DOT':
+                assert token_type == 'ID', buffer.value(index)
+        text = strct1c.get_text(rdparser1c.parse_tokens(buffer))
+        assert 'Сообщение.To = 1;' in text and 'Б.New(В.Do, Г.Если)' in text and 'Д.EndDo();' in text
+        assert ply_parse_text(buffer) == text
+
+def test_keywords_outside_member_names():
+    '''
+    Зарезервированные слова обоих вариантов синтаксиса вне имен после точки остаются ключевыми словами.
+    '''
+    from epfcomp import lexer1c
+    buffer = lexer1c.tokenize('If А Then Б = New Массив; EndIf; Если В Тогда КонецЕсли;')
+    assert token_types(buffer) == ['IF', 'ID', 'THEN', 'ID', 'EQ', 'NEW', 'ID', 'SEMI', 'END_IF', 'SEMI',
+                                   'IF', 'ID', 'THEN', 'END_IF', 'SEMI']
+
+def test_relex_member_names():
+    '''
+    Инкрементальный разбор учитывает точку в измененной строке перед зарезервированным словом следующей строки.
+    '''
+    from epfcomp import lexer1c
+    prev_data = 'А = Б;\nНовый Массив;\n'
+    data = 'А = Б.\nНовый Массив;\n'
+    buffer = lexer1c.relex(lexer1c.tokenize(prev_data), data, 1, 1)
+    assert token_types(buffer) == token_types(lexer1c.tokenize(data)) == ['ID', 'EQ', 'ID', 'DOT', 'ID', 'ID', 'SEMI']
+
+# Модуль, в котором комментарий заканчивается точкой перед строкой с зарезервированным словом
+COMMENT_DOT_MODULE = '''Процедура П()
+    // Проверяем заполнение.
+    Если Истина Тогда
+        А = 1; // Конец оператора.
+    КонецЕсли;
+КонецПроцедуры
+'''
+
+def test_keywords_after_comment_dot():
+    '''
+    Точка в конце комментария не делает зарезервированное слово следующей строки идентификатором:
+    учитывается предыдущий токен, а не предыдущий символ текста.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import rdparser1c
+    from epfcomp import scanner1c
+    from epfcomp import strct1c
+    for buffer in (scanner1c.tokenize(COMMENT_DOT_MODULE), lexer1c.tokenize(COMMENT_DOT_MODULE, lexer1c.new_lexer()),
+                   lexer1c.relex(lexer1c.tokenize(COMMENT_DOT_MODULE.replace('заполнение.', 'заполнение')),
+                                 COMMENT_DOT_MODULE, 2, 2)):
+        types = token_types(buffer)
+        assert types[4:7] == ['IF', 'TRUE', 'THEN'] and 'END_IF' in types and 'DOT' not in types, types
+        text = strct1c.get_text(rdparser1c.parse_tokens(buffer))
+        assert ply_parse_text(buffer) == text and 'КонецЕсли;' in text
+
+def test_member_name_after_line_break():
+    '''
+    Слово на следующей строке после точки (в том числе после комментария) - имя свойства или метода.
+    '''
+    from epfcomp import lexer1c
+    from epfcomp import scanner1c
+    data = 'А = Б.\nЕсли;\nВ = Г. // свойство\n    Новый;\n'
+    expected = ['ID', 'EQ', 'ID', 'DOT', 'ID', 'SEMI', 'ID', 'EQ', 'ID', 'DOT', 'ID', 'SEMI']
+    assert token_types(scanner1c.tokenize(data)) == expected
+    assert token_types(lexer1c.tokenize(data, lexer1c.new_lexer())) == expected
+    assert token_types(lexer1c.relex(lexer1c.tokenize('А = Б.\nЕсли;\n'), data, 3, 4)) == expected
+
+def get_scanner_texts():
+    '''
+    @return (list): тексты для сравнения scanner1c и лексера ply: samples/, граничные случаи и правки тестового модуля
+    '''
+    from epfcomp import bench1c
+    result = bench1c.get_sample_texts() + bench1c.SCANNER_EDGE_CASES
+    module = bench1c.make_module(5)
+    for line, count, new_lines in bench1c.RELEX_EDITS:
+        result.append(bench1c.edit_lines(module, line, line + count - 1, new_lines)[0])
+    return result
+
+def test_scanner_matches_ply():
+    '''
+    Потоки токенов scanner1c и лексера ply совпадают: токены, номера строк, сообщения об ошибках, исключения.
+    '''
+    from epfcomp import bench1c
+    from epfcomp import lexer1c
+    from epfcomp import scanner1c
+
+    def ply_tokenize(data):
+        return lexer1c.tokenize(data, lexer1c.new_lexer())
+
+    for text in get_scanner_texts():
+        assert bench1c.lexer_outcome(scanner1c.tokenize, text) == bench1c.lexer_outcome(ply_tokenize, text), \
+            'scanner1c: поток токенов отличается от ply:\n' + text
+
+## parser
+
+def get_parser_buffers():
+    '''
+    @return (list): токены модулей для сравнения rdparser1c и ply: samples/, граничные случаи и тестовые модули
+                    после препроцессора
+    '''
+    import contextlib
+    import io
+    from epfcomp import bench1c
+    from epfcomp import frontend1c
+    from epfcomp import lexer1c
+    result = []
+    texts = bench1c.get_sample_texts() + bench1c.SCANNER_EDGE_CASES + [bench1c.make_module(5),
+                                                                      bench1c.make_statements_module(100)]
+    for text in texts:
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                result.append(lexer1c.tokenize(text))
+            except Exception:
+                # ошибка лексического разбора (см. bench1c.SCANNER_EDGE_CASES) - разбирать нечего
+                pass
+    data = bench1c.make_preproc_module(30)
+    for mode, areas_to_delete, symbols_to_retain in bench1c.FRONTEND_MODES:
+        result.append(frontend1c.tokenize(data, mode, areas_to_delete, symbols_to_retain))
+    return result
+
+def test_rdparser_matches_ply():
+    '''
+    Текст модулей по структуре разбора рекурсивным спуском (rdparser1c) и LALR-разбором ply совпадает,
+    как и вывод и исключения при разборе.
+    '''
+    from epfcomp import bench1c
+    for buffer in get_parser_buffers():
+        assert bench1c.parser_outcome('rd', buffer) == bench1c.parser_outcome('lalr', buffer), \
+            'rdparser1c: текст модуля отличается от ply:\n' + buffer.data
+
+
+def ply_parse_text(buffer):
+    # текст модуля, разобранного ply
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+    return strct1c.get_text(parser1c.new_parser().lr_parser.parse(lexer=buffer.reader()))
+
+# Модуль для разбора без тел процедур и функций
+SKELETON_MODULE = '''Перем Счетчик;
+Процедура Первая(А, Б = 1) Экспорт
+    Счетчик = Вторая(А) + Б;
+КонецПроцедуры
+Функция Вторая(В)
+    Возврат В * 2;
+КонецФункции
+'''
+
+def test_skeleton_pickle_keeps_bodies_unparsed():
+    '''
+    pickle сохраняет тела с отложенным разбором неразобранными, после загрузки тела разбираются при обращении.
+    '''
+    import pickle
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+    buffer = lexer1c.tokenize(SKELETON_MODULE)
+    module = parser1c.new_parser().parse_skeleton(buffer)
+    loaded = pickle.loads(pickle.dumps(module))
+    assert all(function.body_source is not None for function in module.proc_funcs_list)
+    assert all(function.body_source is not None for function in loaded.proc_funcs_list)
+    assert strct1c.get_text(loaded) == strct1c.get_text(parser1c.new_parser().parse_tokens(buffer))
+    function = loaded.proc_funcs_list[0]
+    assert strct1c.get_owner(function.body) is function
+
+def test_bodies_parsed_by_module_parser():
+    '''
+    Тела с отложенным разбором разбираются синтаксическим процессором, разобравшим заголовки модуля:
+    тела модулей двух процессоров разбираются одновременно в двух потоках.
+    '''
+    import threading
+    from epfcomp import bench1c
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    from epfcomp import strct1c
+    buffer = lexer1c.tokenize(bench1c.make_module(200))
+    expected = strct1c.get_text(parser1c.new_parser().parse_tokens(buffer))
+    # процессоры с профилированием разбирают LALR-разбором ply и считают разобранные ими модули и тела
+    parsers = [parser1c.new_profiling_parser() for _ in range(2)]
+    modules = [parser.parse_skeleton(buffer) for parser in parsers]
+    lazy_bodies = [sum(function.body_source is not None for function in module.proc_funcs_list) for module in modules]
+    errors = []
+
+    def force_bodies(module):
+        try:
+            for function in module.proc_funcs_list:
+                function.body
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=force_bodies, args=(module,)) for module in modules]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    for parser, module, count in zip(parsers, modules, lazy_bodies):
+        assert count and parser.profile.modules == 1 + count, (count, parser.profile.modules)
+        assert strct1c.get_text(module) == expected
+
+def test_body_error_names_module():
+    '''
+    Ошибка разбора тела с отложенным разбором содержит имя модуля.
+    '''
+    import contextlib
+    import io
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    buffer = lexer1c.tokenize('Процедура П()\n    А = (\nКонецПроцедуры\n')
+    module = parser1c.new_parser().parse_skeleton(buffer, module_name='Тест')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.proc_funcs_list[0].body
+    except Exception as e:
+        assert str(e).startswith('Ошибка при разборе модуля : Тест'), str(e)
+    else:
+        assert False, 'ошибка разбора тела не выдана'
+
+def test_recovered_body_error_names_module():
+    '''
+    Ошибка в теле, после которой ply восстанавливает разбор, выдается при обращении к телу с именем модуля,
+    а не телом без операторов.
+    '''
+    import contextlib
+    import io
+    from epfcomp import lexer1c
+    from epfcomp import parser1c
+    data = 'Процедура П()\n    А = 1;\n    Б = ;\n    В = 2;\nКонецПроцедуры\n\nПроцедура Р()\n    Г = 3;\nКонецПроцедуры\n'
+    module = parser1c.new_parser().parse_skeleton(lexer1c.tokenize(data), module_name='Тест')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.proc_funcs_list[0].body
+    except Exception as e:
+        assert str(e).startswith('Ошибка при разборе модуля : Тест'), str(e)
+    else:
+        assert False, 'ошибка разбора тела не выдана'
+    assert len(module.proc_funcs_list[1].body.statements) == 1
+
+## preprocessor
+
+def test_retained_symbols_in_both_languages():
+    '''
+    Условия из сохраняемых символов сохраняются "как есть" независимо от языка имен символов.
+    '''
+    from epfcomp import frontend1c
+    from epfcomp import lexer1c
+    body = 'Процедура П()\nКонецПроцедуры\n'
+    for condition in ('НаКлиенте', 'AtClient', 'НЕ Сервер', 'Not Server', 'AtClient Or НаКлиенте'):
+        data = '#If %s Then\n%s#EndIf\n' % (condition, body)
+        buffer = frontend1c.tokenize(data, 'ТолстыйКлиентОбычноеПриложение', [], ['НаКлиенте', 'Сервер'])
+        types = token_types(buffer)
+        assert types[0] == 'DEF_IF' and types[-2:] == ['DEF_END_IF', 'SEMI'], condition
+    buffer = frontend1c.tokenize('#If ThinClient Then\n' + body + '#EndIf\n', 'ТонкийКлиент', [], ['НаКлиенте'])
+    assert token_types(buffer) == token_types(lexer1c.tokenize(body))
+
+## runner
+
+def get_tests():
+    '''
+    @return (dict): тесты модуля по именам (без префикса test_) в порядке определения
+    '''
+    return {name[5:]: func for name, func in globals().items() if name.startswith('test_') and callable(func)}
+
+if __name__ == '__main__':
+    tests = get_tests()
+    arg_parser = argparse.ArgumentParser(description='Тесты разбора модулей 1С')
+    arg_parser.add_argument('test', nargs='*', help='тесты для запуска: ' + ', '.join(tests))
+    args = arg_parser.parse_args()
+    for name in args.test:
+        if name not in tests:
+            arg_parser.error('неизвестный тест: ' + name)
+    failed = 0
+    for name in args.test or tests:
+        try:
+            tests[name]()
+            print('ok    ', name)
+        except Exception:
+            failed += 1
+            print('FAIL  ', name)
+            traceback.print_exc()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------
+# tokcache1c.py
+#
+# on-disk cache of lexer1c token buffers
+# ------------------------------------------------------------
+from epfcomp import lexer1c
+import hashlib
+import marshal
+import os
+import sys
+import threading
+
+# Версия формата файлов кеша
+TOKEN_CACHE_FORMAT = 1
+
+class TokenCache:
+    '''
+    Дисковый кеш токенов модулей 1С. Ключ записи - хеш текста модуля и версии лексера (lexer1c.LEXER_VERSION),
+    поэтому неизмененные модули не разбираются лексером повторно, а при изменении правил лексера
+    записи кеша перестают находиться.
+    Запись хранит колонки lexer1c.TokenBuffer как есть (байты массивов) и словарь значений токенов,
+    отличных от среза текста, в формате marshal.
+    Записи одного модуля хранятся в отдельном каталоге, при записи новой версии модуля прежние удаляются.
+    Если каталог кеша недоступен для записи, токены разбираются без кеша.
+    '''
+
+    # каталог с файлами кеша
+    folder = ""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.hits = 0
+        self.misses = 0
+        # False - запись в каталог кеша не удалась, новые записи не сохраняются
+        self.writable = True
+
+    def get_key(self, data):
+        '''
+        @param data (str): текст модуля
+        @return (str): ключ записи кеша для текста
+        '''
+        digest = hashlib.sha1(data.encode('utf-8'))
+        digest.update(('\n%s\n%d\n%s' % (lexer1c.LEXER_VERSION, TOKEN_CACHE_FORMAT, sys.byteorder)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get_module_folder(self, module_name):
+        '''
+        @param module_name (str): имя модуля (имя файла модуля в выгрузке)
+        @return (str): каталог записей модуля
+        '''
+        return os.path.join(self.folder, hashlib.sha1(module_name.encode('utf-8')).hexdigest()[:16])
+
+    def get_file_name(self, key, module_name):
+        return os.path.join(self.get_module_folder(module_name), key + '.tok')
+
+    def load(self, data, module_name):
+        '''
+        Загружает токены текста из кеша.
+        @param data (str): текст модуля
+        @param module_name (str): имя модуля (имя файла модуля в выгрузке)
+        @return (lexer1c.TokenBuffer): токены модуля, None - если в кеше нет записи для текста
+        '''
+        try:
+            with open(self.get_file_name(self.get_key(data), module_name), 'rb') as f:
+                version, types, starts, ends, lines, values = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != lexer1c.LEXER_VERSION:
+            return None
+        buffer = lexer1c.TokenBuffer(data)
+        buffer.types.frombytes(types)
+        buffer.starts.frombytes(starts)
+        buffer.ends.frombytes(ends)
+        buffer.lines.frombytes(lines)
+        buffer.values = values
+        return buffer
+
+    def save(self, buffer, module_name):
+        '''
+        Записывает токены модуля в кеш и удаляет прежние записи модуля.
+        Запись выполняется через временный файл, поэтому одновременная запись одного модуля из
+        нескольких потоков или процессов не оставляет поврежденных файлов.
+        При ошибке записи кеш переходит в режим только чтения (см. writable).
+        @param buffer (lexer1c.TokenBuffer): токены модуля
+        @param module_name (str): имя модуля (имя файла модуля в выгрузке)
+        @return (bool): запись сохранена
+        '''
+        if not self.writable:
+            return False
+        file_name = self.get_file_name(self.get_key(buffer.data), module_name)
+        tmp_file_name = '%s.%d.%d.tmp' % (file_name, os.getpid(), threading.get_ident())
+        try:
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            with open(tmp_file_name, 'wb') as f:
+                marshal.dump((lexer1c.LEXER_VERSION, buffer.types.tobytes(), buffer.starts.tobytes(),
+                              buffer.ends.tobytes(), buffer.lines.tobytes(), buffer.values), f)
+            os.replace(tmp_file_name, file_name)
+        except OSError:
+            self.writable = False
+            try:
+                os.remove(tmp_file_name)
+            except OSError:
+                pass
+            return False
+        self.prune(module_name, os.path.basename(file_name))
+        return True
+
+    def prune(self, module_name, keep_file_name):
+        '''
+        Удаляет записи модуля, кроме keep_file_name: записи прежних версий текста модуля больше не находятся.
+        @param module_name (str): имя модуля (имя файла модуля в выгрузке)
+        @param keep_file_name (str): имя файла сохраняемой записи (без каталога)
+        '''
+        module_folder = self.get_module_folder(module_name)
+        try:
+            file_names = os.listdir(module_folder)
+        except OSError:
+            return
+        for file_name in file_names:
+            if file_name != keep_file_name and file_name.endswith('.tok'):
+                try:
+                    os.remove(os.path.join(module_folder, file_name))
+                except OSError:
+                    pass
+
+    def tokenize(self, data, module_name):
+        '''
+        Возвращает токены текста модуля из кеша, при отсутствии записи выполняет лексический разбор
+        и сохраняет результат в кеш.
+        @param data (str): текст модуля
+        @param module_name (str): имя модуля (имя файла модуля в выгрузке)
+        @return (lexer1c.TokenBuffer): токены модуля
+        '''
+        buffer = self.load(data, module_name)
+        if buffer is not None:
+            self.hits += 1
+            return buffer
+        self.misses += 1
+        buffer = lexer1c.tokenize(data)
+        self.save(buffer, module_name)
+        return buffer
+
+def get_cache_folder(dump_folder):
+    '''
+    @param dump_folder (str): каталог с выгруженными текстами модулей
+    @return (str): каталог кеша токенов рядом с каталогом выгрузки: <каталог выгрузки>.tokens
+    '''
+    return os.path.normpath(os.path.abspath(dump_folder)) + '.tokens'
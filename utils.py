@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from epfcomp import names1c
 import os
 
 
@@ -50,9 +51,9 @@ def load_common_modules(dump_folder: str, build_params) -> dict:
         is_server = False
         is_client_server = False
 
-        if module_name.lower().find("клиентсервер") >= 0:
+        if names1c.fold(module_name).find("клиентсервер") >= 0:
             is_client_server = True
-        elif module_name.lower().find("клиент") >= 0:
+        elif names1c.fold(module_name).find("клиент") >= 0:
             is_client = True
         else:
             is_server = True